@@ -1,30 +1,188 @@
 # file: acoes.py
 
+# As ações executam apenas os efeitos colaterais da decisão e não alteram o
+# dicionário da solicitação. O status final correspondente a cada decisão está
+# em STATUS_POR_DECISAO e é aplicado pelo motor quando necessário.
+#
+# A regra de processamento pode retornar apenas o nome da ação ("APROVADO") ou
+# uma decisão estruturada com parâmetros, montada pela função "decisao":
+#     {"apply": ["decisao", "APROVADO", "limite", {"*": [{"var": "renda_mensal"}, 3]}]}
+#     -> {"acao": "APROVADO", "params": {"limite": 21000}}
+# Assim os parâmetros da ação são calculados na mesma avaliação da regra.
 
-def aprovar_solicitacao(dados):
-    print(f"AÇÃO EXECUTADA: Solicitação {dados['id']} APROVADA.")
-    dados["status_final"] = "Aprovado"
+import inspect
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+from lib.registry import FunctionRegistry
+
+
+class Decisao(NamedTuple):
+    """Decisão normalizada: o nome da ação e os seus parâmetros."""
+
+    acao: Any
+    params: Dict[str, Any]
+
+
+def montar_decisao(acao, *pares):
+    """
+    Monta uma decisão estruturada a partir do nome da ação e de pares chave/valor.
+
+    Usada pelas regras via {"apply": ["decisao", acao, chave1, valor1, ...]}, já
+    que um dicionário literal na regra seria interpretado como operação.
+    """
+    if len(pares) % 2:
+        raise ValueError("Os parâmetros da decisão devem ser pares chave/valor.")
+    return {"acao": acao, "params": dict(zip(pares[::2], pares[1::2]))}
+
+
+# Funções que o motor disponibiliza às regras
+FUNCOES_DECISAO = {"decisao": montar_decisao}
+
+
+def funcoes_com_decisao(funcoes):
+    """Acrescenta FUNCOES_DECISAO às funções das regras, sem sobrescrever as existentes."""
+    if isinstance(funcoes, FunctionRegistry):
+        if all(nome in funcoes for nome in FUNCOES_DECISAO):
+            return funcoes
+        # Uma cópia do registro: o do chamador não muda, e as políticas das
+        # funções continuam compartilhadas
+        copia = funcoes.copy()
+        for nome, funcao in FUNCOES_DECISAO.items():
+            copia.setdefault(nome, funcao)
+        return copia
+    return {**FUNCOES_DECISAO, **(funcoes or {})}
+
+
+def normalizar_decisao(resultado) -> Decisao:
+    """Converte o resultado da regra (nome da ação ou decisão estruturada) em Decisao."""
+    if isinstance(resultado, dict) and "acao" in resultado:
+        return Decisao(resultado["acao"], resultado.get("params") or {})
+    return Decisao(resultado, {})
+
+
+def _aceita_params(acao: Callable) -> bool:
+    """Indica se a ação recebe os parâmetros da decisão como segundo argumento."""
+    try:
+        parametros = inspect.signature(acao).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    posicionais = 0
+    for parametro in parametros:
+        if parametro.kind is parametro.VAR_POSITIONAL:
+            return True
+        if parametro.kind in (parametro.POSITIONAL_ONLY, parametro.POSITIONAL_OR_KEYWORD):
+            posicionais += 1
+    return posicionais >= 2
+
+
+class RegistroDeAcoes(dict):
+    """
+    Ações por nome de decisão, classificadas no momento do registro.
+
+    Cada ação é inspecionada uma única vez, quando registrada: se recebe os
+    parâmetros da decisão (acao(dados, params)) e se é assíncrona. O despacho
+    de uma decisão é apenas uma busca no dicionário, sem inspeção por chamada.
+    """
+
+    def __init__(self, acoes: Optional[Dict[str, Callable]] = None):
+        super().__init__()
+        self._com_params = set()
+        self._assincronas = set()
+        for nome, acao in (acoes or {}).items():
+            self[nome] = acao
+
+    def __setitem__(self, nome, acao):
+        if not callable(acao):
+            raise TypeError(f"A ação '{nome}' deve ser chamável.")
+        super().__setitem__(nome, acao)
+        for conjunto, incluir in (
+            (self._com_params, _aceita_params(acao)),
+            (self._assincronas, inspect.iscoroutinefunction(acao)),
+        ):
+            if incluir:
+                conjunto.add(nome)
+            else:
+                conjunto.discard(nome)
+
+    def __delitem__(self, nome):
+        super().__delitem__(nome)
+        self._com_params.discard(nome)
+        self._assincronas.discard(nome)
+
+    def pop(self, nome, *padrao):
+        self._com_params.discard(nome)
+        self._assincronas.discard(nome)
+        return super().pop(nome, *padrao)
+
+    def update(self, *args, **kwargs):
+        for nome, acao in dict(*args, **kwargs).items():
+            self[nome] = acao
+
+    def registrar(self, nome: str, acao: Optional[Callable] = None):
+        """
+        Registra a ação da decisão `nome`; sem `acao`, funciona como decorador:
+
+            @ACOES_DISPONIVEIS.registrar("BLOQUEADO")
+            def bloquear(dados, params): ...
+        """
+        if acao is None:
+            def decorador(funcao):
+                self[nome] = funcao
+                return funcao
+
+            return decorador
+        self[nome] = acao
+        return acao
+
+    def assincrona(self, nome: str) -> bool:
+        return nome in self._assincronas
+
+    def executar(self, nome, dados, params: Optional[Dict[str, Any]] = None):
+        """
+        Executa a ação da decisão `nome` e retorna o resultado da ação (uma
+        corrotina, se a ação for assíncrona).
+
+        As ações que recebem apenas `dados` ignoram os parâmetros.
+        """
+        acao = self.get(nome)
+        if acao is None:
+            print(f"Nenhuma ação definida para a decisão '{nome}'.")
+            return None
+        if nome in self._com_params:
+            return acao(dados, params or {})
+        return acao(dados)
+
+
+def aprovar_solicitacao(dados, params=None):
+    limite = (params or {}).get("limite")
+    detalhe = f" com limite {limite}" if limite is not None else ""
+    print(f"AÇÃO EXECUTADA: Solicitação {dados['id']} APROVADA{detalhe}.")
 
 
 def recusar_solicitacao(dados):
     print(f"AÇÃO EXECUTADA: Solicitação {dados['id']} RECUSADA.")
-    dados["status_final"] = "Recusado"
 
 
 def enviar_para_analise_manual(dados):
     print(f"AÇÃO EXECUTADA: Solicitação {dados['id']} enviada para ANÁLISE MANUAL.")
-    dados["status_final"] = "Análise Manual"
 
 
 def logar_erro_validacao(dados, erro):
     print(f"AÇÃO EXECUTADA: Erro de validação na solicitação {dados['id']}: {erro}")
-    dados["status_final"] = "Erro de Validação"
-    dados["detalhe_erro"] = erro
 
 
 # Mapeia os resultados das regras para as funções de ação
-ACOES_DISPONIVEIS = {
+ACOES_DISPONIVEIS = RegistroDeAcoes({
     "APROVADO": aprovar_solicitacao,
     "RECUSADO": recusar_solicitacao,
     "ANALISE_MANUAL": enviar_para_analise_manual,
+})
+
+# Mapeia os resultados das regras para o status final da solicitação
+STATUS_POR_DECISAO = {
+    "APROVADO": "Aprovado",
+    "RECUSADO": "Recusado",
+    "ANALISE_MANUAL": "Análise Manual",
 }
+
+STATUS_ERRO_VALIDACAO = "Erro de Validação"
@@ -7,10 +7,24 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
 from lib.json_logic import jsonLogic
+from lib.instrumentation import enable_profiling, get_profiler
+from lib.rule_store import RuleStore
+from json_provider import FastJSONProvider
 
 app = Flask(__name__)
 CORS(app)  # Permite requisições do frontend React
 
+# JSON rápido (orjson) quando instalado; JSONLOGIC_JSON=stdlib força a biblioteca padrão
+if os.environ.get("JSONLOGIC_JSON") != "stdlib":
+    app.json = FastJSONProvider(app)
+
+# A instrumentação por operação é opcional: habilite com JSONLOGIC_PROFILING=1
+if os.environ.get("JSONLOGIC_PROFILING") == "1":
+    enable_profiling()
+
+# Regras registradas via /api/rules, mantidas compiladas em memória
+rule_store = RuleStore()
+
 
 @app.route("/api/process-rule", methods=["POST"])
 def process_rule():
@@ -22,6 +36,12 @@ def process_rule():
         "rule": { ... },  // Regra em formato JSON Logic
         "data": { ... }   // Dados de entrada para processar
     }
+
+    Ou, para uma regra registrada em /api/rules:
+    {
+        "rule_id": "idade_minima@2",  // "<id>@<versão>" ou "<id>" (mais recente)
+        "data": { ... }
+    }
     """
     try:
         # Obtém os dados da requisição
@@ -30,8 +50,24 @@ def process_rule():
         if not request_data:
             return jsonify({"error": "Nenhum dado fornecido na requisição"}), 400
 
-        rule = request_data.get("rule")
         data = request_data.get("data", {})
+        rule_ref = request_data.get("rule_id")
+
+        if rule_ref is not None:
+            if not isinstance(rule_ref, str):
+                return jsonify({"error": "rule_id deve ser um texto no formato '<id>@<versão>'"}), 400
+            # A regra registrada já está compilada: sem parse nem compilação por requisição
+            try:
+                stored = rule_store.get(rule_ref)
+            except ValueError as e:
+                # Referência malformada: erro do cliente, não regra inexistente
+                return jsonify({"success": False, "error": e.args[0]}), 400
+            except KeyError as e:
+                return jsonify({"success": False, "error": e.args[0]}), 404
+            result = stored.compiled.evaluate(data)
+            return jsonify({"success": True, "result": result, "rule_id": stored.ref, "data": data})
+
+        rule = request_data.get("rule")
 
         if not rule:
             return jsonify({"error": "Regra não fornecida"}), 400
@@ -45,6 +81,67 @@ def process_rule():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+def _stored_rule_json(stored, include_rule=True):
+    body = {"id": stored.rule_id, "version": stored.version, "ref": stored.ref, "hash": stored.hash}
+    if include_rule:
+        body["rule"] = stored.rule
+    return body
+
+
+@app.route("/api/rules", methods=["POST"])
+def register_rule():
+    """
+    Endpoint para registrar uma regra, que passa a ser avaliada por referência.
+
+    Esperado no body da requisição:
+    {
+        "id": "idade_minima",  // Identificador da regra
+        "rule": { ... }        // Regra em formato JSON Logic
+    }
+
+    Retorna 201 com a nova versão, ou 200 com a versão existente se a regra
+    não mudou em relação à versão mais recente.
+    """
+    request_data = request.get_json(silent=True)
+
+    if not request_data:
+        return jsonify({"error": "Nenhum dado fornecido na requisição"}), 400
+
+    rule_id = request_data.get("id")
+    rule = request_data.get("rule")
+
+    if rule is None:
+        return jsonify({"error": "Regra não fornecida"}), 400
+
+    try:
+        stored, created = rule_store.put(rule_id, rule)
+    except (ValueError, RuntimeError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify(_stored_rule_json(stored, include_rule=False)), 201 if created else 200
+
+
+@app.route("/api/rules/<rule_ref>", methods=["GET"])
+def get_rule(rule_ref):
+    """
+    Endpoint que retorna uma versão de uma regra registrada.
+
+    Aceita "<id>@<versão>" ou "<id>" (versão mais recente); com "<id>", inclui
+    também a lista de versões registradas.
+    """
+    try:
+        stored = rule_store.get(rule_ref)
+    except ValueError as e:
+        return jsonify({"error": e.args[0]}), 400
+    except KeyError as e:
+        return jsonify({"error": e.args[0]}), 404
+
+    body = _stored_rule_json(stored)
+    if "@" not in rule_ref:
+        body["versions"] = [version.version for version in rule_store.versions(stored.rule_id)]
+    return jsonify(body)
+
+
 @app.route("/api/health", methods=["GET"])
 def health_check():
     """Endpoint para verificar se o servidor está funcionando."""
@@ -53,6 +150,24 @@ def health_check():
     )
 
 
+@app.route("/api/metrics", methods=["GET"])
+def metrics():
+    """
+    Endpoint que expõe as estatísticas por operação e por função registrada.
+
+    Use ?reset=1 para zerar as estatísticas após a leitura.
+    """
+    profiler = get_profiler()
+    if profiler is None:
+        return jsonify({"enabled": False})
+
+    snapshot = profiler.snapshot()
+    if request.args.get("reset") == "1":
+        profiler.reset()
+
+    return jsonify({"enabled": True, **snapshot})
+
+
 @app.route("/api/validate-rule", methods=["POST"])
 def validate_rule():
     """
@@ -90,7 +205,10 @@ if __name__ == "__main__":
     print("Endpoints disponíveis:")
     print("  POST /api/process-rule - Processar regra com dados")
     print("  POST /api/validate-rule - Validar regra")
+    print("  POST /api/rules - Registrar regra (avaliada depois por rule_id@versão)")
+    print("  GET  /api/rules/<id>[@versão] - Consultar regra registrada")
     print("  GET  /api/health - Verificar saúde do servidor")
+    print("  GET  /api/metrics - Estatísticas por operação (JSONLOGIC_PROFILING=1)")
     print("\nServidor rodando em http://localhost:5000")
 
     app.run(debug=True, host="0.0.0.0", port=5000)
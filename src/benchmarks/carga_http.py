@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Gerador de carga HTTP para a API de regras.
+
+Envia requisições com um cliente HTTP/1.1 assíncrono próprio, sobre um pool
+de conexões keep-alive, em dois modos:
+- aberto (padrão): as requisições chegam a uma taxa constante, independente
+  das respostas. A latência é medida a partir do instante *previsto* de envio,
+  de modo que o tempo de espera por uma conexão livre também é contado
+  (correção de coordinated omission);
+- fechado (`--taxa 0`): cada conexão envia a próxima requisição assim que
+  recebe a resposta anterior, medindo a vazão máxima.
+
+Reporta percentis de latência (corrigida e de serviço), vazão e taxa de erros.
+Requisições com erro ou timeout entram nos percentis com a latência até a
+falha (no timeout, o próprio limite), e os erros são contados à parte.
+Sem `--url`, a API é iniciada no próprio processo em uma porta livre; como
+cliente e servidor compartilham o GIL, use `--url` com um servidor em outro
+processo para medições absolutas.
+
+Uso (a partir de src/):
+    python -m benchmarks.carga_http --taxa 200 --duracao 10 --conexoes 16
+    python -m benchmarks.carga_http --url http://localhost:5000 --taxa 0
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+from collections import Counter
+from time import perf_counter_ns
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from lib.histogram import LatencyHistogram
+
+from .gerador import GeradorDeRegras
+from .medicao import metadados
+
+CAMINHO_PADRAO = "/api/process-rule"
+
+
+class ServidorLocal:
+    """
+    Executa a API Flask em uma thread, em uma porta livre de 127.0.0.1.
+
+    Exemplo de uso:
+    ```python
+    with ServidorLocal() as servidor:
+        print(servidor.url)
+    ```
+    """
+
+    def __init__(self, app=None):
+        if app is None:
+            from api_server import app
+        self.app = app
+        self._servidor = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "ServidorLocal":
+        from werkzeug.serving import WSGIRequestHandler, make_server
+
+        class _HandlerKeepAlive(WSGIRequestHandler):
+            # HTTP/1.1 mantém as conexões abertas entre requisições
+            protocol_version = "HTTP/1.1"
+
+            def log_request(self, *args, **kwargs):
+                pass
+
+        self._servidor = make_server("127.0.0.1", 0, self.app, threaded=True, request_handler=_HandlerKeepAlive)
+        self._thread = threading.Thread(target=self._servidor.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._servidor.shutdown()
+        self._thread.join()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._servidor.server_port}"
+
+
+class _Conexao:
+    """Conexão HTTP/1.1 persistente, reaberta sob demanda após erros."""
+
+    def __init__(self, host: str, porta: int):
+        self.host = host
+        self.porta = porta
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def requisitar(self, requisicao: bytes) -> int:
+        """Envia a requisição e lê a resposta completa, retornando o status."""
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.porta)
+
+        self._writer.write(requisicao)
+        await self._writer.drain()
+
+        linha_status = await self._reader.readline()
+        if not linha_status:
+            raise ConnectionError("Conexão encerrada pelo servidor")
+        status = int(linha_status.split(b" ", 2)[1])
+
+        tamanho = None
+        fechar = False
+        while True:
+            linha = await self._reader.readline()
+            if linha in (b"\r\n", b""):
+                break
+            nome, _, valor = linha.partition(b":")
+            nome = nome.strip().lower()
+            if nome == b"content-length":
+                tamanho = int(valor)
+            elif nome == b"connection" and valor.strip().lower() == b"close":
+                fechar = True
+
+        if tamanho is None:
+            await self._reader.read()
+            fechar = True
+        else:
+            await self._reader.readexactly(tamanho)
+
+        if fechar:
+            self.fechar()
+        return status
+
+    def fechar(self):
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+
+class GeradorDeCarga:
+    """
+    Dispara requisições POST pré-serializadas contra um endpoint.
+
+    Exemplo de uso:
+    ```python
+    gerador = GeradorDeCarga("http://localhost:5000/api/process-rule", corpos, conexoes=8)
+    resultado = asyncio.run(gerador.executar(taxa=100, duracao=5))
+    ```
+    """
+
+    def __init__(self, url: str, corpos: List[bytes], conexoes: int = 8, timeout: float = 5.0):
+        """
+        Args:
+            url: URL completa do endpoint (http://host:porta/caminho)
+            corpos: Corpos JSON das requisições, enviados em rodízio
+            conexoes: Tamanho do pool de conexões keep-alive (concorrência máxima)
+            timeout: Tempo máximo de cada requisição, em segundos
+        """
+        partes = urlsplit(url)
+        if partes.scheme != "http" or not partes.hostname:
+            raise ValueError(f"URL não suportada: {url}")
+        if not corpos or conexoes < 1:
+            raise ValueError("É necessário ao menos um corpo de requisição e uma conexão.")
+
+        self.host = partes.hostname
+        self.porta = partes.port or 80
+        self.conexoes = conexoes
+        self.timeout = timeout
+        caminho = partes.path or "/"
+        self._requisicoes = [self._montar(caminho, corpo) for corpo in corpos]
+
+    def _montar(self, caminho: str, corpo: bytes) -> bytes:
+        cabecalho = (
+            f"POST {caminho} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.porta}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(corpo)}\r\n"
+            "Connection: keep-alive\r\n\r\n"
+        )
+        return cabecalho.encode("ascii") + corpo
+
+    async def _enviar(self, previsto_ns: int, requisicao: bytes):
+        conexao = await self._pool.get()
+        envio_ns = perf_counter_ns()
+        try:
+            status = await asyncio.wait_for(conexao.requisitar(requisicao), self.timeout)
+        except (OSError, ValueError, IndexError, asyncio.IncompleteReadError, asyncio.TimeoutError) as erro:
+            conexao.fechar()
+            self._erros[type(erro).__name__] += 1
+        else:
+            if status >= 400:
+                self._erros[f"http_{status}"] += 1
+        finally:
+            # Falhas e timeouts entram nos histogramas com o tempo até a falha:
+            # descartá-los deixaria os percentis melhores do que a experiência
+            # real dos clientes
+            fim_ns = perf_counter_ns()
+            self._latencia.record(fim_ns - previsto_ns)
+            self._latencia_servico.record(fim_ns - envio_ns)
+            self._concluidas += 1
+            self._pool.put_nowait(conexao)
+
+    async def _aberto(self, taxa: float, duracao: float) -> int:
+        intervalo_ns = 1e9 / taxa
+        total = max(1, int(taxa * duracao))
+        inicio_ns = perf_counter_ns()
+        tarefas = []
+        for indice in range(total):
+            previsto_ns = inicio_ns + int(indice * intervalo_ns)
+            atraso = (previsto_ns - perf_counter_ns()) / 1e9
+            if atraso > 0:
+                await asyncio.sleep(atraso)
+            requisicao = self._requisicoes[indice % len(self._requisicoes)]
+            tarefas.append(asyncio.create_task(self._enviar(previsto_ns, requisicao)))
+        await asyncio.gather(*tarefas)
+        return total
+
+    async def _fechado(self, duracao: float) -> int:
+        limite_ns = perf_counter_ns() + int(duracao * 1e9)
+        enviadas = 0
+
+        async def trabalhador(deslocamento: int):
+            nonlocal enviadas
+            indice = deslocamento
+            while perf_counter_ns() < limite_ns:
+                enviadas += 1
+                await self._enviar(perf_counter_ns(), self._requisicoes[indice % len(self._requisicoes)])
+                indice += self.conexoes
+
+        await asyncio.gather(*(trabalhador(deslocamento) for deslocamento in range(self.conexoes)))
+        return enviadas
+
+    async def executar(self, taxa: Optional[float] = 100, duracao: float = 5.0) -> Dict[str, Any]:
+        """
+        Executa a carga e retorna as estatísticas.
+
+        Args:
+            taxa: Requisições por segundo (modo aberto); None ou 0 para o modo fechado
+            duracao: Duração da carga em segundos
+        """
+        self._pool: asyncio.Queue = asyncio.Queue()
+        for _ in range(self.conexoes):
+            self._pool.put_nowait(_Conexao(self.host, self.porta))
+        self._latencia = LatencyHistogram()
+        self._latencia_servico = LatencyHistogram()
+        self._erros: Counter = Counter()
+        self._concluidas = 0
+
+        inicio_ns = perf_counter_ns()
+        try:
+            enviadas = await self._aberto(taxa, duracao) if taxa else await self._fechado(duracao)
+        finally:
+            while not self._pool.empty():
+                self._pool.get_nowait().fechar()
+        duracao_real = (perf_counter_ns() - inicio_ns) / 1e9
+
+        total_erros = sum(self._erros.values())
+        return {
+            "modo": "aberto" if taxa else "fechado",
+            "taxa_alvo": taxa or None,
+            "conexoes": self.conexoes,
+            "enviadas": enviadas,
+            "concluidas": self._concluidas,
+            "duracao_s": duracao_real,
+            "vazao_rps": self._concluidas / duracao_real,
+            "erros": dict(self._erros),
+            "taxa_erros": total_erros / self._concluidas if self._concluidas else 0.0,
+            "latencia": _resumo(self._latencia),
+            "latencia_servico": _resumo(self._latencia_servico),
+        }
+
+
+def _resumo(histograma: LatencyHistogram) -> Dict[str, float]:
+    return {**histograma.summary(), "p90_ns": histograma.percentile(0.9)}
+
+
+def gerar_corpos(quantidade: int = 100, profundidade: int = 4, semente: int = 42) -> List[bytes]:
+    """Corpos de /api/process-rule com regras e registros sintéticos (sem `apply`)."""
+    gerador = GeradorDeRegras(semente=semente, profundidade=profundidade, densidade_apply=0)
+    pares = zip(gerador.regras(quantidade), gerador.registros(quantidade))
+    return [json.dumps({"rule": regra, "data": dados}).encode() for regra, dados in pares]
+
+
+def executar_carga(
+    url: Optional[str] = None,
+    caminho: str = CAMINHO_PADRAO,
+    taxa: Optional[float] = 100,
+    duracao: float = 5.0,
+    conexoes: int = 8,
+    timeout: float = 5.0,
+    corpos: Optional[List[bytes]] = None,
+    semente: int = 42,
+) -> Dict[str, Any]:
+    """
+    Executa a carga contra `url` ou, se omitida, contra a API no próprio processo.
+
+    Returns:
+        Dicionário com "metadados" e "resultados" (ver GeradorDeCarga.executar)
+    """
+    corpos = corpos if corpos is not None else gerar_corpos(semente=semente)
+
+    def _rodar(base: str) -> Dict[str, Any]:
+        gerador = GeradorDeCarga(base.rstrip("/") + caminho, corpos, conexoes, timeout)
+        return asyncio.run(gerador.executar(taxa, duracao))
+
+    if url:
+        resultados = _rodar(url)
+    else:
+        with ServidorLocal() as servidor:
+            resultados = _rodar(servidor.url)
+
+    return {
+        "metadados": metadados(url=url or "local", caminho=caminho, semente=semente, timeout=timeout),
+        "resultados": resultados,
+    }
+
+
+def formatar_relatorio(resultado: Dict[str, Any]) -> str:
+    """Resumo da carga para leitura no terminal."""
+    carga = resultado["resultados"]
+    alvo = f"{carga['taxa_alvo']:,.0f} req/s" if carga["taxa_alvo"] else "máxima"
+    linhas = [
+        f"🚀 CARGA {carga['modo'].upper()} em {resultado['metadados']['caminho']} (taxa {alvo}, {carga['conexoes']} conexões)",
+        f"Requisições: {carga['concluidas']:,}/{carga['enviadas']:,} em {carga['duracao_s']:.2f}s ({carga['vazao_rps']:,.1f} req/s)",
+        f"Erros: {carga['taxa_erros']:.2%} {carga['erros'] or ''}".rstrip(),
+        "",
+        f"{'Latência (ms)':<22} {'p50':>9} {'p90':>9} {'p99':>9} {'p99.9':>9} {'máx':>9}",
+    ]
+    for nome, chave in (("corrigida", "latencia"), ("serviço", "latencia_servico")):
+        resumo = carga[chave]
+        valores = [resumo[campo] / 1e6 for campo in ("p50_ns", "p90_ns", "p99_ns", "p999_ns", "max_ns")]
+        linhas.append(f"{nome:<22} " + " ".join(f"{valor:>9.2f}" for valor in valores))
+    return "\n".join(linhas)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Gerador de carga HTTP para a API de regras")
+    parser.add_argument("--url", help="URL base do servidor (padrão: API no próprio processo)")
+    parser.add_argument("--caminho", default=CAMINHO_PADRAO, help="Endpoint alvo")
+    parser.add_argument("--taxa", type=float, default=100, help="Requisições por segundo (0 = modo fechado)")
+    parser.add_argument("--duracao", type=float, default=5.0, help="Duração em segundos")
+    parser.add_argument("--conexoes", type=int, default=8, help="Conexões keep-alive simultâneas")
+    parser.add_argument("--timeout", type=float, default=5.0, help="Tempo máximo por requisição (s)")
+    parser.add_argument("--semente", type=int, default=42, help="Semente das regras geradas")
+    parser.add_argument("--corpos", metavar="ARQUIVO", help="JSON Lines com os corpos das requisições")
+    parser.add_argument("--json", metavar="ARQUIVO", help="Grava o resultado em JSON ('-' para stdout)")
+    args = parser.parse_args(argv)
+
+    corpos = None
+    if args.corpos:
+        with open(args.corpos, "rb") as arquivo:
+            corpos = [linha.strip() for linha in arquivo if linha.strip()]
+
+    resultado = executar_carga(
+        args.url, args.caminho, args.taxa, args.duracao, args.conexoes, args.timeout, corpos, args.semente
+    )
+
+    if args.json == "-":
+        print(json.dumps(resultado, indent=2, ensure_ascii=False))
+        return
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as arquivo:
+            json.dump(resultado, arquivo, indent=2, ensure_ascii=False)
+    print(formatar_relatorio(resultado))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,18 @@
-#!/usr/bin/env python3
 """
-Teste massivo de carga com diferentes cenários e payloads para JSON Logic
+Corpus de cenários dos benchmarks.
+
+Reúne os cenários de negócio (e-commerce, financeiro e IoT) usados nos antigos
+testes de carga e o cenário de crédito do MotorDeRegrasCustom. As sequências
+de execução são geradas com semente fixa, de modo que todas as medições usam
+exatamente as mesmas regras e dados.
 """
 
-import sys
-import os
-import time
 import random
-from typing import List, Dict, Callable
-
-# Adiciona o path para importar o módulo
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
-
-from src.lib.json_logic import jsonLogic
-
+from typing import Callable, Dict, List, Optional, Tuple
 
-# ========== CENÁRIOS DE TESTE ==========
 
-
-class TestScenario:
-    """Classe para representar um cenário de teste"""
+class Cenario:
+    """Conjunto de regras, dados e funções registradas de um cenário."""
 
     def __init__(
         self,
@@ -33,6 +26,11 @@ class TestScenario:
         self.dados = dados
         self.funcoes = funcoes
 
+    def sequencia(self, tamanho: int, semente: int) -> List[Tuple[Dict, Dict]]:
+        """Sequência reprodutível de pares (regra, dados) para as medições."""
+        rng = random.Random(f"{self.nome}:{semente}")
+        return [(rng.choice(self.regras), rng.choice(self.dados)) for _ in range(tamanho)]
+
 
 def criar_cenario_ecommerce():
     """Cenário de e-commerce com regras de negócio"""
@@ -254,7 +252,7 @@ def criar_cenario_ecommerce():
         },
     ]
 
-    return TestScenario("E-commerce", regras, dados, funcoes)
+    return Cenario("E-commerce", regras, dados, funcoes)
 
 
 def criar_cenario_financeiro():
@@ -482,7 +480,7 @@ def criar_cenario_financeiro():
         },
     ]
 
-    return TestScenario("Financeiro", regras, dados, funcoes)
+    return Cenario("Financeiro", regras, dados, funcoes)
 
 
 def criar_cenario_iot():
@@ -687,123 +685,33 @@ def criar_cenario_iot():
         },
     ]
 
-    return TestScenario("IoT", regras, dados, funcoes)
-
+    return Cenario("IoT", regras, dados, funcoes)
 
-def executar_cenario(cenario: TestScenario, num_execucoes: int = 1000):
-    """Executa um cenário de teste"""
-    print(f"\n🎯 Executando cenário: {cenario.nome}")
-    print("-" * 50)
-
-    sucessos = 0
-    erros = 0
-    tempo_total = 0
-    resultados_amostra = []
-
-    for i in range(num_execucoes):
-        regra = random.choice(cenario.regras)
-        dados = random.choice(cenario.dados)
-
-        try:
-            inicio = time.time()
-            resultado = jsonLogic(regra, dados, cenario.funcoes)
-            fim = time.time()
-
-            tempo_execucao = fim - inicio
-            tempo_total += tempo_execucao
-            sucessos += 1
-
-            # Coleta amostras dos primeiros resultados
-            if i < 5:
-                resultados_amostra.append(
-                    {
-                        "execucao": i + 1,
-                        "resultado": resultado,
-                        "tempo_ms": tempo_execucao * 1000,
-                    }
-                )
-
-        except Exception as e:
-            erros += 1
-            if erros <= 3:
-                print(f"   ❌ Erro na execução {i+1}: {e}")
-
-    # Mostra resultados de amostra
-    print("📊 Amostra de resultados:")
-    for amostra in resultados_amostra:
-        print(
-            f"   Execução {amostra['execucao']}: {amostra['resultado']} ({amostra['tempo_ms']:.2f}ms)"
-        )
-
-    # Estatísticas
-    print("\n📈 Estatísticas:")
-    print(f"   Total de execuções: {num_execucoes}")
-    print(f"   Sucessos: {sucessos}")
-    print(f"   Erros: {erros}")
-    print(f"   Taxa de sucesso: {(sucessos/num_execucoes*100):.1f}%")
-    print(f"   Tempo médio: {(tempo_total/num_execucoes)*1000:.3f}ms")
-    print(f"   Throughput: {num_execucoes/tempo_total:.0f} operações/s")
-
-    return {
-        "cenario": cenario.nome,
-        "execucoes": num_execucoes,
-        "sucessos": sucessos,
-        "erros": erros,
-        "tempo_total": tempo_total,
-        "taxa_sucesso": (sucessos / num_execucoes * 100),
-        "tempo_medio_ms": (tempo_total / num_execucoes) * 1000,
-        "throughput": num_execucoes / tempo_total,
-    }
 
+def gerar_solicitacoes_credito(quantidade: int, semente: int) -> List[Dict]:
+    """Solicitações de crédito para o MotorDeRegrasCustom, com semente fixa."""
+    rng = random.Random(f"credito:{semente}")
+    return [
+        {
+            "id": f"REQ-{indice:06d}",
+            # ~5% das solicitações falham na validação de score
+            "pontuacao_credito": None if rng.random() < 0.05 else rng.randint(300, 900),
+            "renda_mensal": rng.randint(500, 20000),
+            "valor_solicitado": rng.randint(1000, 50000),
+            "possui_divida_ativa": rng.random() < 0.2,
+            "idade": rng.randint(16, 80),
+        }
+        for indice in range(quantidade)
+    ]
 
-def main():
-    """Executa todos os cenários de teste"""
-    print("🚀 TESTE MASSIVO DE CARGA - JSON LOGIC")
-    print("=" * 60)
-    print("Testando diferentes cenários de negócio com payloads variados")
-    print("=" * 60)
 
-    # Cria cenários
+def criar_cenarios(nomes: Optional[List[str]] = None) -> List[Cenario]:
+    """Cria os cenários de regras do corpus (todos, ou apenas os informados)."""
     cenarios = [
         criar_cenario_ecommerce(),
         criar_cenario_financeiro(),
         criar_cenario_iot(),
     ]
-
-    resultados = []
-
-    # Executa cada cenário
-    for cenario in cenarios:
-        resultado = executar_cenario(cenario, 2000)
-        resultados.append(resultado)
-
-    # Resumo geral
-    print("\n" + "=" * 60)
-    print("📊 RESUMO GERAL DOS TESTES")
-    print("=" * 60)
-
-    total_execucoes = sum(r["execucoes"] for r in resultados)
-    total_sucessos = sum(r["sucessos"] for r in resultados)
-    total_erros = sum(r["erros"] for r in resultados)
-    total_tempo = sum(r["tempo_total"] for r in resultados)
-
-    print(f"🎯 Total de execuções: {total_execucoes:,}")
-    print(f"✅ Total de sucessos: {total_sucessos:,}")
-    print(f"❌ Total de erros: {total_erros:,}")
-    print(f"📈 Taxa de sucesso geral: {(total_sucessos/total_execucoes*100):.2f}%")
-    print(f"⏱️  Tempo médio geral: {(total_tempo/total_execucoes)*1000:.3f}ms")
-    print(f"🚀 Throughput geral: {total_execucoes/total_tempo:.0f} operações/s")
-
-    print("\n📋 Resultados por cenário:")
-    for resultado in resultados:
-        print(
-            f"   {resultado['cenario']}: {resultado['taxa_sucesso']:.1f}% sucesso, {resultado['tempo_medio_ms']:.2f}ms médio"
-        )
-
-    print("\n🎉 Teste massivo concluído!")
-    print(f"💪 JSON Logic demonstrou robustez em {len(cenarios)} cenários diferentes")
-    print(f"🔥 Performance média: {total_execucoes/total_tempo:.0f} operações/segundo")
-
-
-if __name__ == "__main__":
-    main()
+    if nomes is None:
+        return cenarios
+    return [cenario for cenario in cenarios if cenario.nome in nomes]
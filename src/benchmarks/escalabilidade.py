@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Benchmark de escalabilidade com regras sintéticas.
+
+Mede a vazão de jsonLogic e das regras compiladas em três séries, variando
+um eixo por vez com o gerador sintético (`gerador.py`):
+- tamanho da regra: profundidade das regras (e número de nós);
+- quantidade de regras: todas as regras de um conjunto avaliadas por registro;
+- tamanho dos dados: campos extras em cada registro.
+
+Uso (a partir de src/):
+    python -m benchmarks.escalabilidade
+    python -m benchmarks.escalabilidade --serie profundidade --json -
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from lib.compiler import compile_logic, walk
+from lib.json_logic import jsonLogic
+
+from .gerador import FUNCOES_GERADAS, GeradorDeRegras
+from .medicao import medir, metadados
+
+PROFUNDIDADES = [1, 2, 4, 8, 16, 30]
+QUANTIDADES_REGRAS = [10, 100, 1000, 5000]
+CAMPOS_EXTRAS = [0, 10, 100, 1000, 10000]
+
+
+def _avaliadores(regras: List[Dict], registros: List[Dict]) -> Dict[str, Callable[[], Any]]:
+    """Lotes que avaliam todas as regras em todos os registros."""
+    compiladas = [compile_logic(regra) for regra in regras]
+
+    def lote_json_logic():
+        for registro in registros:
+            for regra in regras:
+                jsonLogic(regra, registro, FUNCOES_GERADAS)
+
+    def lote_compilado():
+        for registro in registros:
+            for regra in compiladas:
+                regra.evaluate(registro, FUNCOES_GERADAS)
+
+    return {"jsonLogic": lote_json_logic, "compilado": lote_compilado}
+
+
+def _medir_ponto(
+    regras: List[Dict],
+    registros: List[Dict],
+    repeticoes: int,
+    aquecimento: int,
+) -> Dict[str, Any]:
+    operacoes = len(regras) * len(registros)
+    ponto: Dict[str, Any] = {
+        "regras": len(regras),
+        "registros": len(registros),
+        "nos_por_regra": sum(sum(1 for _ in walk(compile_logic(regra).root)) for regra in regras) / len(regras),
+    }
+    for nome, lote in _avaliadores(regras, registros).items():
+        estatisticas = medir(lote, operacoes, repeticoes, aquecimento)
+        ponto[nome] = {
+            "mediana_ns": estatisticas["mediana_ns"],
+            "coef_variacao": estatisticas["coef_variacao"],
+            "ops_por_segundo": estatisticas["ops_por_segundo"],
+        }
+    return ponto
+
+
+def serie_profundidade(
+    profundidades: List[int] = PROFUNDIDADES,
+    regras: int = 50,
+    registros: int = 20,
+    repeticoes: int = 5,
+    aquecimento: int = 1,
+    semente: int = 42,
+) -> List[Dict[str, Any]]:
+    """Vazão por avaliação em função da profundidade das regras."""
+    pontos = []
+    for profundidade in profundidades:
+        gerador = GeradorDeRegras(semente=semente, profundidade=profundidade)
+        ponto = _medir_ponto(gerador.regras(regras), gerador.registros(registros), repeticoes, aquecimento)
+        pontos.append({"profundidade": profundidade, **ponto})
+    return pontos
+
+
+def serie_quantidade(
+    quantidades: List[int] = QUANTIDADES_REGRAS,
+    registros: int = 5,
+    profundidade: int = 4,
+    repeticoes: int = 5,
+    aquecimento: int = 1,
+    semente: int = 42,
+) -> List[Dict[str, Any]]:
+    """Vazão por avaliação em função do número de regras avaliadas por registro."""
+    gerador = GeradorDeRegras(semente=semente, profundidade=profundidade)
+    amostra_registros = gerador.registros(registros)
+    corpus = gerador.regras(max(quantidades))
+    return [_medir_ponto(corpus[:quantidade], amostra_registros, repeticoes, aquecimento) for quantidade in quantidades]
+
+
+def serie_dados(
+    campos_extras: List[int] = CAMPOS_EXTRAS,
+    regras: int = 50,
+    registros: int = 20,
+    profundidade: int = 4,
+    repeticoes: int = 5,
+    aquecimento: int = 1,
+    semente: int = 42,
+) -> List[Dict[str, Any]]:
+    """Vazão por avaliação em função do número de campos de cada registro."""
+    pontos = []
+    for extras in campos_extras:
+        gerador = GeradorDeRegras(semente=semente, profundidade=profundidade)
+        ponto = _medir_ponto(gerador.regras(regras), gerador.registros(registros, extras), repeticoes, aquecimento)
+        pontos.append({"campos_extras": extras, **ponto})
+    return pontos
+
+
+SERIES = {
+    "profundidade": serie_profundidade,
+    "quantidade": serie_quantidade,
+    "dados": serie_dados,
+}
+
+
+def executar_escalabilidade(
+    series: Optional[List[str]] = None,
+    repeticoes: int = 5,
+    aquecimento: int = 1,
+    semente: int = 42,
+) -> Dict[str, Any]:
+    """Executa as séries informadas (todas, por padrão)."""
+    nomes = series or list(SERIES)
+    return {
+        "metadados": metadados(semente=semente, repeticoes=repeticoes, aquecimento=aquecimento),
+        "resultados": {
+            nome: SERIES[nome](repeticoes=repeticoes, aquecimento=aquecimento, semente=semente) for nome in nomes
+        },
+    }
+
+
+def formatar_relatorio(resultado: Dict[str, Any]) -> str:
+    """Uma tabela por série: eixo variado, nós por regra e vazão de cada avaliador."""
+    eixos = {"profundidade": "profundidade", "quantidade": "regras", "dados": "campos_extras"}
+    linhas = []
+    for serie, pontos in resultado["resultados"].items():
+        eixo = eixos[serie]
+        linhas += [
+            f"📈 {serie.upper()}",
+            f"{eixo:>14} {'nós/regra':>10} {'jsonLogic ops/s':>16} {'compilado ops/s':>16} {'ganho':>7}",
+        ]
+        for ponto in pontos:
+            interpretado = ponto["jsonLogic"]["ops_por_segundo"]
+            compilado = ponto["compilado"]["ops_por_segundo"]
+            linhas.append(
+                f"{ponto[eixo]:>14,} {ponto['nos_por_regra']:>10.1f} {interpretado:>16,.0f} {compilado:>16,.0f} "
+                f"{compilado / interpretado:>6.1f}x"
+            )
+        linhas.append("")
+    return "\n".join(linhas).rstrip()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark de escalabilidade com regras sintéticas")
+    parser.add_argument("--serie", action="append", choices=list(SERIES), help="Série a executar (repetível)")
+    parser.add_argument("--repeticoes", type=int, default=5, help="Repetições cronometradas")
+    parser.add_argument("--aquecimento", type=int, default=1, help="Execuções de aquecimento")
+    parser.add_argument("--semente", type=int, default=42, help="Semente do gerador")
+    parser.add_argument("--json", metavar="ARQUIVO", help="Grava o resultado em JSON ('-' para stdout)")
+    args = parser.parse_args(argv)
+
+    resultado = executar_escalabilidade(args.serie, args.repeticoes, args.aquecimento, args.semente)
+
+    if args.json == "-":
+        print(json.dumps(resultado, indent=2, ensure_ascii=False))
+        return
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as arquivo:
+            json.dump(resultado, arquivo, indent=2, ensure_ascii=False)
+    print(formatar_relatorio(resultado))
+
+
+if __name__ == "__main__":
+    main()
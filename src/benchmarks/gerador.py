@@ -0,0 +1,177 @@
+"""
+Gerador sintético de regras JSON Logic e de registros compatíveis.
+
+As regras são geradas com semente fixa e parâmetros controláveis:
+- profundidade: níveis de operações compostas (and/or/!/if) até as comparações;
+- ramificação: número de filhos de `and`/`or`;
+- mix de operadores: pesos relativos de cada operação composta e de comparação;
+- profundidade dos caminhos de `var` (ex: "n0_3.n1_0.n2_7" tem profundidade 3);
+- densidade de `apply`: probabilidade de um operando numérico passar por uma
+  função registrada.
+
+Em cada nível, apenas um filho continua até a profundidade máxima (a "espinha")
+e os demais são comparações, de modo que o tamanho da regra cresce linearmente
+com a profundidade e regras com 30 níveis continuam viáveis.
+
+Os registros preenchem todos os caminhos usados pelas regras, e podem receber
+campos extras para medir o efeito do tamanho dos dados.
+
+Exemplo de uso:
+```python
+gerador = GeradorDeRegras(semente=7, profundidade=10, densidade_apply=0.2)
+regras = gerador.regras(5000)
+registros = gerador.registros(100, campos_extras=50)
+jsonLogic(regras[0], registros[0], FUNCOES_GERADAS)
+```
+"""
+
+import random
+from typing import Any, Callable, Dict, List, Optional
+
+# Pesos padrão das operações compostas e das comparações
+MIX_PADRAO: Dict[str, float] = {
+    "and": 3,
+    "or": 3,
+    "!": 1,
+    "if": 2,
+    "==": 1,
+    "!=": 1,
+    ">": 2,
+    ">=": 2,
+    "<": 2,
+    "<=": 2,
+    "in": 1,
+}
+
+_COMPOSTAS = ("and", "or", "!", "if")
+_COMPARACOES = ("==", "!=", ">", ">=", "<", "<=", "in")
+_ARITMETICAS = ("+", "-", "*")
+
+# Funções usadas pelas regras com `apply`: puras, determinísticas e numéricas
+FUNCOES_GERADAS: Dict[str, Callable] = {
+    "dobro": lambda valor: valor * 2,
+    "metade": lambda valor: valor / 2,
+    "modulo": lambda valor: valor % 97,
+}
+
+VALOR_MAXIMO = 1000
+
+
+class GeradorDeRegras:
+    """Gera regras e registros sintéticos de forma reprodutível."""
+
+    def __init__(
+        self,
+        semente: int = 42,
+        profundidade: int = 4,
+        ramificacao: int = 3,
+        profundidade_caminho: int = 2,
+        densidade_apply: float = 0.1,
+        densidade_aritmetica: float = 0.1,
+        mix_operadores: Optional[Dict[str, float]] = None,
+        campos: int = 32,
+    ):
+        """
+        Args:
+            semente: Semente das regras e dos registros
+            profundidade: Níveis de operações compostas de cada regra
+            ramificacao: Número de filhos de `and`/`or`
+            profundidade_caminho: Número de níveis dos caminhos de `var`
+            densidade_apply: Probabilidade de um operando usar `apply`
+            densidade_aritmetica: Probabilidade de um operando usar +, - ou *
+            mix_operadores: Pesos relativos dos operadores (padrão: MIX_PADRAO)
+            campos: Número de caminhos distintos de `var` nas regras
+        """
+        if profundidade < 0 or ramificacao < 1 or profundidade_caminho < 1 or campos < 1:
+            raise ValueError("Parâmetros inválidos para o gerador de regras.")
+
+        mix = {**MIX_PADRAO, **(mix_operadores or {})}
+        self._compostas = [op for op in _COMPOSTAS if mix.get(op, 0) > 0]
+        self._pesos_compostas = [mix[op] for op in self._compostas]
+        self._comparacoes = [op for op in _COMPARACOES if mix.get(op, 0) > 0]
+        self._pesos_comparacoes = [mix[op] for op in self._comparacoes]
+        if not self._comparacoes or (profundidade > 0 and not self._compostas):
+            raise ValueError("O mix de operadores precisa de comparações e, com profundidade, de operações compostas.")
+
+        self.semente = semente
+        self.profundidade = profundidade
+        self.ramificacao = ramificacao
+        self.densidade_apply = densidade_apply
+        self.densidade_aritmetica = densidade_aritmetica
+        self._rng_regras = random.Random(f"regras:{semente}")
+        self._rng_registros = random.Random(f"registros:{semente}")
+
+        rng_caminhos = random.Random(f"caminhos:{semente}")
+        self.caminhos: List[str] = sorted(
+            {
+                ".".join(f"n{nivel}_{rng_caminhos.randrange(campos)}" for nivel in range(profundidade_caminho))
+                for _ in range(campos)
+            }
+        )
+
+    # Regras
+
+    def _operando(self) -> Any:
+        rng = self._rng_regras
+        operando: Any = {"var": rng.choice(self.caminhos)}
+        sorteio = rng.random()
+        if sorteio < self.densidade_apply:
+            operando = {"apply": [rng.choice(list(FUNCOES_GERADAS)), operando]}
+        elif sorteio < self.densidade_apply + self.densidade_aritmetica:
+            operando = {rng.choice(_ARITMETICAS): [operando, rng.randint(1, 10)]}
+        return operando
+
+    def _comparacao(self) -> Dict[str, Any]:
+        rng = self._rng_regras
+        op = rng.choices(self._comparacoes, self._pesos_comparacoes)[0]
+        if op == "in":
+            return {"in": [self._operando(), [rng.randint(0, VALOR_MAXIMO) for _ in range(4)]]}
+        return {op: [self._operando(), rng.randint(0, VALOR_MAXIMO)]}
+
+    def _condicao(self, profundidade: int) -> Dict[str, Any]:
+        if profundidade <= 0:
+            return self._comparacao()
+
+        rng = self._rng_regras
+        op = rng.choices(self._compostas, self._pesos_compostas)[0]
+        if op == "!":
+            return {"!": [self._condicao(profundidade - 1)]}
+        if op == "if":
+            filhos = [self._condicao(profundidade - 1), self._comparacao(), self._comparacao()]
+            rng.shuffle(filhos)
+            return {"if": filhos}
+
+        filhos = [self._condicao(profundidade - 1)] + [self._comparacao() for _ in range(self.ramificacao - 1)]
+        rng.shuffle(filhos)
+        return {op: filhos}
+
+    def regra(self) -> Dict[str, Any]:
+        """Gera uma regra de decisão com a profundidade configurada."""
+        return {"if": [self._condicao(self.profundidade), "APROVADO", "RECUSADO"]}
+
+    def regras(self, quantidade: int) -> List[Dict[str, Any]]:
+        return [self.regra() for _ in range(quantidade)]
+
+    # Registros
+
+    def registro(self, campos_extras: int = 0) -> Dict[str, Any]:
+        """
+        Gera um registro com valores para todos os caminhos das regras.
+
+        Args:
+            campos_extras: Campos adicionais, não usados pelas regras
+        """
+        rng = self._rng_registros
+        registro: Dict[str, Any] = {}
+        for caminho in self.caminhos:
+            *niveis, chave = caminho.split(".")
+            destino = registro
+            for nivel in niveis:
+                destino = destino.setdefault(nivel, {})
+            destino[chave] = rng.randint(0, VALOR_MAXIMO)
+        for indice in range(campos_extras):
+            registro[f"extra_{indice}"] = rng.randint(0, VALOR_MAXIMO)
+        return registro
+
+    def registros(self, quantidade: int, campos_extras: int = 0) -> List[Dict[str, Any]]:
+        return [self.registro(campos_extras) for _ in range(quantidade)]
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Benchmark da codificação JSON no caminho da API.
+
+Mede, para cada provedor JSON disponível (biblioteca padrão e orjson) e para
+cada tamanho de payload:
+- a vazão de requisições a `/api/process-rule`, no próprio processo (cliente
+  de teste do Flask, sem rede), com o corpo e a resposta do tamanho informado;
+- o tempo de decodificar o corpo e de serializar a resposta isoladamente, para
+  comparar o custo do JSON com o da requisição inteira.
+
+Uso (a partir de src/):
+    python -m benchmarks.json_api
+    python -m benchmarks.json_api --tamanhos 10000 500000 --json -
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from flask.json.provider import DefaultJSONProvider
+
+from json_provider import FastJSONProvider, orjson
+from regras import REGRA_PROCESSAMENTO
+
+from .medicao import medir, metadados
+
+TAMANHOS = [1_000, 10_000, 100_000, 500_000]
+CATEGORIAS = ["mercado", "transporte", "saude", "lazer", "educacao", "moradia"]
+
+
+def provedores() -> Dict[str, type]:
+    """Provedores JSON disponíveis neste ambiente."""
+    disponiveis = {"json": DefaultJSONProvider}
+    if orjson is not None:
+        disponiveis["orjson"] = FastJSONProvider
+    return disponiveis
+
+
+def gerar_solicitacao(tamanho: int, semente: int = 42) -> Dict[str, Any]:
+    """Solicitação com histórico de transações até ~`tamanho` bytes em JSON."""
+    aleatorio = random.Random(semente)
+    solicitacao = {
+        "id": "REQ-BENCH",
+        "pontuacao_credito": 720,
+        "renda_mensal": 5500.0,
+        "possui_divida_ativa": False,
+        "idade": 34,
+        "historico": [],
+    }
+    tamanho_atual = len(json.dumps(solicitacao))
+    while tamanho_atual < tamanho:
+        transacao = {
+            "data": f"2024-{aleatorio.randint(1, 12):02d}-{aleatorio.randint(1, 28):02d}",
+            "valor": round(aleatorio.uniform(1, 5000), 2),
+            "categoria": aleatorio.choice(CATEGORIAS),
+            "parcelado": aleatorio.random() < 0.2,
+            "descricao": f"Compra {aleatorio.randint(1, 10**6)} em estabelecimento comercial",
+        }
+        solicitacao["historico"].append(transacao)
+        tamanho_atual += len(json.dumps(transacao)) + 2
+    return solicitacao
+
+
+def medir_payload(
+    app,
+    nome_provedor: str,
+    provedor_cls: type,
+    tamanho: int,
+    requisicoes: int,
+    repeticoes: int,
+    aquecimento: int,
+    semente: int,
+) -> Dict[str, Any]:
+    """Mede requisição, decodificação e serialização de um payload com o provedor."""
+    dados = gerar_solicitacao(tamanho, semente)
+    corpo = json.dumps({"rule": REGRA_PROCESSAMENTO, "data": dados}).encode("utf-8")
+    anterior = app.json
+    app.json = provedor = provedor_cls(app)
+    try:
+        cliente = app.test_client()
+        resposta = cliente.post("/api/process-rule", data=corpo, content_type="application/json")
+        if resposta.status_code != 200:
+            raise RuntimeError(f"Resposta inesperada da API: {resposta.status_code} {resposta.data[:200]!r}")
+        objeto_resposta = resposta.get_json()
+
+        def lote_requisicoes():
+            for _ in range(requisicoes):
+                cliente.post("/api/process-rule", data=corpo, content_type="application/json")
+
+        def lote_decodificar():
+            for _ in range(requisicoes):
+                provedor.loads(corpo)
+
+        def lote_serializar():
+            for _ in range(requisicoes):
+                provedor.response(objeto_resposta)
+
+        requisicao = medir(lote_requisicoes, requisicoes, repeticoes, aquecimento)
+        decodificar = medir(lote_decodificar, requisicoes, repeticoes, aquecimento)
+        serializar = medir(lote_serializar, requisicoes, repeticoes, aquecimento)
+    finally:
+        app.json = anterior
+
+    return {
+        "provedor": nome_provedor,
+        "bytes_corpo": len(corpo),
+        "bytes_resposta": len(resposta.data),
+        "requisicoes_por_segundo": requisicao["ops_por_segundo"],
+        "requisicao_us": requisicao["mediana_ns"] / 1000,
+        "decodificar_us": decodificar["mediana_ns"] / 1000,
+        "serializar_us": serializar["mediana_ns"] / 1000,
+        "fracao_json": (decodificar["mediana_ns"] + serializar["mediana_ns"]) / requisicao["mediana_ns"],
+    }
+
+
+def executar_json_api(
+    tamanhos: Optional[List[int]] = None,
+    requisicoes: int = 20,
+    repeticoes: int = 5,
+    aquecimento: int = 1,
+    semente: int = 42,
+    app=None,
+) -> Dict[str, Any]:
+    """
+    Executa as medições para todos os provedores e tamanhos.
+
+    Returns:
+        Dicionário com "metadados" e "resultados" ("<provedor>/<tamanho>" -> medidas)
+    """
+    if app is None:
+        from api_server import app
+    tamanhos = tamanhos or TAMANHOS
+    resultados = {}
+    for tamanho in tamanhos:
+        for nome, provedor_cls in provedores().items():
+            resultados[f"{nome}/{tamanho}"] = medir_payload(
+                app, nome, provedor_cls, tamanho, requisicoes, repeticoes, aquecimento, semente
+            )
+    return {
+        "metadados": metadados(
+            semente=semente,
+            requisicoes=requisicoes,
+            repeticoes=repeticoes,
+            aquecimento=aquecimento,
+            provedores=list(provedores()),
+        ),
+        "resultados": resultados,
+    }
+
+
+def formatar_relatorio(resultado: Dict[str, Any]) -> str:
+    """Tabela por provedor e tamanho, com o ganho sobre a biblioteca padrão."""
+    resultados = resultado["resultados"]
+    linhas = [
+        "🧾 JSON NO CAMINHO DA API",
+        f"{'Provedor/tamanho':<20} {'corpo':>10} {'req/s':>10} {'req µs':>10} {'decod. µs':>10} "
+        f"{'serial. µs':>11} {'% JSON':>7} {'ganho':>7}",
+    ]
+    for nome, medida in resultados.items():
+        tamanho = nome.split("/", 1)[1]
+        base = resultados.get(f"json/{tamanho}")
+        ganho = medida["requisicoes_por_segundo"] / base["requisicoes_por_segundo"] if base else 1.0
+        linhas.append(
+            f"{nome:<20} {medida['bytes_corpo']:>10,} {medida['requisicoes_por_segundo']:>10,.0f} "
+            f"{medida['requisicao_us']:>10,.1f} {medida['decodificar_us']:>10,.1f} {medida['serializar_us']:>11,.1f} "
+            f"{medida['fracao_json']:>6.0%} {ganho:>6.2f}x"
+        )
+    if orjson is None:
+        linhas += ["", "orjson não instalado: apenas a biblioteca padrão foi medida (pip install orjson)."]
+    return "\n".join(linhas)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark da codificação JSON no caminho da API")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=TAMANHOS, help="Tamanhos de payload, em bytes")
+    parser.add_argument("--requisicoes", type=int, default=20, help="Requisições por repetição")
+    parser.add_argument("--repeticoes", type=int, default=5, help="Repetições cronometradas")
+    parser.add_argument("--aquecimento", type=int, default=1, help="Execuções de aquecimento")
+    parser.add_argument("--semente", type=int, default=42, help="Semente dos payloads")
+    parser.add_argument("--json", metavar="ARQUIVO", help="Grava o resultado em JSON ('-' para stdout)")
+    args = parser.parse_args(argv)
+
+    resultado = executar_json_api(args.tamanhos, args.requisicoes, args.repeticoes, args.aquecimento, args.semente)
+
+    if args.json == "-":
+        print(json.dumps(resultado, indent=2, ensure_ascii=False))
+        return
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as arquivo:
+            json.dump(resultado, arquivo, indent=2, ensure_ascii=False)
+    print(formatar_relatorio(resultado))
+
+
+if __name__ == "__main__":
+    main()
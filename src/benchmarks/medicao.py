@@ -0,0 +1,123 @@
+"""
+Medição reprodutível de desempenho.
+
+Cada medição executa um lote fixo de operações: primeiro algumas rodadas de
+aquecimento (descartadas) e depois várias repetições cronometradas com
+`perf_counter_ns`. O coletor de lixo é desabilitado durante as repetições, como
+faz o `timeit`, para reduzir o ruído entre medições.
+"""
+
+import asyncio
+import datetime
+import gc
+import platform
+import statistics
+from time import perf_counter_ns
+from typing import Any, Awaitable, Callable, Dict, List
+
+
+def metadados(**parametros) -> Dict[str, Any]:
+    """Data, versão do Python e plataforma da execução, mais os parâmetros informados."""
+    return {
+        "data": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "implementacao": platform.python_implementation(),
+        "plataforma": platform.platform(),
+        **parametros,
+    }
+
+
+def resumir(amostras_ns: List[float]) -> Dict[str, Any]:
+    """
+    Estatísticas das amostras (tempo por operação, em ns, de cada repetição).
+
+    A vazão é calculada a partir da mediana, que é menos sensível a
+    repetições atrapalhadas por ruído externo.
+    """
+    mediana = statistics.median(amostras_ns)
+    media = statistics.fmean(amostras_ns)
+    desvio = statistics.stdev(amostras_ns) if len(amostras_ns) > 1 else 0.0
+    return {
+        "amostras_ns": amostras_ns,
+        "mediana_ns": mediana,
+        "media_ns": media,
+        "desvio_padrao_ns": desvio,
+        "min_ns": min(amostras_ns),
+        "max_ns": max(amostras_ns),
+        "coef_variacao": desvio / media if media else 0.0,
+        "ops_por_segundo": 1e9 / mediana if mediana else 0.0,
+    }
+
+
+def medir(
+    lote: Callable[[], Any],
+    operacoes: int,
+    repeticoes: int = 10,
+    aquecimento: int = 2,
+) -> Dict[str, Any]:
+    """
+    Mede um lote síncrono.
+
+    Args:
+        lote: Função que executa `operacoes` operações
+        operacoes: Número de operações executadas por chamada de `lote`
+        repeticoes: Número de repetições cronometradas
+        aquecimento: Número de execuções descartadas antes das medições
+
+    Returns:
+        Estatísticas do tempo por operação (ver `resumir`)
+    """
+    for _ in range(aquecimento):
+        lote()
+
+    amostras = []
+    gc_habilitado = gc.isenabled()
+    try:
+        for _ in range(repeticoes):
+            gc.collect()
+            gc.disable()
+            inicio = perf_counter_ns()
+            lote()
+            amostras.append((perf_counter_ns() - inicio) / operacoes)
+            if gc_habilitado:
+                gc.enable()
+    finally:
+        if gc_habilitado:
+            gc.enable()
+
+    return resumir(amostras)
+
+
+def medir_async(
+    lote: Callable[[], Awaitable[Any]],
+    operacoes: int,
+    repeticoes: int = 10,
+    aquecimento: int = 2,
+) -> Dict[str, Any]:
+    """
+    Mede um lote assíncrono dentro de um único event loop.
+
+    Os argumentos e o retorno são os mesmos de `medir`.
+    """
+
+    async def _medir():
+        for _ in range(aquecimento):
+            await lote()
+
+        amostras = []
+        gc_habilitado = gc.isenabled()
+        try:
+            for _ in range(repeticoes):
+                gc.collect()
+                gc.disable()
+                inicio = perf_counter_ns()
+                await lote()
+                amostras.append((perf_counter_ns() - inicio) / operacoes)
+                if gc_habilitado:
+                    gc.enable()
+        finally:
+            if gc_habilitado:
+                gc.enable()
+        return amostras
+
+    return resumir(asyncio.run(_medir()))
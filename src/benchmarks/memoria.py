@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Benchmark de memória da avaliação e do carregamento de regras.
+
+Mede com tracemalloc:
+- o pico de memória de cada avaliação (jsonLogic e regra compilada) nos
+  cenários do corpus e a memória que permanece retida depois das avaliações;
+- os bytes retidos por regra carregada (JSON decodificado e regra compilada),
+  incluindo um corpus grande de regras geradas;
+- o pico de memória de `map`, `filter` e `merge` sobre listas grandes.
+
+Reporta também o pico de RSS do processo. Com `--registrar`, a execução é
+acrescentada a um histórico em JSON Lines, para acompanhar a evolução ao longo
+do tempo.
+
+Uso (a partir de src/):
+    python -m benchmarks.memoria
+    python -m benchmarks.memoria --tamanho 200000 --json -
+    python -m benchmarks.memoria --registrar
+"""
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from lib.compiler import compile_logic, walk
+from lib.json_logic import jsonLogic
+
+from .cenarios import criar_cenarios
+from .gerador import GeradorDeRegras
+from .medicao import metadados
+
+HISTORICO_PADRAO = os.path.join(os.path.dirname(__file__), "historico", "memoria.jsonl")
+
+# Regras de coleção avaliadas sobre os dados de `_dados_colecoes`. Como os
+# argumentos de map/filter são avaliados antes da operação, a lógica aplicada a
+# cada item é lida dos próprios dados.
+REGRAS_COLECOES = {
+    "map": {"map": [{"var": "itens"}, {"var": "dobro"}]},
+    "filter": {"filter": [{"var": "itens"}, {"var": "par"}]},
+    "merge": {"merge": [{"var": "itens"}, {"var": "outros"}]},
+}
+
+
+def _memoria_atual() -> int:
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def _pico(funcao: Callable[[], Any]) -> int:
+    """Pico de memória (bytes acima do nível inicial) durante a chamada."""
+    tracemalloc.reset_peak()
+    inicio = tracemalloc.get_traced_memory()[0]
+    resultado = funcao()
+    pico = tracemalloc.get_traced_memory()[1] - inicio
+    del resultado
+    return pico
+
+
+def medir_avaliacao(avaliacoes: int = 200, semente: int = 42) -> Dict[str, Dict[str, Any]]:
+    """
+    Pico de memória por avaliação e memória retida após as avaliações.
+
+    Exige tracemalloc ativo.
+
+    Returns:
+        "<cenário>/<avaliador>" -> estatísticas em bytes
+    """
+    resultados = {}
+    for cenario in criar_cenarios():
+        sequencia = cenario.sequencia(avaliacoes, semente)
+        funcoes = cenario.funcoes
+        compiladas = {id(regra): compile_logic(regra) for regra in cenario.regras}
+
+        avaliadores = {
+            "jsonLogic": lambda regra, dados: jsonLogic(regra, dados, funcoes),
+            "compilado": lambda regra, dados: compiladas[id(regra)].evaluate(dados, funcoes),
+        }
+        for nome, avaliar in avaliadores.items():
+            # Uma passada de aquecimento evita contar caches criados na primeira avaliação
+            for regra, dados in sequencia:
+                avaliar(regra, dados)
+
+            inicio = _memoria_atual()
+            soma = maximo = 0
+            for regra, dados in sequencia:
+                pico = _pico(lambda: avaliar(regra, dados))
+                soma += pico
+                maximo = max(maximo, pico)
+            retidos = _memoria_atual() - inicio
+
+            resultados[f"{cenario.nome}/{nome}"] = {
+                "avaliacoes": avaliacoes,
+                "pico_medio_bytes": soma / avaliacoes,
+                "pico_max_bytes": maximo,
+                "bytes_retidos": max(0, retidos),
+            }
+    return resultados
+
+
+def medir_carregamento(regras: List[Dict]) -> Dict[str, Any]:
+    """
+    Bytes retidos por regra carregada: JSON decodificado e regra compilada.
+
+    Exige tracemalloc ativo.
+    """
+    textos = [json.dumps(regra) for regra in regras]
+
+    inicio = _memoria_atual()
+    decodificadas = [json.loads(texto) for texto in textos]
+    bytes_json = _memoria_atual() - inicio
+
+    inicio = _memoria_atual()
+    compiladas = [compile_logic(regra) for regra in decodificadas]
+    bytes_compilados = _memoria_atual() - inicio
+
+    total_nos = sum(sum(1 for _ in walk(regra.root)) for regra in compiladas)
+    return {
+        "regras": len(regras),
+        "nos": total_nos,
+        "bytes_por_regra_json": bytes_json / len(regras),
+        "bytes_por_regra_compilada": bytes_compilados / len(regras),
+        "bytes_por_no_compilado": bytes_compilados / total_nos,
+    }
+
+
+def _dados_colecoes(tamanho: int) -> Dict[str, Any]:
+    itens = [{"valor": indice} for indice in range(tamanho)]
+    return {
+        "itens": itens,
+        "outros": list(itens),
+        "dobro": {"*": [{"var": "valor"}, 2]},
+        "par": {"==": [{"%": [{"var": "valor"}, 2]}, 0]},
+    }
+
+
+def medir_colecoes(tamanho: int = 50_000) -> Dict[str, Dict[str, Any]]:
+    """
+    Pico de memória de map, filter e merge sobre listas de `tamanho` elementos.
+
+    Exige tracemalloc ativo.
+
+    Returns:
+        "<operação>/<avaliador>" -> estatísticas em bytes
+    """
+    dados = _dados_colecoes(tamanho)
+    resultados = {}
+    for operacao, regra in REGRAS_COLECOES.items():
+        compilada = compile_logic(regra)
+        avaliadores = {
+            "jsonLogic": lambda: jsonLogic(regra, dados),
+            "compilado": lambda: compilada.evaluate(dados),
+        }
+        for nome, avaliar in avaliadores.items():
+            gc.collect()
+            pico = _pico(avaliar)
+            resultados[f"{operacao}/{nome}"] = {
+                "elementos": tamanho,
+                "pico_bytes": pico,
+                "bytes_por_elemento": pico / tamanho,
+            }
+    return resultados
+
+
+def pico_rss_bytes() -> Optional[int]:
+    """Pico de RSS do processo, ou None se o módulo resource não existir."""
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss é informado em bytes no macOS e em KiB no Linux
+    return pico if sys.platform == "darwin" else pico * 1024
+
+
+def _commit_atual() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(__file__),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def executar_memoria(
+    avaliacoes: int = 200,
+    tamanho_colecoes: int = 50_000,
+    regras_geradas: int = 5000,
+    profundidade: int = 4,
+    semente: int = 42,
+) -> Dict[str, Any]:
+    """
+    Executa todas as medições de memória.
+
+    Args:
+        avaliacoes: Avaliações medidas por cenário e avaliador
+        tamanho_colecoes: Elementos das listas de map/filter/merge
+        regras_geradas: Tamanho do corpus gerado para o carregamento
+        profundidade: Profundidade das regras geradas
+        semente: Semente das sequências e do corpus gerado
+
+    Returns:
+        Dicionário com "metadados" e "resultados"
+    """
+    corpus = GeradorDeRegras(semente=semente, profundidade=profundidade).regras(regras_geradas)
+    regras_cenarios = [regra for cenario in criar_cenarios() for regra in cenario.regras]
+
+    tracemalloc.start()
+    try:
+        resultados = {
+            "avaliacao": medir_avaliacao(avaliacoes, semente),
+            "carregamento": {
+                "cenarios": medir_carregamento(regras_cenarios),
+                "gerado": medir_carregamento(corpus),
+            },
+            "colecoes": medir_colecoes(tamanho_colecoes),
+        }
+    finally:
+        tracemalloc.stop()
+    resultados["pico_rss_bytes"] = pico_rss_bytes()
+
+    return {
+        "metadados": metadados(
+            commit=_commit_atual(),
+            semente=semente,
+            avaliacoes=avaliacoes,
+            tamanho_colecoes=tamanho_colecoes,
+            regras_geradas=regras_geradas,
+            profundidade=profundidade,
+        ),
+        "resultados": resultados,
+    }
+
+
+def registrar_historico(resultado: Dict[str, Any], caminho: str = HISTORICO_PADRAO):
+    """Acrescenta o resultado como uma linha do histórico em JSON Lines."""
+    os.makedirs(os.path.dirname(os.path.abspath(caminho)), exist_ok=True)
+    with open(caminho, "a", encoding="utf-8") as arquivo:
+        arquivo.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+
+
+def formatar_relatorio(resultado: Dict[str, Any]) -> str:
+    """Resumo das medições para leitura no terminal."""
+    resultados = resultado["resultados"]
+    linhas = ["🧠 AVALIAÇÃO (bytes por avaliação)", f"{'Cenário/avaliador':<28} {'pico médio':>12} {'pico máx':>12} {'retidos':>10}"]
+    for nome, medida in resultados["avaliacao"].items():
+        linhas.append(
+            f"{nome:<28} {medida['pico_medio_bytes']:>12,.0f} {medida['pico_max_bytes']:>12,} {medida['bytes_retidos']:>10,}"
+        )
+
+    linhas += ["", "📦 CARREGAMENTO (bytes retidos por regra)", f"{'Corpus':<28} {'regras':>8} {'JSON':>10} {'compilada':>10} {'por nó':>8}"]
+    for nome, medida in resultados["carregamento"].items():
+        linhas.append(
+            f"{nome:<28} {medida['regras']:>8,} {medida['bytes_por_regra_json']:>10,.0f} "
+            f"{medida['bytes_por_regra_compilada']:>10,.0f} {medida['bytes_por_no_compilado']:>8,.1f}"
+        )
+
+    linhas += ["", "📚 COLEÇÕES (pico de memória)", f"{'Operação/avaliador':<28} {'elementos':>10} {'pico':>14} {'por elemento':>13}"]
+    for nome, medida in resultados["colecoes"].items():
+        linhas.append(
+            f"{nome:<28} {medida['elementos']:>10,} {medida['pico_bytes']:>14,} {medida['bytes_por_elemento']:>13,.1f}"
+        )
+
+    if resultados["pico_rss_bytes"] is not None:
+        linhas += ["", f"Pico de RSS do processo: {resultados['pico_rss_bytes'] / 2**20:,.1f} MiB"]
+    return "\n".join(linhas)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark de memória da avaliação e do carregamento de regras")
+    parser.add_argument("--avaliacoes", type=int, default=200, help="Avaliações por cenário e avaliador")
+    parser.add_argument("--tamanho", type=int, default=50_000, help="Elementos das listas de map/filter/merge")
+    parser.add_argument("--regras", type=int, default=5000, help="Regras geradas para o carregamento")
+    parser.add_argument("--profundidade", type=int, default=4, help="Profundidade das regras geradas")
+    parser.add_argument("--semente", type=int, default=42, help="Semente do corpus")
+    parser.add_argument("--json", metavar="ARQUIVO", help="Grava o resultado em JSON ('-' para stdout)")
+    parser.add_argument("--registrar", action="store_true", help="Acrescenta a execução ao histórico")
+    parser.add_argument("--historico", default=HISTORICO_PADRAO, help="Arquivo JSON Lines do histórico (com --registrar)")
+    args = parser.parse_args(argv)
+
+    resultado = executar_memoria(args.avaliacoes, args.tamanho, args.regras, args.profundidade, args.semente)
+
+    if args.registrar:
+        registrar_historico(resultado, args.historico)
+
+    if args.json == "-":
+        print(json.dumps(resultado, indent=2, ensure_ascii=False))
+        return
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as arquivo:
+            json.dump(resultado, arquivo, indent=2, ensure_ascii=False)
+    print(formatar_relatorio(resultado))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Verificação de regressão de desempenho contra uma baseline versionada.
+
+Compara as amostras de cada benchmark da suíte com as da baseline usando o
+teste de Mann-Whitney U (unilateral, aproximação normal com correção de
+empates). Um benchmark é considerado regressão quando a diferença é
+estatisticamente significativa (p < alfa) E a mediana piorou mais que a
+tolerância, o que evita falhas por ruído ou por diferenças irrelevantes.
+
+Uso (a partir de src/):
+    python -m benchmarks.regressao                        # executa a suíte e compara
+    python -m benchmarks.regressao --atual resultado.json # compara um resultado salvo
+    python -m benchmarks.regressao --atualizar            # regrava a baseline
+
+O código de saída é 1 quando há regressão.
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .suite import executar_suite
+
+BASELINE_PADRAO = os.path.join(os.path.dirname(__file__), "baselines", "referencia.json")
+
+SITUACAO_OK = "ok"
+SITUACAO_REGRESSAO = "regressao"
+SITUACAO_MELHORIA = "melhoria"
+SITUACAO_NOVO = "novo"
+SITUACAO_AUSENTE = "ausente"
+
+
+class Comparacao(NamedTuple):
+    """Resultado da comparação de um benchmark com a baseline."""
+
+    nome: str
+    situacao: str
+    mediana_referencia_ns: Optional[float] = None
+    mediana_atual_ns: Optional[float] = None
+    variacao: Optional[float] = None
+    p_valor: Optional[float] = None
+
+
+def _postos(valores: Sequence[float]) -> Tuple[List[float], List[int]]:
+    """Postos (média dos postos em caso de empate) e tamanhos dos grupos empatados."""
+    ordem = sorted(range(len(valores)), key=valores.__getitem__)
+    postos = [0.0] * len(valores)
+    empates = []
+    inicio = 0
+    while inicio < len(ordem):
+        fim = inicio
+        while fim + 1 < len(ordem) and valores[ordem[fim + 1]] == valores[ordem[inicio]]:
+            fim += 1
+        posto_medio = (inicio + fim) / 2 + 1
+        for posicao in range(inicio, fim + 1):
+            postos[ordem[posicao]] = posto_medio
+        empates.append(fim - inicio + 1)
+        inicio = fim + 1
+    return postos, empates
+
+
+def mann_whitney_u(maiores: Sequence[float], menores: Sequence[float]) -> Tuple[float, float]:
+    """
+    Teste de Mann-Whitney U unilateral.
+
+    H1: os valores de `maiores` tendem a ser maiores que os de `menores`.
+
+    Returns:
+        Tupla (U de `maiores`, p-valor)
+    """
+    n1, n2 = len(maiores), len(menores)
+    if not n1 or not n2:
+        raise ValueError("O teste de Mann-Whitney exige amostras não vazias.")
+
+    postos, empates = _postos(list(maiores) + list(menores))
+    u = sum(postos[:n1]) - n1 * (n1 + 1) / 2
+
+    n = n1 + n2
+    correcao_empates = sum(t**3 - t for t in empates) / (n * (n - 1)) if n > 1 else 0.0
+    variancia = n1 * n2 / 12 * ((n + 1) - correcao_empates)
+    if variancia <= 0:
+        # Todos os valores são iguais
+        return u, 1.0
+
+    # Correção de continuidade de 0,5 em direção à média
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variancia)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def comparar(
+    referencia: Dict[str, Any],
+    atual: Dict[str, Any],
+    tolerancia: float = 0.10,
+    alfa: float = 0.01,
+) -> List[Comparacao]:
+    """
+    Compara os resultados da suíte com a baseline.
+
+    Args:
+        referencia: Resultado da suíte usado como baseline
+        atual: Resultado da suíte a verificar
+        tolerancia: Piora relativa da mediana aceita sem falha (0.10 = 10%)
+        alfa: Nível de significância do teste estatístico
+
+    Returns:
+        Uma comparação por benchmark, na ordem da baseline (novos ao final)
+    """
+    resultados_referencia = referencia["resultados"]
+    resultados_atuais = atual["resultados"]
+    comparacoes = []
+
+    for nome, estatisticas_referencia in resultados_referencia.items():
+        estatisticas_atuais = resultados_atuais.get(nome)
+        if estatisticas_atuais is None:
+            comparacoes.append(Comparacao(nome, SITUACAO_AUSENTE, estatisticas_referencia["mediana_ns"]))
+            continue
+
+        amostras_referencia = estatisticas_referencia["amostras_ns"]
+        amostras_atuais = estatisticas_atuais["amostras_ns"]
+        mediana_referencia = estatisticas_referencia["mediana_ns"]
+        mediana_atual = estatisticas_atuais["mediana_ns"]
+        variacao = mediana_atual / mediana_referencia - 1
+
+        _, p_piora = mann_whitney_u(amostras_atuais, amostras_referencia)
+        _, p_melhora = mann_whitney_u(amostras_referencia, amostras_atuais)
+
+        if p_piora < alfa and variacao > tolerancia:
+            situacao, p_valor = SITUACAO_REGRESSAO, p_piora
+        elif p_melhora < alfa and variacao < -tolerancia:
+            situacao, p_valor = SITUACAO_MELHORIA, p_melhora
+        else:
+            situacao, p_valor = SITUACAO_OK, min(p_piora, p_melhora)
+
+        comparacoes.append(Comparacao(nome, situacao, mediana_referencia, mediana_atual, variacao, p_valor))
+
+    for nome, estatisticas_atuais in resultados_atuais.items():
+        if nome not in resultados_referencia:
+            comparacoes.append(Comparacao(nome, SITUACAO_NOVO, mediana_atual_ns=estatisticas_atuais["mediana_ns"]))
+
+    return comparacoes
+
+
+def formatar_relatorio(comparacoes: List[Comparacao]) -> str:
+    """Tabela da comparação para leitura no terminal."""
+    linhas = [f"{'Benchmark':<34} {'base (µs)':>10} {'atual (µs)':>11} {'variação':>9} {'p':>8}  situação"]
+    for comparacao in comparacoes:
+        base = f"{comparacao.mediana_referencia_ns / 1000:.2f}" if comparacao.mediana_referencia_ns is not None else "-"
+        atual = f"{comparacao.mediana_atual_ns / 1000:.2f}" if comparacao.mediana_atual_ns is not None else "-"
+        variacao = f"{comparacao.variacao:+.1%}" if comparacao.variacao is not None else "-"
+        p_valor = f"{comparacao.p_valor:.4f}" if comparacao.p_valor is not None else "-"
+        linhas.append(f"{comparacao.nome:<34} {base:>10} {atual:>11} {variacao:>9} {p_valor:>8}  {comparacao.situacao}")
+    return "\n".join(linhas)
+
+
+def _carregar(caminho: str) -> Dict[str, Any]:
+    with open(caminho, encoding="utf-8") as arquivo:
+        return json.load(arquivo)
+
+
+def _gravar(caminho: str, resultado: Dict[str, Any]):
+    os.makedirs(os.path.dirname(os.path.abspath(caminho)), exist_ok=True)
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(resultado, arquivo, indent=2, ensure_ascii=False)
+        arquivo.write("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Verifica regressões de desempenho contra a baseline")
+    parser.add_argument("--baseline", default=BASELINE_PADRAO, help="Arquivo JSON da baseline")
+    parser.add_argument("--atual", help="Resultado JSON já gerado (se omitido, executa a suíte)")
+    parser.add_argument("--tolerancia", type=float, default=0.10, help="Piora relativa aceita (padrão: 0.10)")
+    parser.add_argument("--alfa", type=float, default=0.01, help="Nível de significância (padrão: 0.01)")
+    parser.add_argument("--filtro", help="Compara apenas benchmarks cujo nome contém o texto")
+    parser.add_argument("--atualizar", action="store_true", help="Executa a suíte e regrava a baseline")
+    args = parser.parse_args(argv)
+
+    if args.atualizar:
+        _gravar(args.baseline, executar_suite(filtro=args.filtro))
+        print(f"Baseline gravada em {args.baseline}")
+        return 0
+
+    referencia = _carregar(args.baseline)
+    if args.atual:
+        atual = _carregar(args.atual)
+    else:
+        # Mesmos parâmetros da baseline, para que as amostras sejam comparáveis
+        metadados = referencia["metadados"]
+        atual = executar_suite(
+            operacoes=metadados["operacoes"],
+            repeticoes=metadados["repeticoes"],
+            aquecimento=metadados["aquecimento"],
+            semente=metadados["semente"],
+            filtro=args.filtro,
+        )
+
+    if args.filtro:
+        referencia = {**referencia, "resultados": {nome: valor for nome, valor in referencia["resultados"].items() if args.filtro in nome}}
+
+    comparacoes = comparar(referencia, atual, args.tolerancia, args.alfa)
+    print(formatar_relatorio(comparacoes))
+
+    regressoes = [comparacao.nome for comparacao in comparacoes if comparacao.situacao == SITUACAO_REGRESSAO]
+    if regressoes:
+        print(f"\n❌ Regressão de desempenho em: {', '.join(regressoes)}")
+        return 1
+    print("\n✅ Nenhuma regressão significativa")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Suíte unificada de benchmarks dos avaliadores.
+
+Substitui os antigos scripts de desempenho (test_benchmark_complete.py,
+test_load_test.py etc.), que tinham laços de medição próprios e resultados
+não comparáveis entre si. Todos os benchmarks usam o mesmo corpus de cenários
+(`cenarios.py`), a mesma semente e a mesma medição (`medicao.py`).
+
+Uso (a partir de src/):
+    python -m benchmarks                          # tabela resumida
+    python -m benchmarks --json resultado.json    # resultado em JSON
+    python -m benchmarks --filtro Financeiro      # apenas alguns benchmarks
+"""
+
+import argparse
+import atexit
+import contextlib
+import json
+import os
+import sys
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from lib.compiler import compile_logic
+from lib.json_logic import jsonLogic, jsonLogicAsync
+from lib.registry import FunctionRegistry
+from motor_regras import MotorDeRegrasCustom
+
+from .cenarios import Cenario, criar_cenarios, gerar_solicitacoes_credito
+from .medicao import medir, medir_async, metadados
+
+
+class Benchmark(NamedTuple):
+    """
+    Benchmark da suíte.
+
+    `preparar(operacoes, semente)` monta o lote fora da medição e retorna a
+    função (ou corrotina, se `assincrono`) que executa as operações.
+    """
+
+    nome: str
+    preparar: Callable[[int, int], Callable[[], Any]]
+    assincrono: bool = False
+
+
+def _json_logic(cenario: Cenario):
+    def preparar(operacoes: int, semente: int):
+        sequencia = cenario.sequencia(operacoes, semente)
+        funcoes = cenario.funcoes
+
+        def lote():
+            for regra, dados in sequencia:
+                jsonLogic(regra, dados, funcoes)
+
+        return lote
+
+    return preparar
+
+
+def _compilado(cenario: Cenario, memoizado: bool = False):
+    def preparar(operacoes: int, semente: int):
+        # A compilação acontece uma vez, fora da medição, como no motor
+        compiladas = {id(regra): compile_logic(regra) for regra in cenario.regras}
+        sequencia = [(compiladas[id(regra)], dados) for regra, dados in cenario.sequencia(operacoes, semente)]
+        funcoes = cenario.funcoes
+        if memoizado:
+            # As funções dos cenários são puras, mas custam menos que uma consulta
+            # ao cache: este benchmark mede o custo da memoização, não um ganho
+            funcoes = FunctionRegistry()
+            for nome, funcao in cenario.funcoes.items():
+                funcoes.register(nome, funcao, pure=True)
+
+        def lote():
+            for regra, dados in sequencia:
+                regra.evaluate(dados, funcoes)
+
+        return lote
+
+    return preparar
+
+
+def _json_logic_async(cenario: Cenario):
+    def preparar(operacoes: int, semente: int):
+        sequencia = cenario.sequencia(operacoes, semente)
+        funcoes = cenario.funcoes
+
+        async def lote():
+            for regra, dados in sequencia:
+                await jsonLogicAsync(regra, dados, funcoes)
+
+        return lote
+
+    return preparar
+
+
+# Destino dos prints do motor, aberto uma única vez, fora dos lotes cronometrados
+_DEVNULL = open(os.devnull, "w")
+atexit.register(_DEVNULL.close)
+
+
+def _motor_silencioso() -> MotorDeRegrasCustom:
+    with contextlib.redirect_stdout(_DEVNULL):
+        return MotorDeRegrasCustom()
+
+
+def _motor_executar(operacoes: int, semente: int):
+    motor = _motor_silencioso()
+    solicitacoes = gerar_solicitacoes_credito(operacoes, semente)
+
+    def lote():
+        # executar grava o status na entrada; cada lote trabalha em cópias rasas
+        # e descarta os prints do motor
+        with contextlib.redirect_stdout(_DEVNULL):
+            for solicitacao in solicitacoes:
+                motor.executar(dict(solicitacao))
+
+    return lote
+
+
+def _motor_decidir(operacoes: int, semente: int):
+    motor = _motor_silencioso()
+    solicitacoes = gerar_solicitacoes_credito(operacoes, semente)
+
+    def lote():
+        with contextlib.redirect_stdout(_DEVNULL):
+            for solicitacao in solicitacoes:
+                motor.decidir(solicitacao)
+
+    return lote
+
+
+def criar_benchmarks() -> List[Benchmark]:
+    """Lista de todos os benchmarks da suíte, em ordem estável."""
+    benchmarks = []
+    for cenario in criar_cenarios():
+        benchmarks.append(Benchmark(f"{cenario.nome}/jsonLogic", _json_logic(cenario)))
+        benchmarks.append(Benchmark(f"{cenario.nome}/compilado", _compilado(cenario)))
+        benchmarks.append(Benchmark(f"{cenario.nome}/compilado+memo", _compilado(cenario, memoizado=True)))
+        benchmarks.append(Benchmark(f"{cenario.nome}/jsonLogicAsync", _json_logic_async(cenario), assincrono=True))
+    benchmarks.append(Benchmark("Crédito/motor.executar", _motor_executar))
+    benchmarks.append(Benchmark("Crédito/motor.decidir", _motor_decidir))
+    return benchmarks
+
+
+def executar_suite(
+    operacoes: int = 1000,
+    repeticoes: int = 10,
+    aquecimento: int = 2,
+    semente: int = 42,
+    filtro: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Executa os benchmarks e retorna o resultado em formato serializável.
+
+    Args:
+        operacoes: Operações por repetição
+        repeticoes: Repetições cronometradas de cada benchmark
+        aquecimento: Execuções descartadas antes das medições
+        semente: Semente das sequências de regras e dados
+        filtro: Executa apenas os benchmarks cujo nome contém este texto
+
+    Returns:
+        Dicionário com "metadados" e "resultados" (nome do benchmark -> estatísticas)
+    """
+    resultados = {}
+    for benchmark in criar_benchmarks():
+        if filtro and filtro not in benchmark.nome:
+            continue
+        lote = benchmark.preparar(operacoes, semente)
+        medidor = medir_async if benchmark.assincrono else medir
+        resultados[benchmark.nome] = medidor(lote, operacoes, repeticoes, aquecimento)
+
+    return {
+        "metadados": metadados(
+            semente=semente,
+            operacoes=operacoes,
+            repeticoes=repeticoes,
+            aquecimento=aquecimento,
+        ),
+        "resultados": resultados,
+    }
+
+
+def formatar_tabela(resultado: Dict[str, Any]) -> str:
+    """Tabela resumida (mediana, desvio e vazão) para leitura no terminal."""
+    linhas = [f"{'Benchmark':<34} {'mediana (µs)':>13} {'desvio (%)':>11} {'ops/s':>12}"]
+    for nome, estatisticas in resultado["resultados"].items():
+        linhas.append(
+            f"{nome:<34} {estatisticas['mediana_ns'] / 1000:>13.2f} "
+            f"{estatisticas['coef_variacao'] * 100:>11.1f} {estatisticas['ops_por_segundo']:>12,.0f}"
+        )
+    return "\n".join(linhas)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Suíte unificada de benchmarks dos avaliadores")
+    parser.add_argument("--operacoes", type=int, default=1000, help="Operações por repetição")
+    parser.add_argument("--repeticoes", type=int, default=10, help="Repetições cronometradas")
+    parser.add_argument("--aquecimento", type=int, default=2, help="Execuções de aquecimento")
+    parser.add_argument("--semente", type=int, default=42, help="Semente do corpus")
+    parser.add_argument("--filtro", help="Executa apenas benchmarks cujo nome contém o texto")
+    parser.add_argument("--json", metavar="ARQUIVO", help="Grava o resultado em JSON ('-' para stdout)")
+    args = parser.parse_args(argv)
+
+    resultado = executar_suite(args.operacoes, args.repeticoes, args.aquecimento, args.semente, args.filtro)
+
+    if args.json == "-":
+        print(json.dumps(resultado, indent=2, ensure_ascii=False))
+        return
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as arquivo:
+            json.dump(resultado, arquivo, indent=2, ensure_ascii=False)
+    print(formatar_tabela(resultado))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Despacho assíncrono das ações do motor em micro-lotes.
+
+As ações de uma decisão (aprovar, recusar, enviar para análise...) gravam em
+banco de dados e filas. Em vez de executá-las dentro da decisão, o
+`DespachanteDeAcoes` as enfileira e devolve o controle imediatamente; as ações
+são agrupadas por tipo e entregues a um destino (sink) em lotes, quando o lote
+atinge `tamanho_lote` ou quando a janela de tempo `janela` expira.
+
+Destinos disponíveis:
+- `SinkAcoes`: executa as funções de ação (síncronas ou assíncronas) de
+  ACOES_DISPONIVEIS, item a item;
+- `SinkMemoria`: guarda os lotes em memória, para testes.
+
+Um destino é qualquer objeto com `async def gravar(tipo, lote)`; um destino de
+banco de dados, por exemplo, grava o lote inteiro em uma única transação. Uma
+exceção de `gravar` conta todas as ações do lote como falhas; um destino que
+entrega item a item pode, em vez disso, retornar o número de ações que falharam.
+
+Exemplo de uso:
+```python
+despachante = DespachanteDeAcoes(SinkAcoes(), tamanho_lote=100, janela=0.05)
+motor = MotorDeRegrasAsync(despachante=despachante)
+
+await motor.decidir_async(solicitacao)  # retorna sem esperar a ação
+await despachante.drenar()              # no encerramento: entrega o que falta
+```
+"""
+
+import asyncio
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from acoes import ACOES_DISPONIVEIS, RegistroDeAcoes
+
+
+class Acao(NamedTuple):
+    """Ação pendente: o tipo (decisão), os dados da solicitação e os parâmetros da decisão."""
+
+    tipo: str
+    dados: Dict[str, Any]
+    params: Optional[Dict[str, Any]] = None
+
+
+class SinkMemoria:
+    """Destino em memória: guarda cada lote recebido, na ordem de entrega."""
+
+    def __init__(self):
+        self.lotes: List[tuple] = []
+
+    async def gravar(self, tipo: str, lote: List[Acao]):
+        self.lotes.append((tipo, list(lote)))
+
+    @property
+    def acoes(self) -> List[Acao]:
+        """Todas as ações entregues, na ordem de entrega."""
+        return [acao for _, lote in self.lotes for acao in lote]
+
+
+class SinkAcoes:
+    """Destino que executa as funções de ação de cada item do lote."""
+
+    def __init__(self, acoes: Optional[Dict[str, Callable]] = None):
+        """
+        Args:
+            acoes: Funções de ação por tipo (padrão: ACOES_DISPONIVEIS)
+        """
+        if acoes is None:
+            acoes = ACOES_DISPONIVEIS
+        # O registro classifica as ações uma única vez, e não a cada ação executada
+        self.acoes = acoes if isinstance(acoes, RegistroDeAcoes) else RegistroDeAcoes(acoes)
+
+    async def gravar(self, tipo: str, lote: List[Acao]) -> int:
+        """
+        Executa a ação de cada item; a falha de um item não interrompe o lote.
+
+        Returns:
+            Número de ações que falharam (todas, se o tipo não tem ação)
+        """
+        if tipo not in self.acoes:
+            print(f"Nenhuma ação definida para a decisão '{tipo}'.")
+            return len(lote)
+        assincrona = self.acoes.assincrona(tipo)
+        falhas = 0
+        for item in lote:
+            try:
+                resultado = self.acoes.executar(tipo, item.dados, item.params)
+                if assincrona:
+                    await resultado
+            except Exception as erro:
+                falhas += 1
+                print(f"Falha ao executar a ação '{tipo}': {erro!r}")
+        return falhas
+
+
+class DespachanteDeAcoes:
+    """
+    Agrupa as ações por tipo e as entrega ao destino em micro-lotes.
+
+    `enviar` não bloqueia: apenas enfileira a ação. Um lote é entregue quando
+    atinge `tamanho_lote` ou `janela` segundos depois da sua primeira ação.
+    Falhas do destino são contadas em `stats()`, por ação, e não chegam à
+    decisão.
+    """
+
+    def __init__(self, sink=None, tamanho_lote: int = 100, janela: float = 0.05):
+        """
+        Args:
+            sink: Destino dos lotes (padrão: SinkAcoes com ACOES_DISPONIVEIS)
+            tamanho_lote: Número máximo de ações por lote
+            janela: Tempo máximo, em segundos, que uma ação aguarda o lote
+        """
+        if tamanho_lote < 1:
+            raise ValueError("tamanho_lote deve ser maior que zero.")
+        if janela < 0:
+            raise ValueError("janela não pode ser negativa.")
+        self.sink = sink if sink is not None else SinkAcoes()
+        self.tamanho_lote = tamanho_lote
+        self.janela = janela
+        self._buffers: Dict[str, List[Acao]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._entregas: set = set()
+        self.enviadas = 0
+        self.entregues = 0
+        self.lotes = 0
+        self.falhas = 0
+
+    def enviar(self, tipo: str, dados: Dict[str, Any], params: Optional[Dict[str, Any]] = None):
+        """Enfileira a ação; exige um event loop em execução."""
+        loop = asyncio.get_running_loop()
+        self.enviadas += 1
+        buffer = self._buffers.setdefault(tipo, [])
+        buffer.append(Acao(tipo, dados, params or None))
+        if len(buffer) >= self.tamanho_lote:
+            self._descarregar(tipo)
+        elif tipo not in self._timers:
+            self._timers[tipo] = loop.call_later(self.janela, self._descarregar, tipo)
+
+    def _descarregar(self, tipo: str):
+        """Entrega o lote atual do tipo em uma tarefa separada."""
+        timer = self._timers.pop(tipo, None)
+        if timer is not None:
+            timer.cancel()
+        lote = self._buffers.pop(tipo, None)
+        if not lote:
+            return
+        entrega = asyncio.get_running_loop().create_task(self._entregar(tipo, lote))
+        self._entregas.add(entrega)
+        entrega.add_done_callback(self._entregas.discard)
+
+    async def _entregar(self, tipo: str, lote: List[Acao]):
+        try:
+            falhas = await self.sink.gravar(tipo, lote) or 0
+        except Exception as erro:
+            self.falhas += len(lote)
+            print(f"Falha ao entregar {len(lote)} ações '{tipo}': {erro!r}")
+            return
+        self.lotes += 1
+        self.falhas += falhas
+        self.entregues += len(lote) - falhas
+
+    async def drenar(self):
+        """Entrega imediatamente todos os lotes pendentes e aguarda as entregas."""
+        for tipo in list(self._buffers):
+            self._descarregar(tipo)
+        while self._entregas:
+            await asyncio.gather(*self._entregas)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enviadas": self.enviadas,
+            "entregues": self.entregues,
+            "lotes": self.lotes,
+            "falhas": self.falhas,
+            "pendentes": sum(len(buffer) for buffer in self._buffers.values()),
+            "entregas_em_andamento": len(self._entregas),
+        }
@@ -15,6 +15,7 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'lib'))
 
 from lib.json_logic import jsonLogic, jsonLogicAsync, jsonLogicAuto
+from lib.registry import FunctionRegistry
 
 
 # Funções síncronas
@@ -77,13 +78,16 @@ async def validar_documento_async(documento):
 
 
 # Registro de funções (síncronas e assíncronas)
-funcoes_permitidas = {
+funcoes_permitidas = FunctionRegistry({
     "format_name": formatar_nome_completo,
     "calc_area_sync": calcular_area_sync,
-    "fetch_user": buscar_dados_usuario,
     "calc_area_async": calcular_area_async,
     "validate_doc": validar_documento_async,
-}
+})
+# Limita as chamadas simultâneas ao serviço de usuários; em picos, até 100
+# chamadas aguardam na fila e as demais falham com FunctionOverloadedError.
+# Chamadas idênticas em andamento compartilham o mesmo resultado.
+funcoes_permitidas.register("fetch_user", buscar_dados_usuario, coalesce=True, max_concurrency=10, max_queue=100)
 
 
 async def exemplo_basico():
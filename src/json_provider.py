@@ -0,0 +1,98 @@
+"""
+Provedor JSON da API com codificação rápida opcional.
+
+Com payloads de centenas de KB, o parse da requisição e a serialização da
+resposta com o `json` da biblioteca padrão custam mais que a avaliação da
+regra. `FastJSONProvider` usa o orjson quando ele está instalado
+(`pip install orjson`) e, sem ele, se comporta exatamente como o provedor
+padrão do Flask.
+
+O resultado é o mesmo do provedor padrão: as chaves continuam ordenadas
+(`sort_keys`), e datas, dataclasses e objetos não serializáveis passam pela
+mesma função `default`. Valores que o orjson não aceita (inteiros acima de 64
+bits, chaves que não são texto) são serializados pela biblioteca padrão.
+
+NaN e Infinity também ficam com a biblioteca padrão: o orjson os escreveria
+como `null` e rejeitaria corpos que os contêm. Como eles viram `null` no
+orjson, a saída só é verificada quando contém `null`.
+
+Exemplo de uso:
+```python
+app = Flask(__name__)
+app.json = FastJSONProvider(app)
+```
+"""
+
+import math
+import typing as t
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson é opcional
+    orjson = None
+
+
+def _tem_nao_finito(obj: t.Any) -> bool:
+    """Indica se há NaN ou Infinity em algum valor (listas e dicionários aninhados)."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_tem_nao_finito(valor) for valor in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_tem_nao_finito(valor) for valor in obj)
+    return False
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Provedor JSON do Flask que usa o orjson quando disponível."""
+
+    # Biblioteca usada na codificação e decodificação
+    backend = "orjson" if orjson is not None else "json"
+
+    def _dumps_bytes(self, obj: t.Any, indent: bool = False) -> t.Optional[bytes]:
+        """Serializa com o orjson; None se o objeto exigir a biblioteca padrão."""
+        # Datas e dataclasses passam por `default`, como no provedor padrão
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            data = orjson.dumps(obj, default=self.default, option=option)
+        except orjson.JSONEncodeError:
+            return None
+        if b"null" in data and _tem_nao_finito(obj):
+            return None
+        return data
+
+    def dumps(self, obj: t.Any, **kwargs: t.Any) -> str:
+        # Argumentos específicos do json.dumps ficam com a biblioteca padrão
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        data = self._dumps_bytes(obj)
+        if data is None:
+            return super().dumps(obj)
+        return data.decode("utf-8")
+
+    def loads(self, s: t.Union[str, bytes], **kwargs: t.Any) -> t.Any:
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity são aceitos pela biblioteca padrão; o erro de um JSON
+            # inválido é o mesmo do provedor padrão
+            return super().loads(s)
+
+    def response(self, *args: t.Any, **kwargs: t.Any):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        data = self._dumps_bytes(obj, indent)
+        if data is None:
+            return super().response(*args, **kwargs)
+        # O corpo vai em bytes, sem a conversão intermediária para str
+        return self._app.response_class(data + b"\n", mimetype=self.mimetype)
@@ -0,0 +1,447 @@
+"""
+Compilação de regras JSON Logic em árvores de nós Python.
+
+A regra é analisada uma única vez e convertida em nós que avaliam seus
+argumentos diretamente, sem reconstruir a tabela de operações a cada chamada
+como faz `jsonLogic`. Os resultados são idênticos aos de `jsonLogic`.
+
+Todos os nós usam __slots__: um worker mantém dezenas de milhares de regras
+compiladas em memória, e nós com __dict__ multiplicariam o consumo.
+
+Para avaliação assíncrona (`CompiledRule.evaluate_async`), a árvore é
+particionada conforme as funções assíncronas registradas: apenas os nós no
+caminho até um `apply` assíncrono são substituídos por nós assíncronos
+(`is_async = True`), e as subárvores síncronas continuam sendo avaliadas por
+chamadas comuns, sem criar corrotinas.
+"""
+
+import sys
+from functools import reduce
+from typing import AbstractSet, Any, Callable, Dict, FrozenSet, Iterator, Optional
+
+from .json_logic import _STATIC_OPERATIONS, _async_function_names, _get_nested_value, jsonLogic
+
+
+def _as_array(value: Any) -> Any:
+    return value if isinstance(value, (list, tuple)) else []
+
+
+# Operações que avaliam uma sub-regra para cada item de um array. Recebem as
+# funções registradas como primeiro argumento, seguidas dos valores avaliados.
+_ITERATION_OPS: Dict[str, Callable] = {
+    "some": lambda functions, array, logic: any(jsonLogic(logic, item, functions) for item in _as_array(array)),
+    "every": lambda functions, array, logic: all(jsonLogic(logic, item, functions) for item in _as_array(array)),
+    "none": lambda functions, array, logic: not any(jsonLogic(logic, item, functions) for item in _as_array(array)),
+    "map": lambda functions, array, logic: [jsonLogic(logic, item, functions) for item in _as_array(array)],
+    "filter": lambda functions, array, logic: [item for item in _as_array(array) if jsonLogic(logic, item, functions)],
+    "reduce": lambda functions, array, logic, initial=0: reduce(lambda acc, curr: jsonLogic(logic, {"current": curr, "accumulator": acc}, functions), _as_array(array), initial),
+}
+
+
+def _index(key: str) -> Optional[int]:
+    """Índice numérico da chave, com as mesmas regras de _get_nested_value."""
+    if not key.lstrip("-").isdigit():
+        return None
+    try:
+        return int(key)
+    except ValueError:
+        return None
+
+
+class Node:
+    """
+    Nó base de uma regra compilada.
+
+    Os nós síncronos implementam `evaluate(data, functions)`; os assíncronos
+    (`is_async = True`), `evaluate_async(data, functions)`.
+    """
+
+    __slots__ = ()
+
+    # Nós assíncronos são avaliados com `await node.evaluate_async(...)`
+    is_async = False
+
+    def children(self) -> tuple:
+        return ()
+
+
+class Literal(Node):
+    """Valor constante (qualquer valor que não seja um dicionário de operação)."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def evaluate(self, data, functions):
+        return self.value
+
+
+class Var(Node):
+    """Acesso a um caminho fixo dos dados (ex: {"var": "usuario.nome"})."""
+
+    __slots__ = ("path", "keys", "not_found")
+
+    def __init__(self, path: Any, not_found: Any = None):
+        self.path = sys.intern(str(path))
+        # Cada chave é pré-processada como (chave, índice numérico ou None).
+        # As chaves são internadas para que regras diferentes compartilhem as strings.
+        self.keys = tuple((sys.intern(key), _index(key)) for key in self.path.split("."))
+        self.not_found = not_found
+
+    def evaluate(self, data, functions):
+        not_found = self.not_found
+        current = data
+        for key, index in self.keys:
+            if isinstance(current, dict):
+                current = current.get(key, not_found)
+            elif isinstance(current, (list, tuple)) and index is not None and index < len(current):
+                current = current[index]
+            else:
+                current = not_found
+        return current
+
+
+class DynamicVar(Node):
+    """Acesso a um caminho calculado por outra regra."""
+
+    __slots__ = ("args",)
+
+    def __init__(self, args: tuple):
+        self.args = args
+
+    def evaluate(self, data, functions):
+        return _var(data, *[arg.evaluate(data, functions) for arg in self.args])
+
+    def children(self):
+        return self.args
+
+    def as_async(self, args: tuple) -> Node:
+        return AsyncDynamicVar(args)
+
+
+def _var(data, a, not_found=None):
+    return _get_nested_value(a, data, not_found)
+
+
+class Operation(Node):
+    """Operação que não depende do contexto (comparação, lógica, matemática...)."""
+
+    __slots__ = ("op", "fn", "args")
+
+    def __init__(self, op: str, fn: Callable, args: tuple):
+        self.op = op
+        self.fn = fn
+        self.args = args
+
+    def evaluate(self, data, functions):
+        return self.fn(*[arg.evaluate(data, functions) for arg in self.args])
+
+    def children(self):
+        return self.args
+
+    def as_async(self, args: tuple) -> Node:
+        return AsyncOperation(self.op, self.fn, args)
+
+
+class UnaryOperation(Operation):
+    """Operação com um único argumento, avaliada sem criar listas."""
+
+    __slots__ = ()
+
+    def evaluate(self, data, functions):
+        return self.fn(self.args[0].evaluate(data, functions))
+
+
+class BinaryOperation(Operation):
+    """Operação com dois argumentos, avaliada sem criar listas."""
+
+    __slots__ = ()
+
+    def evaluate(self, data, functions):
+        left, right = self.args
+        return self.fn(left.evaluate(data, functions), right.evaluate(data, functions))
+
+
+class IterationOperation(Operation):
+    """Operação sobre arrays (some, map, filter...) que usa as funções registradas."""
+
+    __slots__ = ()
+
+    def evaluate(self, data, functions):
+        return self.fn(functions, *[arg.evaluate(data, functions) for arg in self.args])
+
+    def as_async(self, args: tuple) -> Node:
+        return AsyncIterationOperation(self.op, self.fn, args)
+
+
+def _resolve_function(functions: Dict[str, Callable], args: list) -> Callable:
+    """Valida os argumentos de "apply" e retorna a função registrada."""
+    if not args:
+        raise ValueError(
+            "A operação 'apply' requer pelo menos um argumento (o nome da função)."
+        )
+
+    func_name = args[0]
+    if func_name not in functions:
+        raise NameError(
+            f"Função pura não registrada ou não permitida: '{func_name}'"
+        )
+
+    return functions[func_name]
+
+
+def _apply_function(functions: Dict[str, Callable], args: list) -> Any:
+    """Executa uma função registrada; args[0] é o nome e o restante são os parâmetros."""
+    return _resolve_function(functions, args)(*args[1:])
+
+
+class Apply(Node):
+    """Chamada de uma função registrada (operação "apply")."""
+
+    __slots__ = ("args",)
+
+    def __init__(self, args: tuple):
+        self.args = args
+
+    def evaluate(self, data, functions):
+        return _apply_function(functions, [arg.evaluate(data, functions) for arg in self.args])
+
+    def children(self):
+        return self.args
+
+
+# Nós assíncronos: criados por _partition apenas no caminho até as funções
+# assíncronas. Os argumentos síncronos são avaliados diretamente.
+
+
+class AsyncNode(Node):
+    """Nó cuja subárvore chama funções assíncronas."""
+
+    __slots__ = ("args",)
+
+    is_async = True
+
+    def __init__(self, args: tuple):
+        self.args = args
+
+    def children(self):
+        return self.args
+
+
+class AsyncDynamicVar(AsyncNode):
+    """Versão assíncrona de DynamicVar."""
+
+    __slots__ = ()
+
+    async def evaluate_async(self, data, functions):
+        return _var(
+            data,
+            *[await arg.evaluate_async(data, functions) if arg.is_async else arg.evaluate(data, functions) for arg in self.args],
+        )
+
+
+class AsyncOperation(AsyncNode):
+    """Versão assíncrona de Operation (e de suas variantes unária e binária)."""
+
+    __slots__ = ("op", "fn")
+
+    def __init__(self, op: str, fn: Callable, args: tuple):
+        super().__init__(args)
+        self.op = op
+        self.fn = fn
+
+    async def evaluate_async(self, data, functions):
+        return self.fn(
+            *[await arg.evaluate_async(data, functions) if arg.is_async else arg.evaluate(data, functions) for arg in self.args]
+        )
+
+
+class AsyncIterationOperation(AsyncOperation):
+    """Versão assíncrona de IterationOperation."""
+
+    __slots__ = ()
+
+    async def evaluate_async(self, data, functions):
+        return self.fn(
+            functions,
+            *[await arg.evaluate_async(data, functions) if arg.is_async else arg.evaluate(data, functions) for arg in self.args],
+        )
+
+
+class AsyncApply(AsyncNode):
+    """Chamada de função registrada que pode ser assíncrona."""
+
+    __slots__ = ("async_functions",)
+
+    def __init__(self, args: tuple, async_functions: FrozenSet[str]):
+        super().__init__(args)
+        self.async_functions = async_functions
+
+    async def evaluate_async(self, data, functions):
+        args = [await arg.evaluate_async(data, functions) if arg.is_async else arg.evaluate(data, functions) for arg in self.args]
+        func = _resolve_function(functions, args)
+        if args[0] in self.async_functions:
+            return await func(*args[1:])
+        return func(*args[1:])
+
+
+def _partition(node: Node, async_functions: FrozenSet[str]) -> Node:
+    """
+    Substitui por nós assíncronos apenas os nós que alcançam funções assíncronas.
+
+    Subárvores síncronas são reaproveitadas da árvore original. Um `apply` com
+    nome de função calculado é considerado assíncrono.
+    """
+    args = tuple(_partition(child, async_functions) for child in node.children())
+    reaches_async = any(arg.is_async for arg in args)
+
+    if isinstance(node, Apply):
+        name = args[0].value if args and isinstance(args[0], Literal) else None
+        if reaches_async or (args and not isinstance(args[0], Literal)) or (isinstance(name, str) and name in async_functions):
+            return AsyncApply(args, async_functions)
+        return node
+
+    if not reaches_async:
+        return node
+    return node.as_async(args)
+
+
+class CompiledRule:
+    """
+    Regra compilada pronta para ser avaliada várias vezes.
+
+    Exemplo de uso:
+    ```python
+    regra = compile_logic({">": [{"var": "idade"}, 18]})
+    regra.evaluate({"idade": 30})  # True
+
+    regra = compile_logic({"and": [{">": [{"var": "idade"}, 18]}, {"apply": ["consultar_score", {"var": "cpf"}]}]})
+    await regra.evaluate_async(dados, funcoes)  # apenas o "and" e o "apply" são aguardados
+    ```
+    """
+
+    __slots__ = ("root", "function_names", "dynamic_apply", "_partitions")
+
+    def __init__(self, root: Node):
+        self.root = root
+        # Funções chamadas pela regra, usadas para particionar a árvore
+        names = set()
+        self.dynamic_apply = False
+        for node in walk(root):
+            if isinstance(node, Apply) and node.args:
+                if isinstance(node.args[0], Literal):
+                    names.add(node.args[0].value)
+                else:
+                    self.dynamic_apply = True
+        self.function_names = frozenset(name for name in names if isinstance(name, str))
+        self._partitions: Optional[Dict[FrozenSet[str], Node]] = None
+
+    def evaluate(
+        self,
+        data: Optional[Dict[str, Any]] = None,
+        functions: Optional[Dict[str, Callable]] = None,
+    ) -> Any:
+        data = data if data is not None else {}
+        functions = functions if functions is not None else {}
+        return self.root.evaluate(data, functions)
+
+    def async_root(self, async_functions: AbstractSet[str]) -> Node:
+        """
+        Árvore particionada para as funções assíncronas informadas.
+
+        As árvores são guardadas por conjunto de funções assíncronas chamadas
+        pela regra; sem nenhuma, a própria árvore síncrona é retornada.
+        """
+        if self.dynamic_apply:
+            key = frozenset(async_functions)
+        else:
+            key = self.function_names.intersection(async_functions)
+        if not key:
+            return self.root
+
+        if self._partitions is None:
+            self._partitions = {}
+        root = self._partitions.get(key)
+        if root is None:
+            root = self._partitions[key] = _partition(self.root, key)
+        return root
+
+    async def evaluate_async(
+        self,
+        data: Optional[Dict[str, Any]] = None,
+        functions: Optional[Dict[str, Callable]] = None,
+    ) -> Any:
+        """
+        Avalia a regra com suporte a funções assíncronas, como jsonLogicAsync.
+
+        Apenas o caminho até as funções assíncronas é aguardado; uma regra que não
+        chama funções assíncronas é avaliada inteiramente de forma síncrona.
+        """
+        data = data if data is not None else {}
+        functions = functions if functions is not None else {}
+        root = self.async_root(_async_function_names(functions))
+        if root.is_async:
+            return await root.evaluate_async(data, functions)
+        return root.evaluate(data, functions)
+
+    def __call__(self, data=None, functions=None):
+        return self.evaluate(data, functions)
+
+
+def _compile_node(tests: Any) -> Node:
+    if not isinstance(tests, dict) or not tests:
+        return Literal(tests)
+
+    op = next(iter(tests))
+    values = tests[op]
+    if not isinstance(values, (list, tuple)):
+        values = [values]
+
+    args = tuple(_compile_node(value) for value in values)
+
+    if op == "var":
+        if 1 <= len(args) <= 2 and all(isinstance(arg, Literal) for arg in args):
+            return Var(*(arg.value for arg in args))
+        return DynamicVar(args)
+
+    if op == "apply":
+        return Apply(args)
+
+    if op in _ITERATION_OPS:
+        return IterationOperation(op, _ITERATION_OPS[op], args)
+
+    if op not in _STATIC_OPERATIONS:
+        raise RuntimeError(f"Operação não reconhecida: {op}")
+
+    fn = _STATIC_OPERATIONS[op]
+    if len(args) == 1:
+        return UnaryOperation(op, fn, args)
+    if len(args) == 2:
+        return BinaryOperation(op, fn, args)
+    return Operation(op, fn, args)
+
+
+def compile_logic(tests: Any) -> CompiledRule:
+    """
+    Compila uma regra JSON Logic.
+
+    Args:
+        tests: Estrutura de testes JSON Logic
+
+    Returns:
+        Regra compilada com o mesmo comportamento de jsonLogic(tests, ...)
+
+    Raises:
+        RuntimeError: Se a regra usar uma operação não reconhecida
+    """
+    return CompiledRule(_compile_node(tests))
+
+
+def walk(node: Node) -> Iterator[Node]:
+    """Percorre todos os nós de uma árvore compilada (pré-ordem)."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        yield current
+        stack.extend(reversed(current.children()))
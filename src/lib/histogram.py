@@ -0,0 +1,121 @@
+"""
+Histograma de latência com buckets log-lineares (estilo HDR).
+
+Cada potência de dois é dividida em sub-buckets lineares, o que mantém o erro
+relativo de cada valor registrado abaixo de 2 ** -(precision_bits - 1)
+(~1,6% com o padrão de 7 bits) com memória fixa e pré-alocada.
+
+O registro não usa locks: é um único incremento em uma lista. Sob concorrência
+de threads, incrementos simultâneos no mesmo bucket podem raramente se perder,
+o que é aceitável para métricas de latência.
+"""
+
+import math
+from typing import Dict, List, Tuple
+
+
+class LatencyHistogram:
+    """
+    Histograma de latências em nanossegundos.
+
+    Exemplo de uso:
+    ```python
+    histograma = LatencyHistogram()
+    inicio = perf_counter_ns()
+    ...
+    histograma.record(perf_counter_ns() - inicio)
+    histograma.percentile(0.99)
+    ```
+    """
+
+    __slots__ = ("_precision_bits", "_half", "_counts", "_sum_ns")
+
+    def __init__(self, precision_bits: int = 7, max_value_bits: int = 40):
+        """
+        Args:
+            precision_bits: Bits de precisão de cada bucket (2**bits sub-buckets)
+            max_value_bits: Maior valor representável (2**bits ns, ~18 min para 40)
+        """
+        self._precision_bits = precision_bits
+        self._half = 1 << (precision_bits - 1)
+        size = (max_value_bits - precision_bits + 2) * self._half
+        self._counts: List[int] = [0] * size
+        self._sum_ns = 0
+
+    def _index(self, value: int) -> int:
+        bucket = value.bit_length() - self._precision_bits
+        if bucket <= 0:
+            return value
+        return bucket * self._half + (value >> bucket)
+
+    def _value_at(self, index: int) -> int:
+        """Maior valor equivalente ao bucket `index`."""
+        bucket = index // self._half - 1
+        if bucket <= 0:
+            return index
+        sub = index - bucket * self._half
+        return ((sub + 1) << bucket) - 1
+
+    def record(self, value_ns: int):
+        """Registra uma latência em nanossegundos (valores negativos contam como 0)."""
+        if value_ns < 0:
+            value_ns = 0
+        counts = self._counts
+        index = self._index(value_ns)
+        if index >= len(counts):
+            index = len(counts) - 1
+        counts[index] += 1
+        self._sum_ns += value_ns
+
+    def reset(self) -> "LatencyHistogram":
+        """
+        Zera o histograma e retorna uma cópia com os valores anteriores.
+
+        A troca é feita substituindo a lista de contagens, sem bloquear
+        quem estiver registrando valores.
+        """
+        previous = LatencyHistogram.__new__(LatencyHistogram)
+        previous._precision_bits = self._precision_bits
+        previous._half = self._half
+        previous._counts, self._counts = self._counts, [0] * len(self._counts)
+        previous._sum_ns, self._sum_ns = self._sum_ns, 0
+        return previous
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    def _non_empty(self) -> List[Tuple[int, int]]:
+        return [(index, count) for index, count in enumerate(self._counts) if count]
+
+    def percentile(self, quantile: float) -> int:
+        """Retorna a latência (ns) do quantil informado (ex: 0.99), ou 0 se vazio."""
+        buckets = self._non_empty()
+        total = sum(count for _, count in buckets)
+        if not total:
+            return 0
+
+        target = max(1, math.ceil(quantile * total))
+        seen = 0
+        for index, count in buckets:
+            seen += count
+            if seen >= target:
+                return self._value_at(index)
+        return self._value_at(buckets[-1][0])
+
+    def summary(self) -> Dict[str, float]:
+        """Resumo com contagem, média, mínimo, máximo e percentis p50/p99/p999."""
+        buckets = self._non_empty()
+        total = sum(count for _, count in buckets)
+        if not total:
+            return {"count": 0, "mean_ns": 0.0, "min_ns": 0, "max_ns": 0, "p50_ns": 0, "p99_ns": 0, "p999_ns": 0}
+
+        return {
+            "count": total,
+            "mean_ns": self._sum_ns / total,
+            "min_ns": self._value_at(buckets[0][0]),
+            "max_ns": self._value_at(buckets[-1][0]),
+            "p50_ns": self.percentile(0.5),
+            "p99_ns": self.percentile(0.99),
+            "p999_ns": self.percentile(0.999),
+        }
@@ -0,0 +1,296 @@
+"""
+Instrumentação opcional dos avaliadores JSON Logic.
+
+Quando habilitada, registra por operação e por função registrada (apply) o
+número de chamadas, o tempo acumulado, o tempo próprio (sem os filhos) e as
+chamadas que terminaram com exceção.
+
+A instrumentação não tem custo quando desabilitada: `enable_profiling` troca
+as funções de avaliação de `json_logic` e os métodos `evaluate` e
+`evaluate_async` dos nós compilados por versões instrumentadas, e `disable_profiling` restaura as
+originais.
+
+Exemplo de uso:
+```python
+from lib.instrumentation import enable_profiling, disable_profiling
+
+profiler = enable_profiling()
+jsonLogic(regra, dados, funcoes)
+print(profiler.to_json())
+disable_profiling()
+```
+"""
+
+import json
+import threading
+from contextvars import ContextVar
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Optional
+
+from . import compiler, json_logic
+
+_current_frame: ContextVar = ContextVar("jsonlogic_profiler_frame", default=None)
+
+
+class OperationStats:
+    """Estatísticas acumuladas de uma operação ou função."""
+
+    __slots__ = ("calls", "total_ns", "self_ns", "errors")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.self_ns = 0
+        self.errors = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "total_ns": self.total_ns,
+            "self_ns": self.self_ns,
+            "mean_ns": self.total_ns / self.calls if self.calls else 0.0,
+            "errors": self.errors,
+        }
+
+
+class _Measurement:
+    """Mede uma chamada; o tempo dos filhos é descontado do tempo próprio."""
+
+    __slots__ = ("profiler", "stats", "children_ns", "token", "start")
+
+    def __init__(self, profiler: "Profiler", stats: OperationStats):
+        self.profiler = profiler
+        self.stats = stats
+        self.children_ns = 0
+
+    def __enter__(self):
+        self.token = _current_frame.set(self)
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = perf_counter_ns() - self.start
+        _current_frame.reset(self.token)
+        parent = _current_frame.get()
+        if parent is not None:
+            parent.children_ns += elapsed
+        self.profiler._record(self.stats, elapsed, elapsed - self.children_ns, exc_type is not None)
+        return False
+
+
+class Profiler:
+    """Coleta as estatísticas por operação e por função registrada."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._operations: Dict[str, OperationStats] = {}
+        self._functions: Dict[str, OperationStats] = {}
+
+    def measure_operation(self, op: str) -> _Measurement:
+        return _Measurement(self, self._get_stats(self._operations, op))
+
+    def measure_function(self, name: Any) -> _Measurement:
+        return _Measurement(self, self._get_stats(self._functions, str(name)))
+
+    def _get_stats(self, table: Dict[str, OperationStats], key: str) -> OperationStats:
+        stats = table.get(key)
+        if stats is None:
+            with self._lock:
+                stats = table.setdefault(key, OperationStats())
+        return stats
+
+    def _record(self, stats: OperationStats, total_ns: int, self_ns: int, failed: bool):
+        with self._lock:
+            stats.calls += 1
+            stats.total_ns += total_ns
+            stats.self_ns += self_ns
+            if failed:
+                stats.errors += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Retorna uma cópia serializável das estatísticas."""
+        with self._lock:
+            return {
+                "operations": {op: s.as_dict() for op, s in self._operations.items()},
+                "functions": {name: s.as_dict() for name, s in self._functions.items()},
+            }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.snapshot(), **kwargs)
+
+    def reset(self):
+        with self._lock:
+            self._operations.clear()
+            self._functions.clear()
+
+
+_active: Optional[Profiler] = None
+_originals: Dict[Any, Callable] = {}
+
+
+def get_profiler() -> Optional[Profiler]:
+    """Retorna o profiler ativo, ou None se a instrumentação estiver desabilitada."""
+    return _active
+
+
+# Avaliadores originais, usados se a instrumentação for desabilitada durante
+# uma avaliação em andamento
+_execute_operation = json_logic._execute_operation
+_execute_operation_async = json_logic._execute_operation_async
+_apply_evaluate = compiler.Apply.evaluate
+_async_apply_evaluate = compiler.AsyncApply.evaluate_async
+
+
+def _profiled_execute_operation(op, values, data, functions, operations):
+    profiler = _active
+    if profiler is None:
+        return _execute_operation(op, values, data, functions, operations)
+    with profiler.measure_operation(op):
+        if op not in operations:
+            raise RuntimeError(f"Operação não reconhecida: {op}")
+
+        if not isinstance(values, (list, tuple)):
+            values = [values]
+
+        args = [json_logic.jsonLogic(val, data, functions) for val in values]
+        if op == "apply" and args:
+            with profiler.measure_function(args[0]):
+                return operations[op](*args)
+        return operations[op](*args)
+
+
+async def _profiled_execute_operation_async(op, values, data, functions, operations, plan):
+    profiler = _active
+    if profiler is None:
+        return await _execute_operation_async(op, values, data, functions, operations, plan)
+    with profiler.measure_operation(op):
+        if op not in operations:
+            raise RuntimeError(f"Operação não reconhecida: {op}")
+
+        if not isinstance(values, (list, tuple)):
+            values = [values]
+
+        args = []
+        for val in values:
+            if id(val) in plan.nodes:
+                args.append(await json_logic._evaluate_async(val, data, functions, plan))
+            else:
+                args.append(json_logic.jsonLogic(val, data, functions))
+
+        operation_func = operations[op]
+        if op != "apply":
+            return operation_func(*args)
+        if not args:
+            return await operation_func(*args)
+        with profiler.measure_function(args[0]):
+            return await operation_func(*args)
+
+
+def _profiled_node_evaluate(original: Callable, label: Optional[str]) -> Callable:
+    def evaluate(self, data, functions):
+        profiler = _active
+        if profiler is None:
+            return original(self, data, functions)
+        with profiler.measure_operation(label or self.op):
+            return original(self, data, functions)
+
+    return evaluate
+
+
+def _profiled_apply_evaluate(self, data, functions):
+    profiler = _active
+    if profiler is None:
+        return _apply_evaluate(self, data, functions)
+    with profiler.measure_operation("apply"):
+        args = [arg.evaluate(data, functions) for arg in self.args]
+        func = compiler._resolve_function(functions, args)
+        with profiler.measure_function(args[0]):
+            return func(*args[1:])
+
+
+def _profiled_node_evaluate_async(original: Callable, label: Optional[str]) -> Callable:
+    async def evaluate_async(self, data, functions):
+        profiler = _active
+        if profiler is None:
+            return await original(self, data, functions)
+        with profiler.measure_operation(label or self.op):
+            return await original(self, data, functions)
+
+    return evaluate_async
+
+
+async def _profiled_async_apply_evaluate(self, data, functions):
+    profiler = _active
+    if profiler is None:
+        return await _async_apply_evaluate(self, data, functions)
+    with profiler.measure_operation("apply"):
+        args = [
+            await arg.evaluate_async(data, functions) if arg.is_async else arg.evaluate(data, functions)
+            for arg in self.args
+        ]
+        func = compiler._resolve_function(functions, args)
+        with profiler.measure_function(args[0]):
+            if args[0] in self.async_functions:
+                return await func(*args[1:])
+            return func(*args[1:])
+
+
+# Métodos dos nós compilados instrumentados e o rótulo usado (None = self.op)
+_NODE_LABELS = {
+    compiler.Var: "var",
+    compiler.DynamicVar: "var",
+    compiler.Operation: None,
+    compiler.UnaryOperation: None,
+    compiler.BinaryOperation: None,
+    compiler.IterationOperation: None,
+}
+
+# Nós assíncronos das regras compiladas particionadas (evaluate_async)
+_ASYNC_NODE_LABELS = {
+    compiler.AsyncDynamicVar: "var",
+    compiler.AsyncOperation: None,
+    compiler.AsyncIterationOperation: None,
+}
+
+
+def _patch(owner: Any, name: str, replacement: Callable):
+    _originals[(owner, name)] = vars(owner)[name]
+    setattr(owner, name, replacement)
+
+
+def enable_profiling(profiler: Optional[Profiler] = None) -> Profiler:
+    """
+    Habilita a instrumentação dos avaliadores.
+
+    Args:
+        profiler: Profiler que receberá as estatísticas (um novo é criado se omitido)
+
+    Returns:
+        O profiler ativo
+    """
+    global _active
+    profiler = profiler if profiler is not None else Profiler()
+    if _active is None:
+        _patch(json_logic, "_execute_operation", _profiled_execute_operation)
+        _patch(json_logic, "_execute_operation_async", _profiled_execute_operation_async)
+        for node_class, label in _NODE_LABELS.items():
+            _patch(node_class, "evaluate", _profiled_node_evaluate(node_class.__dict__["evaluate"], label))
+        _patch(compiler.Apply, "evaluate", _profiled_apply_evaluate)
+        for node_class, label in _ASYNC_NODE_LABELS.items():
+            _patch(
+                node_class,
+                "evaluate_async",
+                _profiled_node_evaluate_async(node_class.__dict__["evaluate_async"], label),
+            )
+        _patch(compiler.AsyncApply, "evaluate_async", _profiled_async_apply_evaluate)
+    _active = profiler
+    return profiler
+
+
+def disable_profiling():
+    """Desabilita a instrumentação e restaura os avaliadores originais."""
+    global _active
+    for (owner, name), original in _originals.items():
+        setattr(owner, name, original)
+    _originals.clear()
+    _active = None
@@ -1,7 +1,18 @@
 import sys
+import asyncio
 import inspect
+from contextvars import ContextVar
 from functools import reduce
-from typing import Any, Dict, Union, Optional, Callable, Awaitable
+from typing import AbstractSet, Any, Dict, NamedTuple, Set, Union, Optional, Callable, Awaitable
+
+from .registry import FunctionRegistry
+
+# Prazo (no relógio do event loop) da avaliação assíncrona em andamento.
+# Por ser uma ContextVar, é visto por todas as funções chamadas pela avaliação,
+# inclusive em tarefas criadas a partir dela.
+_deadline: ContextVar[Optional[float]] = ContextVar("jsonlogic_deadline", default=None)
+
+_NO_FALLBACK = object()
 
 
 def _get_nested_value(path: str, data: Dict[str, Any], not_found: Any = None) -> Any:
@@ -46,6 +57,93 @@ def _parse_operation(tests: Dict[str, Any]) -> tuple:
         return None, None
 
 
+def _less_than(*v):
+    """
+    Verifica se todos os valores em v estão em ordem crescente.
+    Retorna False se os tipos não forem comparáveis.
+    """
+    try:
+        return len(v) >= 2 and all(v[i] < v[i + 1] for i in range(len(v) - 1))
+    except TypeError:
+        return False
+
+
+def _less_than_or_equal(*v):
+    """
+    Verifica se todos os valores em v estão em ordem crescente ou igual.
+    Retorna False se os tipos não forem comparáveis.
+    """
+    try:
+        return len(v) >= 2 and all(v[i] <= v[i + 1] for i in range(len(v) - 1))
+    except TypeError:
+        return False
+
+
+# Operações que não dependem dos dados nem das funções registradas.
+# São definidas uma única vez e compartilhadas pelos avaliadores.
+
+# Operações de comparação
+_COMPARISON_OPS = {
+    "==": lambda a, b: a == b,
+    "===": lambda a, b: a is b,
+    "!=": lambda a, b: a != b,
+    "!==": lambda a, b: a is not b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+    "<": _less_than,
+    "<=": _less_than_or_equal,
+}
+
+# Operações lógicas
+_LOGICAL_OPS = {
+    "!": lambda a: not a,
+    "and": lambda *args: all(args),
+    "or": lambda *args: any(args),
+    "?:": lambda a, b, c: b if a else c,
+    # "if" é um alias comum para o operador ternário "?:"
+    "if": lambda a, b, c: b if a else c,
+}
+
+# Operações matemáticas
+_MATH_OPS = {
+    "+": lambda *args: sum(map(float, args)),
+    "-": lambda a, b=None: -a if b is None else a - b,
+    "*": lambda *args: reduce(lambda total, arg: total * float(arg), args, 1.0),
+    "/": lambda a, b=None: a if b is None else float(a) / float(b),
+    "%": lambda a, b: a % b,
+    "min": lambda *args: min(args),
+    "max": lambda *args: max(args),
+}
+
+# Operações de manipulação de dados que não dependem do contexto
+_COLLECTION_OPS = {
+    "in": lambda a, b: (
+        (a in b) if isinstance(b, (list, tuple, dict, str)) else False
+    ),
+    "count": lambda *args: sum(1 for a in args if a),
+    "merge": lambda *arrays: [item for array in arrays if isinstance(array, (list, tuple)) for item in array],
+}
+
+# Operações de string
+_STRING_OPS = {
+    "cat": lambda *args: "".join(map(str, args)),
+}
+
+# Operações de sistema que não dependem do contexto
+_SYSTEM_OPS = {
+    "log": lambda a: print(a, file=sys.stdout) or a,
+}
+
+_STATIC_OPERATIONS = {
+    **_COMPARISON_OPS,
+    **_LOGICAL_OPS,
+    **_MATH_OPS,
+    **_COLLECTION_OPS,
+    **_STRING_OPS,
+    **_SYSTEM_OPS,
+}
+
+
 def _execute_operation(
     op: str,
     values: Any,
@@ -78,23 +176,79 @@ def _execute_operation(
     return operations[op](*processed_values)
 
 
+def _async_function_names(functions: Dict[str, Callable]) -> AbstractSet[str]:
+    """
+    Nomes das funções assíncronas registradas.
+
+    Um FunctionRegistry já classifica as funções ao registrá-las; para um
+    dicionário comum, as funções são inspecionadas uma vez por avaliação.
+    """
+    if isinstance(functions, FunctionRegistry):
+        return functions.async_functions
+    return {name for name, func in functions.items() if inspect.iscoroutinefunction(func)}
+
+
+class _AsyncPlan(NamedTuple):
+    """Classificação síncrona/assíncrona de uma avaliação de jsonLogicAsync."""
+
+    functions: AbstractSet[str]  # nomes das funções assíncronas registradas
+    nodes: Set[int]  # ids das operações que podem chamar funções assíncronas
+
+
+def _mark_async_nodes(tests: Any, async_functions: AbstractSet[str], marked: Set[int]) -> bool:
+    """
+    Marca (por id) as operações cuja subárvore pode chamar funções assíncronas.
+
+    A regra é percorrida uma única vez por avaliação; as demais subárvores são
+    estaticamente síncronas. A marcação é conservadora: um `apply` com nome de
+    função calculado (não literal) é considerado assíncrono.
+
+    Returns:
+        True se a subárvore pode chamar funções assíncronas
+    """
+    if isinstance(tests, dict):
+        is_async = False
+        for op, values in tests.items():
+            if op == "apply":
+                name = values[0] if isinstance(values, (list, tuple)) and values else values
+                if isinstance(name, (dict, list)) or name in async_functions:
+                    is_async = True
+            if _mark_async_nodes(values, async_functions, marked):
+                is_async = True
+        if is_async:
+            marked.add(id(tests))
+        return is_async
+    if isinstance(tests, (list, tuple)):
+        is_async = False
+        for value in tests:
+            if _mark_async_nodes(value, async_functions, marked):
+                is_async = True
+        return is_async
+    return False
+
+
 async def _execute_operation_async(
     op: str,
     values: Any,
     data: Dict[str, Any],
     functions: Dict[str, Callable],
     operations: Dict[str, Callable],
+    plan: _AsyncPlan,
 ) -> Any:
     """
     Versão assíncrona de _execute_operation.
     Executa uma operação específica com os valores fornecidos de forma assíncrona.
 
+    Os valores que não chamam funções assíncronas são avaliados diretamente por
+    jsonLogic, sem criar corrotinas.
+
     Args:
         op: Nome da operação
         values: Valores para a operação
         data: Dados de contexto
         functions: Funções registradas
         operations: Dicionário de operações disponíveis
+        plan: Funções assíncronas e operações que podem chamá-las
 
     Returns:
         Resultado da operação
@@ -105,18 +259,18 @@ async def _execute_operation_async(
     if not isinstance(values, (list, tuple)):
         values = [values]
 
-    # Processa valores recursivamente de forma assíncrona
+    # Processa valores recursivamente, aguardando apenas as subárvores assíncronas
     processed_values = []
     for val in values:
-        result = await jsonLogicAsync(val, data, functions)
-        processed_values.append(result)
+        if id(val) in plan.nodes:
+            processed_values.append(await _evaluate_async(val, data, functions, plan))
+        else:
+            processed_values.append(jsonLogic(val, data, functions))
 
-    # Verifica se a operação é assíncrona
-    operation_func = operations[op]
-    if inspect.iscoroutinefunction(operation_func):
-        return await operation_func(*processed_values)
-    else:
-        return operation_func(*processed_values)
+    # "apply" é a única operação assíncrona
+    if op == "apply":
+        return await operations[op](*processed_values)
+    return operations[op](*processed_values)
 
 
 def jsonLogic(
@@ -201,26 +355,6 @@ def jsonLogic(
     if op is None:
         return tests
 
-    def _less_than(*v):
-        """
-        Verifica se todos os valores em v estão em ordem crescente.
-        Retorna False se os tipos não forem comparáveis.
-        """
-        try:
-            return len(v) >= 2 and all(v[i] < v[i + 1] for i in range(len(v) - 1))
-        except TypeError:
-            return False
-
-    def _less_than_or_equal(*v):
-        """
-        Verifica se todos os valores em v estão em ordem crescente ou igual.
-        Retorna False se os tipos não forem comparáveis.
-        """
-        try:
-            return len(v) >= 2 and all(v[i] <= v[i + 1] for i in range(len(v) - 1))
-        except TypeError:
-            return False
-
     def _apply_function(*args):
         """
         Executa uma função registrada.
@@ -267,93 +401,112 @@ def jsonLogic(
         else:
             return func(*args[1:])
 
-    # Define as operações suportadas organizadas por categoria
-
-    # Operações de comparação
-    comparison_ops = {
-        "==": lambda a, b: a == b,
-        "===": lambda a, b: a is b,
-        "!=": lambda a, b: a != b,
-        "!==": lambda a, b: a is not b,
-        ">": lambda a, b: a > b,
-        ">=": lambda a, b: a >= b,
-        "<": _less_than,
-        "<=": _less_than_or_equal,
-    }
-
-    # Operações lógicas
-    logical_ops = {
-        "!": lambda a: not a,
-        "and": lambda *args: all(args),
-        "or": lambda *args: any(args),
-        "?:": lambda a, b, c: b if a else c,
-    }
-
-    # Operações matemáticas
-    math_ops = {
-        "+": lambda *args: sum(map(float, args)),
-        "-": lambda a, b=None: -a if b is None else a - b,
-        "*": lambda *args: reduce(lambda total, arg: total * float(arg), args, 1.0),
-        "/": lambda a, b=None: a if b is None else float(a) / float(b),
-        "%": lambda a, b: a % b,
-        "min": lambda *args: min(args),
-        "max": lambda *args: max(args),
-    }
+    # Define as operações que dependem dos dados ou das funções registradas.
+    # As demais categorias estão em _STATIC_OPERATIONS.
 
     # Operações de manipulação de dados
     data_ops = {
         "var": lambda a, not_found=None: _get_nested_value(a, data, not_found),
-        "in": lambda a, b: (
-            (a in b) if isinstance(b, (list, tuple, dict, str)) else False
-        ),
-        "count": lambda *args: sum(1 for a in args if a),
         "some": lambda array, logic: any(jsonLogic(logic, item, functions) for item in (array if isinstance(array, (list, tuple)) else [])),
         "every": lambda array, logic: all(jsonLogic(logic, item, functions) for item in (array if isinstance(array, (list, tuple)) else [])),
         "none": lambda array, logic: not any(jsonLogic(logic, item, functions) for item in (array if isinstance(array, (list, tuple)) else [])),
-        "merge": lambda *arrays: [item for array in arrays if isinstance(array, (list, tuple)) for item in array],
         "map": lambda array, logic: [jsonLogic(logic, item, functions) for item in (array if isinstance(array, (list, tuple)) else [])],
         "filter": lambda array, logic: [item for item in (array if isinstance(array, (list, tuple)) else []) if jsonLogic(logic, item, functions)],
         "reduce": lambda array, logic, initial=0: reduce(lambda acc, curr: jsonLogic(logic, {"current": curr, "accumulator": acc}, functions), array if isinstance(array, (list, tuple)) else [], initial),
     }
 
-    # Operações de string
-    string_ops = {
-        "cat": lambda *args: "".join(map(str, args)),
-    }
-
     # Operações de sistema
     system_ops = {
-        "log": lambda a: print(a, file=sys.stdout) or a,
         "apply": _apply_function,
     }
 
     # Combina todas as operações
     operations = {
-        **comparison_ops,
-        **logical_ops,
-        **math_ops,
+        **_STATIC_OPERATIONS,
         **data_ops,
-        **string_ops,
         **system_ops,
     }
 
-    # "if" é um alias comum para o operador ternário "?:"
-    operations["if"] = operations["?:"]
-
     # Executa a operação
     return _execute_operation(op, values, data, functions, operations)
 
 
+def current_deadline() -> Optional[float]:
+    """
+    Prazo da avaliação assíncrona em andamento, no relógio do event loop
+    (loop.time()), ou None se a avaliação não tem prazo.
+    """
+    return _deadline.get()
+
+
+def remaining_time() -> Optional[float]:
+    """
+    Segundos restantes até o prazo da avaliação em andamento, ou None sem prazo.
+
+    Funções assíncronas registradas podem usá-lo para limitar suas próprias
+    chamadas externas:
+    ```python
+    async def buscar_score(cpf):
+        return await cliente.get(f"/score/{cpf}", timeout=remaining_time())
+    ```
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - asyncio.get_running_loop().time())
+
+
+async def _evaluate_with_deadline(
+    tests: Any,
+    data: Optional[Dict[str, Any]],
+    functions: Optional[Dict[str, Callable]],
+    timeout: Optional[float],
+    deadline: Optional[float],
+    fallback: Any,
+) -> Any:
+    """Avalia com prazo: cancela a avaliação quando o prazo vence."""
+    if timeout is not None:
+        limit = asyncio.get_running_loop().time() + timeout
+        deadline = limit if deadline is None else min(deadline, limit)
+
+    # Uma avaliação aninhada nunca estende o prazo de quem a chamou
+    outer = _deadline.get()
+    if outer is not None:
+        deadline = min(deadline, outer)
+
+    token = _deadline.set(deadline)
+    try:
+        async with asyncio.timeout_at(deadline) as scope:
+            return await jsonLogicAsync(tests, data, functions)
+    except TimeoutError:
+        # TimeoutError levantado por uma função (e não pelo prazo) é propagado
+        if fallback is _NO_FALLBACK or not scope.expired():
+            raise
+        return fallback
+    finally:
+        _deadline.reset(token)
+
+
 async def jsonLogicAsync(
     tests: Any,
     data: Optional[Dict[str, Any]] = None,
     functions: Optional[Dict[str, Callable]] = None,
+    *,
+    timeout: Optional[float] = None,
+    deadline: Optional[float] = None,
+    fallback: Any = _NO_FALLBACK,
 ) -> Any:
     """
     Versão assíncrona de jsonLogic.
     Executa a lógica definida em uma estrutura de testes (JSON/dict)
     sobre um conjunto de dados, com suporte a chamadas de funções assíncronas.
 
+    Com `timeout` (segundos) ou `deadline` (instante absoluto em loop.time()),
+    a avaliação é cancelada quando o prazo vence: as chamadas assíncronas em
+    andamento são canceladas e o resultado é `fallback`, ou TimeoutError se
+    nenhum fallback for informado. O prazo fica disponível para as funções
+    registradas por meio de current_deadline() e remaining_time().
+
     Exemplo de uso:
     ```python
     import asyncio
@@ -431,40 +584,41 @@ async def jsonLogicAsync(
         print(f"A área é maior que 40? {area_e_grande}")
 
     # Para executar: asyncio.run(main())
+
+    # Com prazo de 50 ms e resultado padrão em caso de estouro
+    area_e_grande = await jsonLogicAsync(regra_area, dados, funcoes_permitidas, timeout=0.05, fallback=False)
     ```
     """
 
+    if timeout is not None or deadline is not None:
+        return await _evaluate_with_deadline(tests, data, functions, timeout, deadline, fallback)
+
     if not isinstance(tests, dict):
         return tests
 
     data = data if data is not None else {}
     functions = functions if functions is not None else {}
 
+    # Regras que não chamam funções assíncronas são avaliadas sem corrotinas
+    plan = _AsyncPlan(_async_function_names(functions), set())
+    if not plan.functions or not _mark_async_nodes(tests, plan.functions, plan.nodes):
+        return jsonLogic(tests, data, functions)
+
+    return await _evaluate_async(tests, data, functions, plan)
+
+
+async def _evaluate_async(
+    tests: Any,
+    data: Dict[str, Any],
+    functions: Dict[str, Callable],
+    plan: _AsyncPlan,
+) -> Any:
+    """Avalia uma operação marcada por _mark_async_nodes."""
     # Extrai operação e valores
     op, values = _parse_operation(tests)
     if op is None:
         return tests
 
-    def _less_than(*v):
-        """
-        Verifica se todos os valores em v estão em ordem crescente.
-        Retorna False se os tipos não forem comparáveis.
-        """
-        try:
-            return len(v) >= 2 and all(v[i] < v[i + 1] for i in range(len(v) - 1))
-        except TypeError:
-            return False
-
-    def _less_than_or_equal(*v):
-        """
-        Verifica se todos os valores em v estão em ordem crescente ou igual.
-        Retorna False se os tipos não forem comparáveis.
-        """
-        try:
-            return len(v) >= 2 and all(v[i] <= v[i + 1] for i in range(len(v) - 1))
-        except TypeError:
-            return False
-
     async def _apply_function_async(*args):
         """
         Versão assíncrona de _apply_function.
@@ -482,103 +636,56 @@ async def jsonLogicAsync(
                 f"Função pura não registrada ou não permitida: '{func_name}'"
             )
 
-        # Obtém a função do registro
+        # Obtém a função do registro, já classificada como síncrona ou assíncrona
         func = functions[func_name]
-        
-        # Verifica se é uma função assíncrona
-        if inspect.iscoroutinefunction(func):
+        if func_name in plan.functions:
             return await func(*args[1:])
-        else:
-            return func(*args[1:])
-
-    # Define as operações suportadas organizadas por categoria
-
-    # Operações de comparação
-    comparison_ops = {
-        "==": lambda a, b: a == b,
-        "===": lambda a, b: a is b,
-        "!=": lambda a, b: a != b,
-        "!==": lambda a, b: a is not b,
-        ">": lambda a, b: a > b,
-        ">=": lambda a, b: a >= b,
-        "<": _less_than,
-        "<=": _less_than_or_equal,
-    }
-
-    # Operações lógicas
-    logical_ops = {
-        "!": lambda a: not a,
-        "and": lambda *args: all(args),
-        "or": lambda *args: any(args),
-        "?:": lambda a, b, c: b if a else c,
-    }
+        return func(*args[1:])
 
-    # Operações matemáticas
-    math_ops = {
-        "+": lambda *args: sum(map(float, args)),
-        "-": lambda a, b=None: -a if b is None else a - b,
-        "*": lambda *args: reduce(lambda total, arg: total * float(arg), args, 1.0),
-        "/": lambda a, b=None: a if b is None else float(a) / float(b),
-        "%": lambda a, b: a % b,
-        "min": lambda *args: min(args),
-        "max": lambda *args: max(args),
-    }
+    # Define as operações que dependem dos dados ou das funções registradas.
+    # As demais categorias estão em _STATIC_OPERATIONS.
 
     # Operações de manipulação de dados
     data_ops = {
         "var": lambda a, not_found=None: _get_nested_value(a, data, not_found),
-        "in": lambda a, b: (
-            (a in b) if isinstance(b, (list, tuple, dict, str)) else False
-        ),
-        "count": lambda *args: sum(1 for a in args if a),
         "some": lambda array, logic: any(jsonLogicAsync(logic, item, functions) for item in (array if isinstance(array, (list, tuple)) else [])),
         "every": lambda array, logic: all(jsonLogicAsync(logic, item, functions) for item in (array if isinstance(array, (list, tuple)) else [])),
         "none": lambda array, logic: not any(jsonLogicAsync(logic, item, functions) for item in (array if isinstance(array, (list, tuple)) else [])),
-        "merge": lambda *arrays: [item for array in arrays if isinstance(array, (list, tuple)) for item in array],
         "map": lambda array, logic: [jsonLogicAsync(logic, item, functions) for item in (array if isinstance(array, (list, tuple)) else [])],
         "filter": lambda array, logic: [item for item in (array if isinstance(array, (list, tuple)) else []) if jsonLogicAsync(logic, item, functions)],
         "reduce": lambda array, logic, initial=0: reduce(lambda acc, curr: jsonLogicAsync(logic, {"current": curr, "accumulator": acc}, functions), array if isinstance(array, (list, tuple)) else [], initial),
     }
 
-    # Operações de string
-    string_ops = {
-        "cat": lambda *args: "".join(map(str, args)),
-    }
-
     # Operações de sistema
     system_ops = {
-        "log": lambda a: print(a, file=sys.stdout) or a,
         "apply": _apply_function_async,  # Usa a versão assíncrona
     }
 
     # Combina todas as operações
     operations = {
-        **comparison_ops,
-        **logical_ops,
-        **math_ops,
+        **_STATIC_OPERATIONS,
         **data_ops,
-        **string_ops,
         **system_ops,
     }
 
-    # "if" é um alias comum para o operador ternário "?:"
-    operations["if"] = operations["?:"]
-
     # Executa a operação de forma assíncrona
-    return await _execute_operation_async(op, values, data, functions, operations)
+    return await _execute_operation_async(op, values, data, functions, operations, plan)
 
 
 def has_async_functions(functions: Dict[str, Callable]) -> bool:
     """
     Verifica se alguma das funções registradas é assíncrona.
-    
+
+    Com um FunctionRegistry, a classificação feita no registro é reaproveitada
+    e a verificação não depende do número de funções.
+
     Args:
         functions: Dicionário de funções registradas
         
     Returns:
         True se pelo menos uma função for assíncrona, False caso contrário
     """
-    return any(inspect.iscoroutinefunction(func) for func in functions.values())
+    return bool(_async_function_names(functions))
 
 
 def jsonLogicAuto(
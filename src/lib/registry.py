@@ -0,0 +1,600 @@
+"""
+Registro de funções com políticas de execução.
+
+`FunctionRegistry` é um dicionário de funções (pode ser passado diretamente
+como `functions` para jsonLogic, jsonLogicAsync e regras compiladas) em que
+cada função pode ser registrada com políticas aplicadas na própria chamada:
+
+- limite de concorrência: no máximo `max_concurrency` chamadas simultâneas de
+  uma função assíncrona; as demais aguardam em uma fila de até `max_queue`
+  chamadas e, com a fila cheia, falham imediatamente com
+  `FunctionOverloadedError` (load shedding);
+- coalescência (single-flight): chamadas idênticas de uma função assíncrona
+  feitas enquanto a primeira ainda está em andamento aguardam o mesmo
+  resultado, em vez de repetir a chamada;
+- memoização: os resultados de funções puras (síncronas ou assíncronas) são
+  guardados em um cache LRU limitado, com expiração opcional (TTL);
+- execução em threads: funções síncronas bloqueantes (I/O síncrono, sleep)
+  rodam em um pool limitado de threads, sem travar o event loop; passam a ser
+  funções assíncronas do registro.
+
+Exemplo de uso:
+```python
+funcoes = FunctionRegistry()
+funcoes.register("fetch_user", buscar_dados_usuario, coalesce=True, max_concurrency=50, max_queue=200)
+funcoes.register("score", calcular_score_risco, pure=True, cache_size=10_000, ttl=60)
+funcoes.register("consultar_cadastro", consultar_cadastro_legado, blocking=True)
+
+await jsonLogicAsync({"apply": ["fetch_user", {"var": "usuario_id"}]}, dados, funcoes)
+funcoes.stats()["fetch_user"]  # {"concurrency": {...}, "coalescing": {...}}
+```
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import AbstractSet, Any, Callable, Deque, Dict, Hashable, Optional, Set, Tuple
+
+
+class FunctionOverloadedError(RuntimeError):
+    """Chamada rejeitada: limite de concorrência atingido e fila cheia."""
+
+
+class ConcurrencyLimiter:
+    """
+    Limite de chamadas simultâneas com fila de espera limitada.
+
+    Diferente de asyncio.Semaphore, não fica associado a um event loop: os
+    contadores são compartilhados por todas as avaliações do processo que usam
+    o mesmo registro, desde que no mesmo thread.
+    """
+
+    __slots__ = ("name", "max_concurrency", "max_queue", "_active", "_waiters", "calls", "rejected", "max_queued")
+
+    def __init__(self, name: str, max_concurrency: int, max_queue: Optional[int] = None):
+        """
+        Args:
+            name: Nome da função registrada (usado nas mensagens de erro)
+            max_concurrency: Máximo de chamadas simultâneas
+            max_queue: Máximo de chamadas aguardando (None = fila ilimitada, 0 = sem fila)
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency deve ser maior que zero.")
+        if max_queue is not None and max_queue < 0:
+            raise ValueError("max_queue não pode ser negativo.")
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.calls = 0
+        self.rejected = 0
+        self.max_queued = 0
+
+    async def acquire(self):
+        self.calls += 1
+        if self._active < self.max_concurrency and not self._waiters:
+            self._active += 1
+            return
+
+        if self.max_queue is not None and len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            raise FunctionOverloadedError(
+                f"Função '{self.name}' sobrecarregada: {self._active} chamadas em andamento "
+                f"e fila cheia ({len(self._waiters)}/{self.max_queue})"
+            )
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.max_queued = max(self.max_queued, len(self._waiters))
+        try:
+            # release() repassa a vaga diretamente para o próximo da fila
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # A vaga foi repassada, mas a chamada foi cancelada em seguida
+                self.release()
+            elif waiter in self._waiters:
+                # Se release() já descartou o waiter cancelado, ele não está mais na fila
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self):
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    def wrap(self, func: Callable) -> Callable:
+        """Envolve uma função assíncrona com o limite."""
+
+        @functools.wraps(func)
+        async def limited(*args):
+            await self.acquire()
+            try:
+                return await func(*args)
+            finally:
+                self.release()
+
+        return limited
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "active": self._active,
+            "queued": len(self._waiters),
+            "max_queued": self.max_queued,
+            "calls": self.calls,
+            "rejected": self.rejected,
+        }
+
+
+# Tipos de argumento sempre com hash e sem conteúdo aninhado
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Versão imutável (e com hash) do valor, com o tipo de cada item.
+
+    Os tipos entram em todos os níveis, para que [1], [1.0] e [True] (que são
+    iguais entre si) gerem chaves diferentes.
+    """
+    if isinstance(value, dict):
+        return (dict, frozenset((_freeze(key), _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return (frozenset, frozenset(_freeze(item) for item in value))
+    return (type(value), value)
+
+
+def _make_key(args: Tuple) -> Hashable:
+    """
+    Chave de cache/coalescência para os argumentos de uma chamada.
+
+    Os tipos fazem parte da chave, inclusive dentro de listas, tuplas e
+    dicionários, para que f(1), f(1.0) e f(True) não se confundam. Argumentos
+    apenas escalares (o caso comum) usam uma chave direta, sem `_freeze`.
+    """
+    types = tuple(map(type, args))
+    if _SCALAR_TYPES.issuperset(types):
+        return (types, args)
+    return _freeze(args)
+
+
+class SingleFlight:
+    """
+    Coalescência de chamadas idênticas em andamento.
+
+    A primeira chamada com um conjunto de argumentos cria uma tarefa; as
+    chamadas idênticas feitas antes de ela terminar aguardam a mesma tarefa.
+    O cancelamento de um dos chamadores não cancela a tarefa compartilhada.
+    """
+
+    __slots__ = ("name", "_in_flight", "calls", "coalesced")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def _finished(self, key: Hashable, future: asyncio.Future):
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            # Evita o aviso de exceção não lida quando todos os chamadores desistiram
+            future.exception()
+
+    def wrap(self, func: Callable) -> Callable:
+        """Envolve uma função assíncrona com a coalescência."""
+
+        @functools.wraps(func)
+        async def coalesced(*args):
+            self.calls += 1
+            key = _make_key(args)
+            future = self._in_flight.get(key)
+            if future is None:
+                future = asyncio.ensure_future(func(*args))
+                self._in_flight[key] = future
+                future.add_done_callback(functools.partial(self._finished, key))
+            else:
+                self.coalesced += 1
+            return await asyncio.shield(future)
+
+        return coalesced
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
+
+
+_MISSING = object()
+
+
+class MemoCache:
+    """
+    Cache LRU de resultados, com expiração opcional.
+
+    Exceções não são guardadas. As operações usam um lock, pois funções
+    síncronas podem ser avaliadas por várias threads ao mesmo tempo.
+    """
+
+    __slots__ = ("name", "max_size", "ttl", "_entries", "_lock", "hits", "misses", "evictions", "expirations")
+
+    def __init__(self, name: str, max_size: int = 1024, ttl: Optional[float] = None):
+        """
+        Args:
+            name: Nome da função registrada
+            max_size: Máximo de resultados guardados
+            ttl: Validade de cada resultado em segundos (None = sem expiração)
+        """
+        if max_size < 1:
+            raise ValueError("cache_size deve ser maior que zero.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl deve ser maior que zero.")
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Resultado guardado para a chave, ou _MISSING."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if self.ttl is None or time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return _MISSING
+
+    def put(self, key: Hashable, value: Any):
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def wrap(self, func: Callable) -> Callable:
+        """Envolve uma função síncrona ou assíncrona com o cache."""
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def memoized_async(*args):
+                key = _make_key(args)
+                value = self.get(key)
+                if value is _MISSING:
+                    value = await func(*args)
+                    self.put(key, value)
+                return value
+
+            return memoized_async
+
+        @functools.wraps(func)
+        def memoized(*args):
+            key = _make_key(args)
+            value = self.get(key)
+            if value is _MISSING:
+                value = func(*args)
+                self.put(key, value)
+            return value
+
+        return memoized
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class ThreadOffload:
+    """
+    Pool limitado de threads para funções síncronas bloqueantes.
+
+    As chamadas que encontram todas as threads ocupadas aguardam na fila do pool;
+    `saturated` conta essas chamadas e `max_queued` registra o maior tamanho da
+    fila, indicando quando o pool precisa de mais threads.
+    """
+
+    def __init__(self, max_workers: int = 8):
+        """
+        Args:
+            max_workers: Número máximo de threads do pool
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers deve ser maior que zero.")
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Os contadores são atualizados pelo event loop e pelas threads do pool
+        self._lock = threading.Lock()
+        self._running = 0
+        self._queued = 0
+        self.max_queued = 0
+        self.calls = 0
+        self.saturated = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="jsonlogic-blocking")
+            return self._executor
+
+    def _call(self, func: Callable, args: tuple) -> Any:
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    async def run(self, func: Callable, *args: Any) -> Any:
+        """Executa func(*args) em uma thread do pool e aguarda o resultado."""
+        executor = self._get_executor()
+        with self._lock:
+            self.calls += 1
+            if self._running + self._queued >= self.max_workers:
+                self.saturated += 1
+            self._queued += 1
+            self.max_queued = max(self.max_queued, self._queued)
+        # Equivalente a loop.run_in_executor, mantendo o Future do pool para
+        # saber se a chamada cancelada chegou a começar
+        future = executor.submit(self._call, func, args)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if future.cancel():
+                # Ainda na fila: não será executada
+                with self._lock:
+                    self._queued -= 1
+            raise
+
+    def wrap(self, func: Callable) -> Callable:
+        """Envolve uma função síncrona em uma função assíncrona executada no pool."""
+
+        @functools.wraps(func)
+        async def offloaded(*args):
+            return await self.run(func, *args)
+
+        return offloaded
+
+    def shutdown(self, wait: bool = True):
+        """Encerra as threads do pool (um novo pool é criado na próxima chamada)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "running": self._running,
+                "queued": self._queued,
+                "max_queued": self.max_queued,
+                "calls": self.calls,
+                "saturated": self.saturated,
+                "saturation": self._running / self.max_workers,
+            }
+
+
+class FunctionRegistry(dict):
+    """
+    Dicionário de funções registradas com políticas de execução por função.
+
+    Cada função é classificada como síncrona ou assíncrona uma única vez, ao ser
+    incluída no registro, para que os avaliadores não precisem inspecioná-la a
+    cada chamada (veja `async_functions`).
+
+    As funções registradas com `blocking=True` compartilham um único pool de
+    threads por registro, com até `max_blocking_workers` threads.
+    """
+
+    def __init__(self, functions: Optional[Dict[str, Callable]] = None, *, max_blocking_workers: int = 8):
+        super().__init__()
+        self._policies: Dict[str, Dict[str, Any]] = {}
+        self._async_functions: Set[str] = set()
+        self.max_blocking_workers = max_blocking_workers
+        self._offload: Optional[ThreadOffload] = None
+        for name, func in (functions or {}).items():
+            self.register(name, func)
+
+    # Alterações do dicionário mantêm a classificação síncrona/assíncrona
+
+    def __setitem__(self, name: str, func: Callable):
+        super().__setitem__(name, func)
+        # As políticas de um registro anterior não envolvem a nova função
+        self._policies.pop(name, None)
+        if inspect.iscoroutinefunction(func):
+            self._async_functions.add(name)
+        else:
+            self._async_functions.discard(name)
+
+    def __delitem__(self, name: str):
+        super().__delitem__(name)
+        self._async_functions.discard(name)
+        self._policies.pop(name, None)
+
+    def pop(self, name: str, *default: Any) -> Any:
+        if name not in self:
+            return super().pop(name, *default)
+        func = self[name]
+        del self[name]
+        return func
+
+    def popitem(self) -> Tuple[str, Callable]:
+        name, func = super().popitem()
+        self._async_functions.discard(name)
+        self._policies.pop(name, None)
+        return name, func
+
+    def setdefault(self, name: str, func: Optional[Callable] = None) -> Callable:
+        if name not in self:
+            self[name] = func
+        return self[name]
+
+    def update(self, *args: Any, **kwargs: Callable):
+        for name, func in dict(*args, **kwargs).items():
+            self[name] = func
+
+    def clear(self):
+        super().clear()
+        self._async_functions.clear()
+        self._policies.clear()
+
+    def copy(self) -> "FunctionRegistry":
+        """
+        Cópia rasa do registro.
+
+        As funções e suas políticas (limites, caches e o pool de threads) são
+        compartilhadas; incluir ou remover funções na cópia não altera o original.
+        """
+        copy = FunctionRegistry(max_blocking_workers=self.max_blocking_workers)
+        dict.update(copy, self)
+        copy._async_functions = set(self._async_functions)
+        copy._policies = dict(self._policies)
+        copy._offload = self._offload
+        return copy
+
+    @property
+    def async_functions(self) -> AbstractSet[str]:
+        """Nomes das funções assíncronas registradas (somente leitura)."""
+        return self._async_functions
+
+    def is_async(self, name: str) -> bool:
+        """Indica se a função registrada com este nome é assíncrona."""
+        return name in self._async_functions
+
+    def register(
+        self,
+        name: str,
+        func: Optional[Callable] = None,
+        *,
+        max_concurrency: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        coalesce: bool = False,
+        pure: bool = False,
+        cache_size: int = 1024,
+        ttl: Optional[float] = None,
+        blocking: bool = False,
+    ) -> Callable:
+        """
+        Registra uma função com as políticas de execução informadas.
+
+        Pode ser usado como decorador: `@funcoes.register("nome", max_concurrency=10)`.
+
+        Args:
+            name: Nome usado em {"apply": [name, ...]}
+            func: Função síncrona ou assíncrona
+            max_concurrency: Máximo de chamadas simultâneas (apenas funções assíncronas)
+            max_queue: Máximo de chamadas aguardando vaga (None = ilimitado)
+            coalesce: Compartilha o resultado de chamadas idênticas em andamento
+                (apenas funções assíncronas)
+            pure: Indica que a função é pura: seus resultados são memoizados
+            cache_size: Máximo de resultados memoizados (com pure=True)
+            ttl: Validade dos resultados memoizados em segundos (com pure=True)
+            blocking: Executa a função síncrona em uma thread do pool do registro;
+                a função registrada passa a ser assíncrona
+
+        Returns:
+            A função original, para uso como decorador
+        """
+        if func is None:
+            return lambda func: self.register(
+                name,
+                func,
+                max_concurrency=max_concurrency,
+                max_queue=max_queue,
+                coalesce=coalesce,
+                pure=pure,
+                cache_size=cache_size,
+                ttl=ttl,
+                blocking=blocking,
+            )
+
+        is_async = inspect.iscoroutinefunction(func)
+        if blocking and is_async:
+            raise ValueError(f"blocking só se aplica a funções síncronas: '{name}'")
+        if max_queue is not None and max_concurrency is None:
+            raise ValueError("max_queue exige max_concurrency.")
+        if (max_concurrency is not None or coalesce) and not (is_async or blocking):
+            raise ValueError(f"max_concurrency e coalesce só se aplicam a funções assíncronas: '{name}'")
+
+        policies: Dict[str, Any] = {}
+        wrapped = func
+        if blocking:
+            # Mais interno: as demais políticas tratam a função como assíncrona
+            if self._offload is None:
+                self._offload = ThreadOffload(self.max_blocking_workers)
+            policies["blocking"] = self._offload
+            wrapped = self._offload.wrap(wrapped)
+        if max_concurrency is not None:
+            policies["concurrency"] = ConcurrencyLimiter(name, max_concurrency, max_queue)
+            wrapped = policies["concurrency"].wrap(wrapped)
+        if coalesce:
+            # Por fora do limite: chamadas coalescidas não ocupam vagas
+            policies["coalescing"] = SingleFlight(name)
+            wrapped = policies["coalescing"].wrap(wrapped)
+        if pure:
+            # Mais externo: um acerto no cache não passa pelas demais políticas
+            policies["cache"] = MemoCache(name, cache_size, ttl)
+            wrapped = policies["cache"].wrap(wrapped)
+
+        self[name] = wrapped
+        self._policies[name] = policies
+        return func
+
+    def clear_caches(self):
+        """Descarta os resultados memoizados de todas as funções puras."""
+        for policies in self._policies.values():
+            if "cache" in policies:
+                policies["cache"].clear()
+
+    def shutdown(self, wait: bool = True):
+        """Encerra as threads do pool das funções bloqueantes."""
+        if self._offload is not None:
+            self._offload.shutdown(wait)
+
+    def stats(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Estatísticas de cada política, por função registrada com políticas."""
+        return {
+            name: {kind: policy.stats() for kind, policy in policies.items()}
+            for name, policies in self._policies.items()
+            if policies
+        }
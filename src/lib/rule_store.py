@@ -0,0 +1,151 @@
+"""
+Registro versionado de regras compiladas.
+
+Em vez de enviar a regra completa em cada requisição, o cliente envia a regra
+uma única vez (`put`) e recebe um identificador e uma versão; as avaliações
+seguintes referenciam a regra por `"<id>@<versão>"` (ou apenas `"<id>"`, para a
+versão mais recente). A regra fica residente na forma compilada, de modo que a
+requisição não paga o parse da regra nem a compilação.
+
+As versões são imutáveis: reenviar a mesma regra (mesmo conteúdo, em qualquer
+formatação) retorna a versão existente, e uma regra alterada ganha a próxima
+versão. Versões com o mesmo conteúdo, mesmo em identificadores diferentes,
+compartilham a regra compilada.
+
+Exemplo de uso:
+```python
+store = RuleStore()
+stored, created = store.put("idade_minima", {">=": [{"var": "idade"}, 18]})
+stored.ref                                     # "idade_minima@1"
+store.get("idade_minima@1").compiled.evaluate({"idade": 30})  # True
+```
+"""
+
+import hashlib
+import json
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from .compiler import CompiledRule, compile_logic
+
+LATEST = "latest"
+
+
+def rule_hash(rule: Any) -> str:
+    """Hash do conteúdo da regra, independente da formatação do JSON."""
+    text = json.dumps(rule, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def parse_ref(ref: str) -> Tuple[str, Optional[int]]:
+    """
+    Separa uma referência "<id>@<versão>" em (id, versão).
+
+    A versão é None para "<id>" ou "<id>@latest".
+
+    Raises:
+        ValueError: Se a versão não for um inteiro positivo
+    """
+    rule_id, separator, version = ref.rpartition("@")
+    if not separator:
+        return ref, None
+    if version == LATEST:
+        return rule_id, None
+    if not version.isdigit() or int(version) < 1:
+        raise ValueError(f"Versão inválida na referência '{ref}'.")
+    return rule_id, int(version)
+
+
+class StoredRule(NamedTuple):
+    """Uma versão de uma regra registrada."""
+
+    rule_id: str
+    version: int
+    rule: Any
+    compiled: CompiledRule
+    hash: str
+
+    @property
+    def ref(self) -> str:
+        return f"{self.rule_id}@{self.version}"
+
+
+class RuleStore:
+    """
+    Regras registradas por identificador, com todas as versões residentes.
+
+    As leituras (`get`) não usam lock; os registros são serializados.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versions: Dict[str, List[StoredRule]] = {}
+        # Regras compiladas por hash do conteúdo, compartilhadas entre versões
+        self._compiled: Dict[str, CompiledRule] = {}
+
+    def put(self, rule_id: str, rule: Any) -> Tuple[StoredRule, bool]:
+        """
+        Registra a regra como nova versão de `rule_id`.
+
+        Returns:
+            (versão registrada, True se a versão foi criada); se o conteúdo é
+            igual ao da versão mais recente, retorna essa versão e False
+
+        Raises:
+            ValueError: Se o identificador for vazio ou contiver "@"
+            RuntimeError: Se a regra usar uma operação não reconhecida
+        """
+        if not isinstance(rule_id, str) or not rule_id or "@" in rule_id:
+            raise ValueError("O identificador da regra deve ser um texto não vazio e sem '@'.")
+        content_hash = rule_hash(rule)
+        with self._lock:
+            versions = self._versions.get(rule_id, [])
+            if versions and versions[-1].hash == content_hash:
+                return versions[-1], False
+            compiled = self._compiled.get(content_hash)
+            if compiled is None:
+                compiled = compile_logic(rule)
+            stored = StoredRule(rule_id, len(versions) + 1, rule, compiled, content_hash)
+            self._compiled[content_hash] = compiled
+            # Uma nova lista é publicada de uma vez: leitores concorrentes veem a
+            # lista anterior ou a nova, nunca uma lista em construção
+            self._versions[rule_id] = versions + [stored]
+        return stored, True
+
+    def get(self, ref: str) -> StoredRule:
+        """
+        Busca a regra por "<id>@<versão>", "<id>@latest" ou "<id>".
+
+        Raises:
+            ValueError: Se a referência for inválida
+            KeyError: Se a regra ou a versão não existir
+        """
+        rule_id, version = parse_ref(ref)
+        versions = self._versions.get(rule_id)
+        if not versions:
+            raise KeyError(f"Regra '{rule_id}' não registrada.")
+        if version is None:
+            return versions[-1]
+        if version > len(versions):
+            raise KeyError(f"Versão {version} da regra '{rule_id}' não registrada.")
+        return versions[version - 1]
+
+    def versions(self, rule_id: str) -> List[StoredRule]:
+        """Versões registradas de `rule_id`, da mais antiga para a mais recente."""
+        versions = self._versions.get(rule_id)
+        if not versions:
+            raise KeyError(f"Regra '{rule_id}' não registrada.")
+        return list(versions)
+
+    def __contains__(self, rule_id: str) -> bool:
+        return rule_id in self._versions
+
+    def __len__(self):
+        return len(self._versions)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "rules": len(self._versions),
+            "versions": sum(len(versions) for versions in self._versions.values()),
+            "compiled": len(self._compiled),
+        }
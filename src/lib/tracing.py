@@ -0,0 +1,223 @@
+"""
+Modo de explicação (trace) para regras compiladas.
+
+`explain` avalia uma regra compilada registrando cada nó avaliado e seu valor
+em um `TraceBuffer`: um buffer circular pré-alocado, de capacidade fixa, que
+limita a memória usada pelo trace independentemente do tamanho da regra.
+
+`Sampler` seleciona 1 a cada N requisições para serem rastreadas, de modo que
+o trace pode ficar habilitado em produção sem afetar a vazão.
+
+`explain_async` faz o mesmo para regras que chamam funções assíncronas.
+
+Exemplo de uso:
+```python
+regra = compile_logic({"if": [{"<": [{"var": "idade"}, 18]}, "RECUSADO", "APROVADO"]})
+buffer = TraceBuffer(capacity=64)
+
+explain(regra, {"idade": 17}, buffer=buffer)
+for entrada in buffer.entries():
+    print("  " * entrada.depth, entrada.label, "=>", entrada.value)
+```
+"""
+
+import itertools
+from typing import AbstractSet, Any, Callable, Dict, List, NamedTuple, Optional
+
+from .compiler import (
+    Apply,
+    CompiledRule,
+    DynamicVar,
+    IterationOperation,
+    Literal,
+    Node,
+    Operation,
+    Var,
+    _apply_function,
+    _var,
+)
+from .json_logic import _async_function_names
+
+
+class TraceEntry(NamedTuple):
+    """Nó avaliado: profundidade na árvore, descrição e valor produzido."""
+
+    depth: int
+    label: str
+    value: Any
+
+
+def describe(node: Node) -> str:
+    """Descrição curta de um nó compilado."""
+    if isinstance(node, Literal):
+        return "literal"
+    if isinstance(node, Var):
+        return f"var {node.path}"
+    if isinstance(node, DynamicVar):
+        return "var"
+    if isinstance(node, Apply):
+        return "apply"
+    return node.op
+
+
+class TraceBuffer:
+    """
+    Buffer circular pré-alocado de nós avaliados.
+
+    Quando a capacidade é excedida, as entradas mais antigas são sobrescritas
+    e contabilizadas em `dropped`.
+    """
+
+    __slots__ = ("capacity", "_depths", "_nodes", "_values", "_written")
+
+    def __init__(self, capacity: int = 256):
+        if capacity < 1:
+            raise ValueError("A capacidade do TraceBuffer deve ser maior que zero.")
+        self.capacity = capacity
+        self._depths: List[int] = [0] * capacity
+        self._nodes: List[Optional[Node]] = [None] * capacity
+        self._values: List[Any] = [None] * capacity
+        self._written = 0
+
+    def record(self, depth: int, node: Node, value: Any):
+        index = self._written % self.capacity
+        self._depths[index] = depth
+        self._nodes[index] = node
+        self._values[index] = value
+        self._written += 1
+
+    @property
+    def dropped(self) -> int:
+        """Número de entradas sobrescritas desde o último clear()."""
+        return max(0, self._written - self.capacity)
+
+    def __len__(self) -> int:
+        return min(self._written, self.capacity)
+
+    def entries(self) -> List[TraceEntry]:
+        """Entradas em ordem de avaliação (da mais antiga para a mais recente)."""
+        size = len(self)
+        start = self._written - size
+        entries = []
+        for position in range(start, self._written):
+            index = position % self.capacity
+            entries.append(TraceEntry(self._depths[index], describe(self._nodes[index]), self._values[index]))
+        return entries
+
+    def clear(self):
+        """Esvazia o buffer liberando as referências aos valores registrados."""
+        for index in range(len(self)):
+            self._nodes[index] = None
+            self._values[index] = None
+        self._written = 0
+
+
+class Sampler:
+    """Seleciona 1 a cada `every` chamadas de should_sample()."""
+
+    __slots__ = ("every", "_counter")
+
+    def __init__(self, every: int):
+        if every < 1:
+            raise ValueError("A taxa de amostragem deve ser maior que zero.")
+        self.every = every
+        self._counter = itertools.count()
+
+    def should_sample(self) -> bool:
+        # next() em itertools.count é atômico no CPython
+        return next(self._counter) % self.every == 0
+
+
+def _combine(node: Node, data: Dict[str, Any], functions: Dict[str, Callable], values: list) -> Any:
+    """Valor de um nó com filhos, a partir dos valores já avaliados dos filhos."""
+    if isinstance(node, Apply):
+        return _apply_function(functions, values)
+    if isinstance(node, DynamicVar):
+        return _var(data, *values)
+    if isinstance(node, IterationOperation):
+        return node.fn(functions, *values)
+    if isinstance(node, Operation):
+        return node.fn(*values)
+    raise TypeError(f"Nó não suportado pelo trace: {type(node).__name__}")
+
+
+def _trace_node(node: Node, data: Dict[str, Any], functions: Dict[str, Callable], buffer: TraceBuffer, depth: int) -> Any:
+    if isinstance(node, (Literal, Var)):
+        value = node.evaluate(data, functions)
+    else:
+        values = [_trace_node(child, data, functions, buffer, depth + 1) for child in node.children()]
+        value = _combine(node, data, functions, values)
+
+    buffer.record(depth, node, value)
+    return value
+
+
+async def _trace_node_async(
+    node: Node,
+    data: Dict[str, Any],
+    functions: Dict[str, Callable],
+    async_functions: AbstractSet[str],
+    buffer: TraceBuffer,
+    depth: int,
+) -> Any:
+    if isinstance(node, (Literal, Var)):
+        value = node.evaluate(data, functions)
+    else:
+        values = [
+            await _trace_node_async(child, data, functions, async_functions, buffer, depth + 1)
+            for child in node.children()
+        ]
+        value = _combine(node, data, functions, values)
+        if isinstance(node, Apply) and values[0] in async_functions:
+            value = await value
+
+    buffer.record(depth, node, value)
+    return value
+
+
+def explain(
+    rule: CompiledRule,
+    data: Optional[Dict[str, Any]] = None,
+    functions: Optional[Dict[str, Callable]] = None,
+    buffer: Optional[TraceBuffer] = None,
+) -> Any:
+    """
+    Avalia uma regra compilada registrando cada nó avaliado no buffer.
+
+    Os nós são registrados depois de avaliados (filhos antes do pai), com a
+    profundidade de cada um na árvore.
+
+    Args:
+        rule: Regra compilada
+        data: Dados de contexto
+        functions: Funções registradas
+        buffer: Buffer que recebe o trace (um novo é criado se omitido)
+
+    Returns:
+        Resultado da regra, idêntico ao de rule.evaluate(data, functions)
+    """
+    data = data if data is not None else {}
+    functions = functions if functions is not None else {}
+    buffer = buffer if buffer is not None else TraceBuffer()
+    return _trace_node(rule.root, data, functions, buffer, 0)
+
+
+async def explain_async(
+    rule: CompiledRule,
+    data: Optional[Dict[str, Any]] = None,
+    functions: Optional[Dict[str, Callable]] = None,
+    buffer: Optional[TraceBuffer] = None,
+) -> Any:
+    """
+    Versão assíncrona de `explain`, para regras que chamam funções assíncronas.
+
+    As chamadas às funções assíncronas são aguardadas, e o trace registra os
+    mesmos nós que `explain` registraria.
+
+    Returns:
+        Resultado da regra, idêntico ao de rule.evaluate_async(data, functions)
+    """
+    data = data if data is not None else {}
+    functions = functions if functions is not None else {}
+    buffer = buffer if buffer is not None else TraceBuffer()
+    return await _trace_node_async(rule.root, data, functions, _async_function_names(functions), buffer, 0)
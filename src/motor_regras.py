@@ -1,63 +1,450 @@
-from lib.json_logic import jsonLogic
+import asyncio
+import threading
+from time import perf_counter_ns
+
+from lib.compiler import compile_logic
+from lib.histogram import LatencyHistogram
+from lib.tracing import Sampler, TraceBuffer, explain, explain_async
 from regras import REGRAS_VALIDACAO, REGRA_PROCESSAMENTO
-from acoes import ACOES_DISPONIVEIS, logar_erro_validacao
+from repositorio_regras import ConjuntoDeRegras
+from acoes import (
+    ACOES_DISPONIVEIS,
+    STATUS_ERRO_VALIDACAO,
+    STATUS_POR_DECISAO,
+    RegistroDeAcoes,
+    funcoes_com_decisao,
+    logar_erro_validacao,
+    normalizar_decisao,
+)
+
+ID_REGRA_PROCESSAMENTO = "processamento"
+
+# Fases em que as latências de cada regra são medidas
+FASE_VALIDACAO = "validacao"
+FASE_PROCESSAMENTO = "processamento"
+FASE_ACAO = "acao"
+
+
+def id_regra_validacao(indice):
+    """Identificador estável da regra de validação na posição `indice`."""
+    return f"validacao.{indice}"
+
+
+class ResultadoDecisao:
+    """
+    Resultado de uma execução do motor.
+
+    Mantém apenas uma referência aos dados da solicitação (sem cópia) e usa
+    __slots__ para que cada resultado ocupe poucos bytes.
+    """
+
+    __slots__ = ("dados", "decisao", "params", "status", "erro", "regras_disparadas", "trace")
+
+    def __init__(
+        self,
+        dados,
+        decisao=None,
+        status=None,
+        erro=None,
+        regras_disparadas=(),
+        trace=None,
+        params=None,
+    ):
+        self.dados = dados
+        # Nome da ação decidida; os parâmetros de uma decisão estruturada ficam em params
+        self.decisao = decisao
+        self.params = params
+        self.status = status
+        self.erro = erro
+        self.regras_disparadas = regras_disparadas
+        # {id_regra: [TraceEntry, ...]} quando a execução foi rastreada
+        self.trace = trace
+
+    def aplicar(self):
+        """Grava status_final e detalhe_erro nos dados da solicitação e os retorna."""
+        if self.status is not None:
+            self.dados["status_final"] = self.status
+        if self.erro is not None:
+            self.dados["detalhe_erro"] = self.erro
+        return self.dados
+
+    def __repr__(self):
+        return (
+            f"ResultadoDecisao(decisao={self.decisao!r}, params={self.params!r}, status={self.status!r}, "
+            f"erro={self.erro!r}, regras_disparadas={self.regras_disparadas!r})"
+        )
 
 
 class MotorDeRegrasCustom:
-    def __init__(self):
+    def __init__(
+        self,
+        amostragem_trace=None,
+        capacidade_trace=256,
+        regras_validacao=None,
+        regra_processamento=None,
+        funcoes=None,
+        outbox=None,
+        acoes=None,
+        repositorio=None,
+    ):
+        """
+        Args:
+            amostragem_trace: Rastreia 1 a cada N execuções (None desabilita)
+            capacidade_trace: Número máximo de nós registrados por regra rastreada
+            regras_validacao: Regras de validação (padrão: REGRAS_VALIDACAO)
+            regra_processamento: Regra de processamento (padrão: REGRA_PROCESSAMENTO)
+            funcoes: Funções disponíveis para as regras via "apply"; a função
+                "decisao" (montar_decisao) é acrescentada quando ausente
+            outbox: Outbox em que as ações são registradas (em disco) para
+                execução em segundo plano, em vez de executadas na decisão
+            acoes: Registro das ações por decisão (padrão: ACOES_DISPONIVEIS);
+                com um outbox, a drenagem passa a executar as ações deste registro
+            repositorio: RepositorioDeRegras com as regras "validacao.<n>" e
+                "processamento"; substitui regras_validacao e regra_processamento
+                e acompanha as recargas do repositório, que passa a recusar
+                versões sem a regra "processamento"
+        """
+        if regras_validacao is None:
+            regras_validacao = REGRAS_VALIDACAO
+        if regra_processamento is None:
+            regra_processamento = REGRA_PROCESSAMENTO
+        self._repositorio = repositorio
+        if repositorio is not None:
+            # Uma recarga sem a regra de processamento não é publicada
+            repositorio.exigir(ID_REGRA_PROCESSAMENTO)
+        else:
+            # As regras são compiladas uma única vez e reutilizadas em cada execução
+            regras = {
+                id_regra_validacao(indice): compile_logic(regra) for indice, regra in enumerate(regras_validacao)
+            }
+            regras[ID_REGRA_PROCESSAMENTO] = compile_logic(regra_processamento)
+            self._regras_fixas = ConjuntoDeRegras(0, regras, {})
+        self._funcoes = funcoes_com_decisao(funcoes)
+        if acoes is None:
+            self._acoes = ACOES_DISPONIVEIS
+        else:
+            self._acoes = acoes if isinstance(acoes, RegistroDeAcoes) else RegistroDeAcoes(acoes)
+            if outbox is not None:
+                # A drenagem do outbox precisa executar as mesmas ações do motor
+                outbox.vincular_acoes(self._acoes)
+        self._outbox = outbox
+        # Histogramas de latência por (id da regra, fase)
+        self._latencias = {}
+        self._amostrador = Sampler(amostragem_trace) if amostragem_trace else None
+        self._capacidade_trace = capacidade_trace
+        # Um buffer de trace pré-alocado por thread
+        self._trace_local = threading.local()
         print("Motor de Regras Customizado inicializado.")
 
-    def _validar_dados(self, dados):
-        """Executa as regras de validação."""
+    def _regras_atuais(self):
+        """
+        Conjunto de regras de uma decisão.
+
+        É lido uma única vez por decisão e repassado a todas as fases, para que
+        uma recarga do repositório no meio da decisão não misture duas versões.
+        """
+        if self._repositorio is not None:
+            return self._repositorio.atual
+        return self._regras_fixas
+
+    def _avaliar(self, regra_id, regra, dados, trace):
+        """Avalia a regra, registrando os nós avaliados em `trace` quando fornecido."""
+        if trace is None:
+            return regra.evaluate(dados, self._funcoes)
+
+        buffer = getattr(self._trace_local, "buffer", None)
+        if buffer is None:
+            buffer = self._trace_local.buffer = TraceBuffer(self._capacidade_trace)
+        buffer.clear()
+        resultado = explain(regra, dados, self._funcoes, buffer=buffer)
+        trace[regra_id] = buffer.entries()
+        return resultado
+
+    def _registrar_latencia(self, regra_id, fase, inicio):
+        """Registra o tempo decorrido desde `inicio` no histograma da regra/fase."""
+        histograma = self._latencias.get((regra_id, fase))
+        if histograma is None:
+            histograma = self._latencias.setdefault((regra_id, fase), LatencyHistogram())
+        histograma.record(perf_counter_ns() - inicio)
+
+    def obter_latencias(self, resetar=False):
+        """
+        Retorna as latências por regra e por fase.
+
+        O resultado tem o formato {id_regra: {fase: resumo}}, em que o resumo
+        traz count, mean_ns, min_ns, max_ns, p50_ns, p99_ns e p999_ns.
+        Com resetar=True os histogramas são zerados após a leitura.
+        """
+        latencias = {}
+        for (regra_id, fase), histograma in list(self._latencias.items()):
+            if resetar:
+                histograma = histograma.reset()
+            latencias.setdefault(regra_id, {})[fase] = histograma.summary()
+        return latencias
+
+    def _validar_dados(self, dados, regras, trace=None):
+        """
+        Executa as regras de validação.
+
+        Retorna uma tupla (id da regra que falhou, erro) ou (None, None).
+        """
         print("\n--- FASE DE VALIDAÇÃO ---")
-        for regra in REGRAS_VALIDACAO:
-            resultado = jsonLogic(regra, dados)
+        for regra_id, regra in regras.validacao:
+            inicio = perf_counter_ns()
+            resultado = self._avaliar(regra_id, regra, dados, trace)
+            self._registrar_latencia(regra_id, FASE_VALIDACAO, inicio)
             if resultado is not None:
                 # Se qualquer regra de validação retornar um erro, paramos.
                 print(f"Falha na validação: {resultado}")
-                return resultado
+                return regra_id, resultado
         print("Validação concluída com sucesso.")
-        return None
+        return None, None
 
-    def _processar_regras(self, dados):
+    def _processar_regras(self, dados, regras, trace=None):
         """Executa a regra principal de processamento."""
         print("\n--- FASE DE PROCESSAMENTO ---")
-        decisao = jsonLogic(REGRA_PROCESSAMENTO, dados)
+        inicio = perf_counter_ns()
+        decisao = self._avaliar(ID_REGRA_PROCESSAMENTO, regras[ID_REGRA_PROCESSAMENTO], dados, trace)
+        self._registrar_latencia(ID_REGRA_PROCESSAMENTO, FASE_PROCESSAMENTO, inicio)
         print(f"Resultado da avaliação da regra: '{decisao}'")
         return decisao
 
     def _executar_acao(self, decisao, dados):
-        """Chama a ação Python correspondente à decisão."""
+        """Chama a ação Python correspondente à decisão (uma Decisao normalizada)."""
         print("\n--- FASE DE AÇÃO ---")
-        # Procura a ação correspondente no dicionário
-        acao = ACOES_DISPONIVEIS.get(decisao)
-        if callable(acao):
-            acao(dados)
+        if self._outbox is not None:
+            # A ação é executada pela drenagem do outbox depois de estar em disco
+            inicio = perf_counter_ns()
+            self._outbox.registrar(decisao.acao, dados, decisao.params)
+            self._registrar_latencia(ID_REGRA_PROCESSAMENTO, FASE_ACAO, inicio)
+            return
+        if decisao.acao in self._acoes:
+            if self._acoes.assincrona(decisao.acao):
+                raise TypeError(f"A ação '{decisao.acao}' é assíncrona; use MotorDeRegrasAsync.")
+            inicio = perf_counter_ns()
+            self._acoes.executar(decisao.acao, dados, decisao.params)
+            self._registrar_latencia(ID_REGRA_PROCESSAMENTO, FASE_ACAO, inicio)
         else:
-            print(f"Nenhuma ação definida para a decisão '{decisao}'.")
+            print(f"Nenhuma ação definida para a decisão '{decisao.acao}'.")
 
-    def executar(self, dados_solicitacao):
-        """Orquestra todo o processo de decisão."""
+    def _iniciar_execucao(self, dados_solicitacao, explicar):
+        """Anuncia a execução e retorna o dicionário de trace (ou None)."""
         print(
             f"\n>>>> INICIANDO EXECUÇÃO PARA SOLICITAÇÃO ID: {dados_solicitacao['id']} <<<<"
         )
+        rastrear = explicar or (self._amostrador is not None and self._amostrador.should_sample())
+        return {} if rastrear else None
+
+    def _resultado_erro_validacao(self, dados_solicitacao, regra_com_erro, erro_validacao, trace):
+        """Age sobre o erro de validação e monta o resultado."""
+        inicio = perf_counter_ns()
+        logar_erro_validacao(dados_solicitacao, erro_validacao)
+        self._registrar_latencia(regra_com_erro, FASE_ACAO, inicio)
+        print("Execução interrompida devido a erro de validação.")
+        return ResultadoDecisao(
+            dados_solicitacao,
+            status=STATUS_ERRO_VALIDACAO,
+            erro=erro_validacao,
+            regras_disparadas=(regra_com_erro,),
+            trace=trace,
+        )
+
+    def _resultado_decisao(self, dados_solicitacao, decisao_final, trace):
+        """Age sobre a decisão do processamento e monta o resultado."""
+        decisao = normalizar_decisao(decisao_final)
+        self._executar_acao(decisao, dados_solicitacao)
+        return self._montar_resultado(dados_solicitacao, decisao, trace)
+
+    def _montar_resultado(self, dados_solicitacao, decisao, trace):
+        print(
+            f"\n>>>> EXECUÇÃO CONCLUÍDA PARA SOLICITAÇÃO ID: {dados_solicitacao['id']} <<<<"
+        )
+        return ResultadoDecisao(
+            dados_solicitacao,
+            decisao=decisao.acao,
+            params=decisao.params,
+            status=STATUS_POR_DECISAO.get(decisao.acao),
+            regras_disparadas=(ID_REGRA_PROCESSAMENTO,),
+            trace=trace,
+        )
+
+    def decidir(self, dados_solicitacao, explicar=False):
+        """
+        Orquestra todo o processo de decisão sem alterar dados_solicitacao.
+
+        Retorna um ResultadoDecisao que referencia os dados de entrada, de modo
+        que o chamador não precisa copiá-los para preservar a solicitação original.
+
+        Com explicar=True (ou quando a execução é sorteada pela amostragem de
+        trace), o resultado traz em `trace` os nós avaliados de cada regra.
+        """
+        trace = self._iniciar_execucao(dados_solicitacao, explicar)
+        regras = self._regras_atuais()
 
         # 1. Avaliar (Validação)
-        erro_validacao = self._validar_dados(dados_solicitacao)
+        regra_com_erro, erro_validacao = self._validar_dados(dados_solicitacao, regras, trace)
 
         # 2. Decidir / Agir (sobre a validação)
         if erro_validacao:
-            logar_erro_validacao(dados_solicitacao, erro_validacao)
-            print("Execução interrompida devido a erro de validação.")
-            return dados_solicitacao
+            return self._resultado_erro_validacao(dados_solicitacao, regra_com_erro, erro_validacao, trace)
 
         # 1. Avaliar (Processamento)
-        decisao_final = self._processar_regras(dados_solicitacao)
+        decisao_final = self._processar_regras(dados_solicitacao, regras, trace)
 
         # 3. Agir (sobre o processamento)
-        self._executar_acao(decisao_final, dados_solicitacao)
+        return self._resultado_decisao(dados_solicitacao, decisao_final, trace)
 
-        print(
-            f"\n>>>> EXECUÇÃO CONCLUÍDA PARA SOLICITAÇÃO ID: {dados_solicitacao['id']} <<<<"
-        )
-        return dados_solicitacao
+    def executar(self, dados_solicitacao):
+        """
+        Orquestra todo o processo de decisão.
+
+        Grava status_final (e detalhe_erro, em caso de falha de validação) em
+        dados_solicitacao e retorna o próprio dicionário. Use `decidir` para
+        obter o resultado sem alterar a entrada.
+        """
+        return self.decidir(dados_solicitacao).aplicar()
+
+
+class MotorDeRegrasAsync(MotorDeRegrasCustom):
+    """
+    Variante assíncrona do motor, para regras que chamam funções assíncronas.
+
+    As regras de validação de uma solicitação são avaliadas concorrentemente, de
+    modo que a latência da validação é a da regra mais lenta, e não a soma das
+    regras. O resultado é o mesmo da validação sequencial: vale o erro da
+    primeira regra (na ordem da lista) que falhar. Quando a regra i falha, as
+    regras posteriores são canceladas e apenas as anteriores são aguardadas.
+
+    Com um `despachante` (DespachanteDeAcoes), a ação da decisão é apenas
+    enfileirada e executada em micro-lotes, sem atrasar o retorno da decisão;
+    o despachante exige um event loop em execução e não pode ser combinado com
+    um outbox.
+    Com um outbox, o registro aguarda o fsync sem bloquear o event loop, e as
+    decisões concorrentes compartilham o mesmo fsync. Sem despachante nem
+    outbox, as ações assíncronas são aguardadas antes do retorno (o motor
+    síncrono as recusa com TypeError).
+    """
+
+    def __init__(self, *args, despachante=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if despachante is not None and self._outbox is not None:
+            # O despachante entrega as ações em memória: elas perderiam a durabilidade do outbox
+            raise ValueError("Use um despachante ou um outbox, não ambos.")
+        self._despachante = despachante
+
+    def _executar_acao(self, decisao, dados):
+        if self._despachante is None:
+            return super()._executar_acao(decisao, dados)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            raise RuntimeError(
+                "O despachante de ações exige um event loop em execução; use decidir_async."
+            ) from None
+        print("\n--- FASE DE AÇÃO ---")
+        inicio = perf_counter_ns()
+        self._despachante.enviar(decisao.acao, dados, decisao.params)
+        self._registrar_latencia(ID_REGRA_PROCESSAMENTO, FASE_ACAO, inicio)
+
+    async def _executar_acao_async(self, decisao, dados):
+        """
+        Como `_executar_acao`, aguardando as ações assíncronas e o registro no
+        outbox sem bloquear o event loop.
+        """
+        if self._outbox is not None:
+            print("\n--- FASE DE AÇÃO ---")
+            inicio = perf_counter_ns()
+            await self._outbox.registrar_async(decisao.acao, dados, decisao.params)
+            self._registrar_latencia(ID_REGRA_PROCESSAMENTO, FASE_ACAO, inicio)
+            return
+        if self._despachante is None and self._acoes.assincrona(decisao.acao):
+            print("\n--- FASE DE AÇÃO ---")
+            inicio = perf_counter_ns()
+            await self._acoes.executar(decisao.acao, dados, decisao.params)
+            self._registrar_latencia(ID_REGRA_PROCESSAMENTO, FASE_ACAO, inicio)
+            return
+        self._executar_acao(decisao, dados)
+
+    async def _avaliar_async(self, regra_id, regra, dados, trace):
+        """Avalia a regra, registrando os nós avaliados em `trace` quando fornecido."""
+        if trace is not None:
+            # Um buffer por regra: as regras de uma solicitação rodam concorrentemente
+            buffer = TraceBuffer(self._capacidade_trace)
+            resultado = await explain_async(regra, dados, self._funcoes, buffer=buffer)
+            trace[regra_id] = buffer.entries()
+            return resultado
+        return await regra.evaluate_async(dados, self._funcoes)
+
+    async def _validar_regra(self, regra_id, regra, dados, trace):
+        inicio = perf_counter_ns()
+        resultado = await self._avaliar_async(regra_id, regra, dados, trace)
+        self._registrar_latencia(regra_id, FASE_VALIDACAO, inicio)
+        return resultado
+
+    async def _validar_dados_async(self, dados, regras, trace=None):
+        """
+        Executa as regras de validação concorrentemente.
+
+        Retorna uma tupla (id da regra que falhou, erro) ou (None, None). Uma
+        exceção em uma regra é propagada se nenhuma regra anterior falhar.
+        """
+        print("\n--- FASE DE VALIDAÇÃO ---")
+        regras_validacao = regras.validacao
+        tarefas = [
+            asyncio.create_task(self._validar_regra(regra_id, regra, dados, trace))
+            for regra_id, regra in regras_validacao
+        ]
+        indices = {tarefa: indice for indice, tarefa in enumerate(tarefas)}
+        # Índice da primeira regra (na ordem da lista) que falhou até agora
+        primeira_falha = len(tarefas)
+        pendentes = set(tarefas)
+        try:
+            while pendentes:
+                concluidas, pendentes = await asyncio.wait(pendentes, return_when=asyncio.FIRST_COMPLETED)
+                for tarefa in concluidas:
+                    indice = indices[tarefa]
+                    if indice < primeira_falha and (tarefa.exception() is not None or tarefa.result() is not None):
+                        primeira_falha = indice
+                # As regras posteriores à primeira falha não mudam o resultado
+                for tarefa in tarefas[primeira_falha + 1:]:
+                    tarefa.cancel()
+                pendentes = {tarefa for tarefa in pendentes if indices[tarefa] < primeira_falha}
+        finally:
+            for tarefa in tarefas:
+                tarefa.cancel()
+            await asyncio.gather(*tarefas, return_exceptions=True)
+
+        if primeira_falha == len(tarefas):
+            print("Validação concluída com sucesso.")
+            return None, None
+
+        resultado = tarefas[primeira_falha].result()
+        print(f"Falha na validação: {resultado}")
+        return regras_validacao[primeira_falha][0], resultado
+
+    async def _processar_regras_async(self, dados, regras, trace=None):
+        """Executa a regra principal de processamento."""
+        print("\n--- FASE DE PROCESSAMENTO ---")
+        inicio = perf_counter_ns()
+        decisao = await self._avaliar_async(ID_REGRA_PROCESSAMENTO, regras[ID_REGRA_PROCESSAMENTO], dados, trace)
+        self._registrar_latencia(ID_REGRA_PROCESSAMENTO, FASE_PROCESSAMENTO, inicio)
+        print(f"Resultado da avaliação da regra: '{decisao}'")
+        return decisao
+
+    async def decidir_async(self, dados_solicitacao, explicar=False):
+        """Versão assíncrona de `decidir`, com a validação concorrente."""
+        trace = self._iniciar_execucao(dados_solicitacao, explicar)
+        regras = self._regras_atuais()
+
+        regra_com_erro, erro_validacao = await self._validar_dados_async(dados_solicitacao, regras, trace)
+        if erro_validacao:
+            return self._resultado_erro_validacao(dados_solicitacao, regra_com_erro, erro_validacao, trace)
+
+        decisao_final = await self._processar_regras_async(dados_solicitacao, regras, trace)
+        decisao = normalizar_decisao(decisao_final)
+        await self._executar_acao_async(decisao, dados_solicitacao)
+        return self._montar_resultado(dados_solicitacao, decisao, trace)
+
+    async def executar_async(self, dados_solicitacao):
+        """Versão assíncrona de `executar`."""
+        return (await self.decidir_async(dados_solicitacao)).aplicar()
@@ -0,0 +1,341 @@
+"""
+Outbox transacional das ações do motor.
+
+Em vez de executar a ação logo após a decisão (e perdê-la se o processo cair
+entre a decisão e o efeito colateral), o motor registra a decisão e a ação
+pendente em um log local, somente de acréscimo (JSON Lines). O registro só
+retorna depois que a linha está em disco; as gravações concorrentes
+compartilham um único fsync (group commit), de modo que a vazão de decisões não
+fica limitada a um fsync por decisão. `registrar_async` aguarda o fsync sem
+bloquear o event loop, para que as decisões concorrentes do motor assíncrono
+entrem no mesmo grupo.
+
+Uma thread de drenagem executa as ações registradas e acrescenta ao log uma
+confirmação para cada uma. Ações assíncronas são executadas até o fim, em um
+event loop próprio da drenagem, antes da confirmação; uma decisão sem ação no
+registro conta como falha e não é confirmada. Ao abrir o outbox, as ações sem
+confirmação (de uma execução anterior interrompida) são executadas novamente e
+o log é compactado. A entrega é "pelo menos uma vez": as ações devem ser
+idempotentes.
+
+O motor que usa o outbox com um registro de ações próprio (`acoes=...`) passa
+a executar as ações com esse registro; para que as ações reexecutadas na
+abertura também o usem, informe `executar=executor_de_acoes(acoes)`.
+
+Formato do log (uma linha por registro; "params" só aparece em decisões com
+parâmetros):
+    {"seq": 1, "decisao": "APROVADO", "dados": {...}, "params": {...}}
+    {"seq": 1, "confirmada": true}
+
+Exemplo de uso:
+```python
+with Outbox("dados/outbox.jsonl") as outbox:
+    motor = MotorDeRegrasCustom(outbox=outbox)
+    motor.executar(solicitacao)  # retorna com a ação em disco, antes de executá-la
+```
+"""
+
+import asyncio
+import inspect
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from acoes import ACOES_DISPONIVEIS, RegistroDeAcoes
+
+
+def executor_de_acoes(acoes: RegistroDeAcoes) -> Callable[[str, Dict[str, Any], Optional[Dict[str, Any]]], Any]:
+    """
+    Executor do outbox que executa as ações do registro `acoes`.
+
+    Retorna o resultado da ação: a corrotina de uma ação assíncrona é
+    executada pela drenagem antes da confirmação. Uma decisão sem ação no
+    registro levanta KeyError, para que a drenagem não a confirme.
+    """
+
+    def executar(decisao: str, dados: Dict[str, Any], params: Optional[Dict[str, Any]] = None):
+        if decisao not in acoes:
+            raise KeyError(f"Nenhuma ação definida para a decisão '{decisao}'.")
+        return acoes.executar(decisao, dados, params)
+
+    executar.acoes = acoes
+    return executar
+
+
+# Executor padrão: as ações de ACOES_DISPONIVEIS
+executar_acao_padrao = executor_de_acoes(ACOES_DISPONIVEIS)
+
+
+async def _aguardar(resultado):
+    return await resultado
+
+
+def _concluir(futuro: asyncio.Future, seq: int):
+    # O chamador pode ter desistido (cancelamento); a ação continua registrada
+    if not futuro.done():
+        futuro.set_result(seq)
+
+
+def ler_log(caminho: str) -> Tuple[Dict[int, Dict[str, Any]], int]:
+    """
+    Lê o log e retorna as entradas sem confirmação e o maior seq encontrado.
+
+    Uma última linha incompleta (gravação interrompida) é ignorada.
+    """
+    pendentes: Dict[int, Dict[str, Any]] = {}
+    ultimo_seq = 0
+    if not os.path.exists(caminho):
+        return pendentes, ultimo_seq
+    with open(caminho, encoding="utf-8") as arquivo:
+        for linha in arquivo:
+            try:
+                registro = json.loads(linha)
+            except json.JSONDecodeError:
+                continue
+            seq = registro["seq"]
+            ultimo_seq = max(ultimo_seq, seq)
+            if registro.get("confirmada"):
+                pendentes.pop(seq, None)
+            else:
+                pendentes[seq] = registro
+    return pendentes, ultimo_seq
+
+
+class Outbox:
+    """
+    Log de ações pendentes com group commit e drenagem em segundo plano.
+
+    `registrar` é seguro entre threads: cada chamada aguarda apenas o fsync do
+    grupo em que sua linha entrou. Somente ações já em disco são executadas.
+    """
+
+    def __init__(
+        self,
+        caminho: str,
+        executar: Optional[Callable[[str, Dict[str, Any], Optional[Dict[str, Any]]], Any]] = None,
+        janela_commit: float = 0.002,
+        drenar: bool = True,
+    ):
+        """
+        Args:
+            caminho: Arquivo do log (criado se não existir)
+            executar: Executa uma ação: executar(decisao, dados, params)
+                (padrão: ações de ACOES_DISPONIVEIS, via executor_de_acoes)
+            janela_commit: Tempo, em segundos, que o commit espera para agrupar
+                gravações concorrentes em um único fsync
+            drenar: Inicia a thread que executa as ações registradas
+        """
+        self.caminho = caminho
+        self.executar = executar if executar is not None else executar_acao_padrao
+        self.janela_commit = janela_commit
+
+        self._cond = threading.Condition()
+        # Ações escritas aguardando o fsync, e ações em disco aguardando execução
+        self._aguardando_fsync: Deque[Dict[str, Any]] = deque()
+        self._fila: Deque[Dict[str, Any]] = deque()
+        # Futuros de registrar_async aguardando o fsync: (seq, loop, futuro)
+        self._futuros: Deque[Tuple[int, asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._sujo = False
+        self._executando = False
+        self._encerrando = False
+        self.registradas = 0
+        self.confirmadas = 0
+        self.falhas = 0
+        self.fsyncs = 0
+
+        # Recuperação: as entradas sem confirmação voltam para a fila, e o log é
+        # reescrito apenas com elas
+        pendentes, self._seq = ler_log(caminho)
+        self._compactar([pendentes[seq] for seq in sorted(pendentes)])
+        self._fila.extend(pendentes[seq] for seq in sorted(pendentes))
+        self.reexecutadas = len(self._fila)
+        self._escrito = self._duravel = self._seq
+        self._arquivo = open(caminho, "a", encoding="utf-8")
+
+        self._commit = threading.Thread(target=self._loop_commit, name="outbox-commit", daemon=True)
+        self._commit.start()
+        self._drenagem = None
+        if drenar:
+            self._drenagem = threading.Thread(target=self._loop_drenagem, name="outbox-drenagem", daemon=True)
+            self._drenagem.start()
+
+    def vincular_acoes(self, acoes: RegistroDeAcoes):
+        """
+        Executa as ações com o registro `acoes` (o do motor que usa o outbox).
+
+        O executor padrão é trocado pelo do registro; um executor próprio, ou o
+        de outro registro, é recusado com ValueError, já que a drenagem
+        executaria ações diferentes das do motor.
+        """
+        if getattr(self.executar, "acoes", None) is acoes:
+            return
+        if self.executar is not executar_acao_padrao:
+            raise ValueError("O outbox já executa as ações com outro executor; use executar=executor_de_acoes(acoes).")
+        self.executar = executor_de_acoes(acoes)
+
+    def _compactar(self, pendentes: List[Dict[str, Any]]):
+        """Reescreve o log atomicamente com as entradas informadas."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.caminho)), exist_ok=True)
+        temporario = self.caminho + ".tmp"
+        with open(temporario, "w", encoding="utf-8") as arquivo:
+            for registro in pendentes:
+                arquivo.write(json.dumps(registro, ensure_ascii=False, default=str) + "\n")
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+        os.replace(temporario, self.caminho)
+
+    def _escrever(self, registro: Dict[str, Any]):
+        """Acrescenta uma linha ao log; exige self._cond."""
+        self._arquivo.write(json.dumps(registro, ensure_ascii=False, default=str) + "\n")
+        self._sujo = True
+        self._cond.notify_all()
+
+    def registrar(self, decisao: str, dados: Dict[str, Any], params: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Registra a ação pendente e aguarda até que ela esteja em disco.
+
+        Returns:
+            Número de sequência da ação no log
+        """
+        with self._cond:
+            seq = self._acrescentar(decisao, dados, params)
+            self._cond.wait_for(lambda: self._duravel >= seq)
+        return seq
+
+    async def registrar_async(
+        self, decisao: str, dados: Dict[str, Any], params: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """
+        Versão assíncrona de `registrar`: aguarda o fsync sem bloquear o event loop.
+
+        A linha é escrita na hora; a thread de commit conclui o futuro depois do
+        fsync do grupo, de modo que as decisões concorrentes de um mesmo event
+        loop compartilham o fsync.
+        """
+        loop = asyncio.get_running_loop()
+        futuro = loop.create_future()
+        with self._cond:
+            seq = self._acrescentar(decisao, dados, params)
+            self._futuros.append((seq, loop, futuro))
+        await futuro
+        return seq
+
+    def _acrescentar(self, decisao: str, dados: Dict[str, Any], params: Optional[Dict[str, Any]]) -> int:
+        """Escreve a ação pendente no log (ainda sem fsync); exige self._cond."""
+        if self._encerrando:
+            raise RuntimeError("Outbox encerrado.")
+        self._seq += 1
+        seq = self._seq
+        registro = {"seq": seq, "decisao": decisao, "dados": dados}
+        if params:
+            registro["params"] = params
+        self._escrever(registro)
+        self._escrito = seq
+        self._aguardando_fsync.append(registro)
+        self.registradas += 1
+        return seq
+
+    def _loop_commit(self):
+        """Group commit: um único fsync para todas as linhas escritas desde o anterior."""
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._sujo or self._encerrando)
+                if not self._sujo:
+                    return
+                encerrando = self._encerrando
+            if self.janela_commit and not encerrando:
+                # Deixa outras gravações entrarem no mesmo grupo
+                time.sleep(self.janela_commit)
+            with self._cond:
+                self._arquivo.flush()
+                self._sujo = False
+                alvo = self._escrito
+                descritor = self._arquivo.fileno()
+            os.fsync(descritor)
+            with self._cond:
+                self.fsyncs += 1
+                self._duravel = alvo
+                while self._aguardando_fsync and self._aguardando_fsync[0]["seq"] <= alvo:
+                    self._fila.append(self._aguardando_fsync.popleft())
+                while self._futuros and self._futuros[0][0] <= alvo:
+                    seq, loop, futuro = self._futuros.popleft()
+                    try:
+                        loop.call_soon_threadsafe(_concluir, futuro, seq)
+                    except RuntimeError:
+                        # O event loop do chamador já foi encerrado
+                        pass
+                self._cond.notify_all()
+
+    def _loop_drenagem(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._fila or self._encerrando)
+                if not self._fila:
+                    return
+                registro = self._fila.popleft()
+                self._executando = True
+            try:
+                resultado = self.executar(registro["decisao"], registro["dados"], registro.get("params"))
+                if inspect.isawaitable(resultado):
+                    # Ação assíncrona: só é confirmada depois de concluída
+                    asyncio.run(_aguardar(resultado))
+            except Exception as erro:
+                # Sem confirmação: a ação é executada novamente na próxima abertura
+                print(f"Falha ao executar a ação {registro['seq']} ({registro['decisao']}): {erro!r}")
+                with self._cond:
+                    self.falhas += 1
+                    self._executando = False
+                    self._cond.notify_all()
+                continue
+            with self._cond:
+                self._escrever({"seq": registro["seq"], "confirmada": True})
+                self.confirmadas += 1
+                self._executando = False
+
+    def aguardar_drenagem(self, timeout: Optional[float] = None) -> bool:
+        """Aguarda a execução de todas as ações registradas; False se o tempo esgotar."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not (self._aguardando_fsync or self._fila or self._executando),
+                timeout,
+            )
+
+    def fechar(self):
+        """
+        Encerra as threads e o arquivo.
+
+        As ações registradas que ainda não foram executadas continuam no log e
+        são executadas na próxima abertura.
+        """
+        with self._cond:
+            if self._encerrando:
+                return
+            self._encerrando = True
+            self._fila.clear()
+            self._cond.notify_all()
+        if self._drenagem is not None:
+            self._drenagem.join()
+        with self._cond:
+            self._cond.notify_all()
+        self._commit.join()
+        self._arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "registradas": self.registradas,
+                "confirmadas": self.confirmadas,
+                "reexecutadas": self.reexecutadas,
+                "falhas": self.falhas,
+                "pendentes": len(self._aguardando_fsync) + len(self._fila),
+                "fsyncs": self.fsyncs,
+            }
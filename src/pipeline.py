@@ -0,0 +1,432 @@
+"""
+Pipeline de estágios configurável.
+
+Generaliza as três fases fixas do motor (validação, processamento e ação) em
+uma lista de estágios:
+- `EstagioEnriquecimento`: chama uma função (síncrona ou assíncrona) com campos
+  do contexto e guarda o resultado no contexto, para os estágios seguintes;
+- `EstagioValidacao`: avalia uma regra; um resultado diferente de None
+  interrompe o pipeline com esse erro;
+- `EstagioPontuacao`: avalia uma regra e guarda o resultado em um campo;
+- `EstagioDecisao`: avalia a regra de decisão (nome da ação ou decisão
+  estruturada) e guarda a Decisao normalizada em "decisao";
+- `EstagioAcao`: executa a ação da decisão pelo registro de ações.
+
+Cada estágio declara os campos que lê (`le`) e os que escreve (`escreve`). Nos
+estágios de regra, os campos lidos são obtidos das variáveis da regra quando
+não informados. Com essas declarações o pipeline:
+- agrupa em níveis os estágios independentes entre si, que `executar_async`
+  executa concorrentemente;
+- pula, em uma nova execução (`anterior=`), os estágios cujas entradas não
+  mudaram, reaproveitando as saídas da execução anterior.
+
+O resultado é o mesmo da execução sequencial na ordem da lista: prevalece o
+erro da primeira validação que falhar, e o estágio de ação só é executado
+depois de todos os estágios anteriores.
+
+Exemplo de uso:
+```python
+pipeline = Pipeline([
+    EstagioEnriquecimento("bureau", "consultar_score", le=("cpf",), escreve="score_bureau"),
+    EstagioValidacao("idade", {"if": [{"<": [{"var": "idade"}, 18]}, "MENOR_DE_IDADE", None]}),
+    EstagioPontuacao("risco", {"+": [{"var": "score_bureau"}, {"var": "pontuacao_credito"}]}, escreve="risco"),
+    EstagioDecisao("decisao", {"if": [{">": [{"var": "risco"}, 1000]}, "APROVADO", "RECUSADO"]}),
+    EstagioAcao(),
+], funcoes=funcoes)
+
+resultado = await pipeline.executar_async(solicitacao)
+resultado = await pipeline.executar_async(solicitacao_alterada, anterior=resultado)
+```
+"""
+
+import asyncio
+import inspect
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Union
+
+from acoes import (
+    ACOES_DISPONIVEIS,
+    RegistroDeAcoes,
+    funcoes_com_decisao,
+    normalizar_decisao,
+)
+from lib.compiler import CompiledRule, DynamicVar, Var, compile_logic, walk
+from regras import REGRAS_VALIDACAO, REGRA_PROCESSAMENTO
+
+CAMPO_DECISAO = "decisao"
+
+# Campo ausente do contexto, distinto de um campo com valor None
+_AUSENTE = object()
+
+
+def campos_lidos(regra: CompiledRule) -> Optional[FrozenSet[str]]:
+    """
+    Campos de primeiro nível do contexto lidos pela regra.
+
+    Retorna None quando não é possível determiná-los (variável com caminho
+    calculado ou acesso ao contexto inteiro): o estágio lê todos os campos.
+    """
+    campos = set()
+    for no in walk(regra.root):
+        if isinstance(no, DynamicVar):
+            return None
+        if isinstance(no, Var):
+            if not no.path:
+                return None
+            campos.add(no.keys[0][0])
+    return frozenset(campos)
+
+
+class FalhaValidacao(Exception):
+    """Erro retornado por um estágio de validação; interrompe o pipeline."""
+
+    def __init__(self, estagio: str, erro: Any):
+        super().__init__(f"{estagio}: {erro}")
+        self.estagio = estagio
+        self.erro = erro
+
+
+class Estagio(ABC):
+    """
+    Estágio do pipeline.
+
+    Subclasses implementam `executar` (e, se necessário, `executar_async`),
+    retornando um dicionário com os campos escritos.
+    """
+
+    # O estágio depende de todos os anteriores (ex: efeitos colaterais)
+    barreira = False
+
+    def __init__(self, nome: str, le: Optional[Iterable[str]] = None, escreve: Iterable[str] = ()):
+        """
+        Args:
+            nome: Identificador do estágio no pipeline
+            le: Campos do contexto lidos pelo estágio (None: todos)
+            escreve: Campos do contexto escritos pelo estágio
+        """
+        self.nome = nome
+        self.le = frozenset(le) if le is not None else None
+        self.escreve = frozenset(escreve)
+
+    @abstractmethod
+    def executar(self, contexto: Dict[str, Any], funcoes: Dict[str, Callable]) -> Dict[str, Any]:
+        """Executa o estágio e retorna os campos escritos."""
+
+    async def executar_async(self, contexto: Dict[str, Any], funcoes: Dict[str, Callable]) -> Dict[str, Any]:
+        return self.executar(contexto, funcoes)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.nome!r})"
+
+
+class EstagioEnriquecimento(Estagio):
+    """Chama uma função com os campos lidos e guarda o resultado no contexto."""
+
+    def __init__(self, nome: str, funcao: Union[str, Callable], le: Iterable[str], escreve: str):
+        """
+        Args:
+            funcao: Função ou nome de uma função do pipeline; recebe os valores
+                dos campos de `le`, na ordem informada
+            le: Campos passados como argumentos
+            escreve: Campo em que o resultado é guardado
+        """
+        self.argumentos = tuple(le)
+        super().__init__(nome, self.argumentos, (escreve,))
+        self.funcao = funcao
+        self.campo = escreve
+
+    def _chamar(self, contexto, funcoes):
+        funcao = funcoes[self.funcao] if isinstance(self.funcao, str) else self.funcao
+        return funcao(*(contexto.get(campo) for campo in self.argumentos))
+
+    def executar(self, contexto, funcoes):
+        resultado = self._chamar(contexto, funcoes)
+        if inspect.isawaitable(resultado):
+            if inspect.iscoroutine(resultado):
+                resultado.close()
+            raise TypeError(f"O estágio '{self.nome}' chama uma função assíncrona; use executar_async.")
+        return {self.campo: resultado}
+
+    async def executar_async(self, contexto, funcoes):
+        resultado = self._chamar(contexto, funcoes)
+        if inspect.isawaitable(resultado):
+            resultado = await resultado
+        return {self.campo: resultado}
+
+
+class _EstagioRegra(Estagio):
+    """Estágio que avalia uma regra compilada sobre o contexto."""
+
+    def __init__(self, nome: str, regra: Any, le: Optional[Iterable[str]] = None, escreve: Iterable[str] = ()):
+        self.regra = regra if isinstance(regra, CompiledRule) else compile_logic(regra)
+        super().__init__(nome, le if le is not None else campos_lidos(self.regra), escreve)
+
+    @abstractmethod
+    def _saida(self, resultado) -> Dict[str, Any]:
+        """Converte o resultado da regra nos campos escritos."""
+
+    def executar(self, contexto, funcoes):
+        return self._saida(self.regra.evaluate(contexto, funcoes))
+
+    async def executar_async(self, contexto, funcoes):
+        return self._saida(await self.regra.evaluate_async(contexto, funcoes))
+
+
+class EstagioValidacao(_EstagioRegra):
+    """Avalia uma regra de validação; um resultado diferente de None é o erro."""
+
+    def __init__(self, nome: str, regra: Any, le: Optional[Iterable[str]] = None):
+        super().__init__(nome, regra, le)
+
+    def _saida(self, resultado):
+        if resultado is not None:
+            raise FalhaValidacao(self.nome, resultado)
+        return {}
+
+
+class EstagioPontuacao(_EstagioRegra):
+    """Avalia uma regra e guarda o resultado no campo `escreve`."""
+
+    def __init__(self, nome: str, regra: Any, escreve: str, le: Optional[Iterable[str]] = None):
+        super().__init__(nome, regra, le, (escreve,))
+        self.campo = escreve
+
+    def _saida(self, resultado):
+        return {self.campo: resultado}
+
+
+class EstagioDecisao(EstagioPontuacao):
+    """Avalia a regra de decisão e guarda a Decisao normalizada."""
+
+    def __init__(self, nome: str, regra: Any, escreve: str = CAMPO_DECISAO, le: Optional[Iterable[str]] = None):
+        super().__init__(nome, regra, escreve, le)
+
+    def _saida(self, resultado):
+        return {self.campo: normalizar_decisao(resultado)}
+
+
+class EstagioAcao(Estagio):
+    """
+    Executa a ação da decisão guardada em `decisao`.
+
+    Depende de todos os estágios anteriores: a ação só é executada depois que
+    todas as validações passaram. Como a ação recebe o contexto inteiro, o
+    estágio nunca é pulado.
+    """
+
+    barreira = True
+
+    def __init__(self, nome: str = "acao", acoes: Optional[Dict[str, Callable]] = None, decisao: str = CAMPO_DECISAO):
+        """
+        Args:
+            acoes: Registro das ações por decisão (padrão: ACOES_DISPONIVEIS)
+            decisao: Campo com a Decisao a executar
+        """
+        super().__init__(nome)
+        if acoes is None:
+            acoes = ACOES_DISPONIVEIS
+        self.acoes = acoes if isinstance(acoes, RegistroDeAcoes) else RegistroDeAcoes(acoes)
+        self.campo = decisao
+
+    def executar(self, contexto, funcoes):
+        decisao = contexto[self.campo]
+        if self.acoes.assincrona(decisao.acao):
+            raise TypeError(f"A ação '{decisao.acao}' é assíncrona; use executar_async.")
+        self.acoes.executar(decisao.acao, contexto, decisao.params)
+        return {}
+
+    async def executar_async(self, contexto, funcoes):
+        decisao = contexto[self.campo]
+        resultado = self.acoes.executar(decisao.acao, contexto, decisao.params)
+        if self.acoes.assincrona(decisao.acao):
+            await resultado
+        return {}
+
+
+def _escreve_o_que_le(escritor: Estagio, leitor: Estagio) -> bool:
+    return bool(escritor.escreve) and (leitor.le is None or not escritor.escreve.isdisjoint(leitor.le))
+
+
+def _depende(anterior: Estagio, estagio: Estagio) -> bool:
+    """Indica se `estagio` precisa executar depois de `anterior` (que vem antes na lista)."""
+    return (
+        estagio.barreira
+        or _escreve_o_que_le(anterior, estagio)
+        or _escreve_o_que_le(estagio, anterior)
+        or not anterior.escreve.isdisjoint(estagio.escreve)
+    )
+
+
+class ResultadoPipeline:
+    """Resultado de uma execução do pipeline."""
+
+    __slots__ = ("contexto", "erro", "estagio_erro", "entradas", "saidas", "executados", "pulados")
+
+    def __init__(self, contexto):
+        # Dados da solicitação acrescidos dos campos escritos pelos estágios
+        self.contexto = contexto
+        self.erro = None
+        self.estagio_erro = None
+        # Entradas e saídas de cada estágio executado (ou reaproveitado)
+        self.entradas: Dict[str, Optional[Dict[str, Any]]] = {}
+        self.saidas: Dict[str, Dict[str, Any]] = {}
+        self.executados: List[str] = []
+        self.pulados: List[str] = []
+
+    @property
+    def decisao(self):
+        return self.contexto.get(CAMPO_DECISAO)
+
+    def __repr__(self):
+        return (
+            f"ResultadoPipeline(decisao={self.decisao!r}, erro={self.erro!r}, "
+            f"executados={self.executados!r}, pulados={self.pulados!r})"
+        )
+
+
+class Pipeline:
+    """
+    Executa uma lista de estágios sobre o contexto de uma solicitação.
+
+    Os dados de entrada não são alterados: os estágios escrevem em uma cópia
+    rasa (o contexto do resultado). As entradas dos estágios são comparadas por
+    igualdade com as da execução anterior; os objetos de uma execução não
+    devem ser alterados in place antes de serem reaproveitados.
+    """
+
+    def __init__(self, estagios: Iterable[Estagio], funcoes: Optional[Dict[str, Callable]] = None):
+        """
+        Args:
+            estagios: Estágios, na ordem de execução sequencial
+            funcoes: Funções disponíveis para as regras e os enriquecimentos;
+                a função "decisao" é acrescentada quando ausente
+        """
+        self.estagios = list(estagios)
+        nomes = [estagio.nome for estagio in self.estagios]
+        if len(set(nomes)) != len(nomes):
+            raise ValueError("Os nomes dos estágios devem ser únicos.")
+        self.funcoes = funcoes_com_decisao(funcoes)
+        self._posicoes = {nome: posicao for posicao, nome in enumerate(nomes)}
+        self.niveis = self._calcular_niveis()
+
+    def _calcular_niveis(self) -> List[List[Estagio]]:
+        """Agrupa os estágios em níveis; cada estágio fica depois de todas as suas dependências."""
+        niveis_por_estagio: List[int] = []
+        for indice, estagio in enumerate(self.estagios):
+            nivel = 0
+            for anterior in range(indice):
+                if _depende(self.estagios[anterior], estagio):
+                    nivel = max(nivel, niveis_por_estagio[anterior] + 1)
+            niveis_por_estagio.append(nivel)
+
+        niveis: List[List[Estagio]] = [[] for _ in range(max(niveis_por_estagio, default=-1) + 1)]
+        for estagio, nivel in zip(self.estagios, niveis_por_estagio):
+            niveis[nivel].append(estagio)
+        return niveis
+
+    def _saida_anterior(self, estagio, resultado, anterior) -> Optional[Dict[str, Any]]:
+        """Registra as entradas do estágio; retorna a saída anterior se elas não mudaram."""
+        if estagio.le is None:
+            resultado.entradas[estagio.nome] = None
+            return None
+        entradas = {campo: resultado.contexto.get(campo, _AUSENTE) for campo in estagio.le}
+        resultado.entradas[estagio.nome] = entradas
+        if (
+            anterior is None
+            or estagio.nome not in anterior.saidas
+            or anterior.entradas.get(estagio.nome) != entradas
+        ):
+            return None
+        return anterior.saidas[estagio.nome]
+
+    def _reaproveitar(self, estagio, resultado, saida):
+        resultado.saidas[estagio.nome] = saida
+        resultado.contexto.update(saida)
+        resultado.pulados.append(estagio.nome)
+
+    def _registrar(self, estagio, resultado, saida):
+        resultado.saidas[estagio.nome] = saida
+        resultado.executados.append(estagio.nome)
+        resultado.contexto.update(saida)
+
+    def executar(self, dados: Dict[str, Any], anterior: Optional[ResultadoPipeline] = None) -> ResultadoPipeline:
+        """Executa os estágios sequencialmente, na ordem da lista."""
+        resultado = ResultadoPipeline(dict(dados))
+        for estagio in self.estagios:
+            saida = self._saida_anterior(estagio, resultado, anterior)
+            if saida is not None:
+                self._reaproveitar(estagio, resultado, saida)
+                continue
+            try:
+                saida = estagio.executar(resultado.contexto, self.funcoes)
+            except FalhaValidacao as falha:
+                resultado.erro, resultado.estagio_erro = falha.erro, falha.estagio
+                return resultado
+            self._registrar(estagio, resultado, saida)
+        return resultado
+
+    async def executar_async(
+        self, dados: Dict[str, Any], anterior: Optional[ResultadoPipeline] = None
+    ) -> ResultadoPipeline:
+        """
+        Executa os estágios de cada nível concorrentemente.
+
+        O resultado é o da execução sequencial: quando a validação na posição i
+        falha, as saídas e exceções dos estágios posteriores a i (inclusive os
+        do mesmo nível, que já executaram) são descartadas, e os níveis
+        seguintes executam apenas os estágios anteriores a i. Uma validação
+        anterior que também falhe prevalece.
+        """
+        resultado = ResultadoPipeline(dict(dados))
+        primeira_falha = None
+        # Posição da primeira validação que falhou até agora
+        limite = len(self.estagios)
+        for nivel in self.niveis:
+            nivel = [estagio for estagio in nivel if self._posicoes[estagio.nome] < limite]
+            reaproveitadas = {estagio.nome: self._saida_anterior(estagio, resultado, anterior) for estagio in nivel}
+            pendentes = [estagio for estagio in nivel if reaproveitadas[estagio.nome] is None]
+            saidas = await asyncio.gather(
+                *(estagio.executar_async(resultado.contexto, self.funcoes) for estagio in pendentes),
+                return_exceptions=True,
+            )
+            saidas = dict(zip((estagio.nome for estagio in pendentes), saidas))
+            # Os estágios do nível leem o contexto do nível anterior; as saídas são
+            # aplicadas depois que todos terminam, na ordem da lista
+            for estagio in nivel:
+                if self._posicoes[estagio.nome] > limite:
+                    # Posterior à falha: na execução sequencial, não teria executado
+                    del resultado.entradas[estagio.nome]
+                    continue
+                saida = reaproveitadas[estagio.nome]
+                if saida is not None:
+                    self._reaproveitar(estagio, resultado, saida)
+                    continue
+                saida = saidas[estagio.nome]
+                if isinstance(saida, FalhaValidacao):
+                    primeira_falha, limite = saida, self._posicoes[estagio.nome]
+                elif isinstance(saida, BaseException):
+                    raise saida
+                else:
+                    self._registrar(estagio, resultado, saida)
+        if primeira_falha is not None:
+            resultado.erro, resultado.estagio_erro = primeira_falha.erro, primeira_falha.estagio
+        return resultado
+
+
+def pipeline_padrao(
+    regras_validacao: Optional[List[Any]] = None,
+    regra_processamento: Any = None,
+    funcoes: Optional[Dict[str, Callable]] = None,
+    acoes: Optional[Dict[str, Callable]] = None,
+) -> Pipeline:
+    """Pipeline equivalente às fases de MotorDeRegrasCustom (validação, processamento e ação)."""
+    if regras_validacao is None:
+        regras_validacao = REGRAS_VALIDACAO
+    if regra_processamento is None:
+        regra_processamento = REGRA_PROCESSAMENTO
+    estagios: List[Estagio] = [
+        EstagioValidacao(f"validacao.{indice}", regra) for indice, regra in enumerate(regras_validacao)
+    ]
+    estagios.append(EstagioDecisao("processamento", regra_processamento))
+    estagios.append(EstagioAcao(acoes=acoes))
+    return Pipeline(estagios, funcoes)
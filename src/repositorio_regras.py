@@ -0,0 +1,253 @@
+"""
+Repositório de regras com recarga a quente.
+
+As regras são lidas de um diretório (um arquivo `<id>.json` por regra) ou de um
+bundle (um único arquivo JSON {id: regra}). Uma thread observa a origem por
+polling e, quando ela muda, carrega e compila a nova versão em segundo plano.
+A troca é atômica: os leitores apenas leem a referência ao conjunto atual, sem
+bloqueio, e nunca veem um conjunto parcialmente carregado. Se alguma regra da
+nova versão for inválida, ou se faltar alguma das regras obrigatórias
+(`obrigatorias`), o conjunto atual é mantido.
+
+As regras compiladas são guardadas pelo hash do conteúdo: uma regra que não
+mudou entre duas versões reaproveita a mesma CompiledRule (com as partições
+assíncronas já calculadas), e apenas as regras alteradas são compiladas.
+
+Com os identificadores "validacao.<n>" e "processamento", o repositório pode
+ser usado pelo motor, que torna a regra "processamento" obrigatória:
+```python
+with RepositorioDeRegras("dados/regras", intervalo=1.0) as repositorio:
+    motor = MotorDeRegrasCustom(repositorio=repositorio)
+    motor.executar(solicitacao)  # usa sempre a versão mais recente das regras
+```
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from lib.compiler import CompiledRule, compile_logic
+from lib.rule_store import rule_hash as hash_regra
+
+PREFIXO_VALIDACAO = "validacao."
+
+
+def _posicao_validacao(regra_id: str) -> Tuple[int, Any]:
+    sufixo = regra_id[len(PREFIXO_VALIDACAO):]
+    return (0, int(sufixo)) if sufixo.isdigit() else (1, sufixo)
+
+
+class ConjuntoDeRegras:
+    """
+    Versão imutável das regras carregadas.
+
+    `validacao` traz as regras "validacao.<n>" na ordem numérica, no formato
+    usado pelo motor: [(id, regra compilada), ...].
+    """
+
+    __slots__ = ("versao", "regras", "hashes", "validacao")
+
+    def __init__(self, versao: int, regras: Dict[str, CompiledRule], hashes: Dict[str, str]):
+        self.versao = versao
+        self.regras = regras
+        self.hashes = hashes
+        self.validacao = [
+            (regra_id, regras[regra_id])
+            for regra_id in sorted(
+                (regra_id for regra_id in regras if regra_id.startswith(PREFIXO_VALIDACAO)),
+                key=_posicao_validacao,
+            )
+        ]
+
+    def __getitem__(self, regra_id: str) -> CompiledRule:
+        return self.regras[regra_id]
+
+    def __contains__(self, regra_id: str) -> bool:
+        return regra_id in self.regras
+
+    def __len__(self):
+        return len(self.regras)
+
+
+class RepositorioDeRegras:
+    """
+    Regras de um diretório ou bundle, recarregadas quando a origem muda.
+
+    `atual` (e `regra`) nunca bloqueia; `recarregar` pode ser chamado
+    diretamente, e a thread de observação o chama quando a origem muda.
+    """
+
+    def __init__(self, caminho: str, intervalo: Optional[float] = 1.0, obrigatorias: Iterable[str] = ()):
+        """
+        Args:
+            caminho: Diretório com arquivos <id>.json ou arquivo bundle {id: regra}
+            intervalo: Intervalo, em segundos, entre as verificações da origem
+                (None: sem observação; use `recarregar`)
+            obrigatorias: Identificadores que toda versão deve conter; uma
+                versão sem algum deles não é publicada
+
+        Raises:
+            FileNotFoundError, ValueError, RuntimeError: Se a carga inicial falhar
+        """
+        self.caminho = caminho
+        self.intervalo = intervalo
+        # Serializa as recargas; os leitores não usam o lock
+        self._lock = threading.Lock()
+        self._cache: Dict[str, CompiledRule] = {}
+        self._assinatura = None
+        self.recargas = 0
+        self.falhas = 0
+        self.compiladas = 0
+        self.reaproveitadas = 0
+        self.ultimo_erro: Optional[Exception] = None
+        self.obrigatorias = frozenset(obrigatorias)
+        self._atual = ConjuntoDeRegras(0, {}, {})
+
+        self._recarregar(propagar=True)
+
+        self._parar = threading.Event()
+        self._observador = None
+        if intervalo is not None:
+            self._observador = threading.Thread(target=self._observar, name="repositorio-regras", daemon=True)
+            self._observador.start()
+
+    @property
+    def atual(self) -> ConjuntoDeRegras:
+        """Conjunto de regras em uso."""
+        return self._atual
+
+    def regra(self, regra_id: str) -> CompiledRule:
+        return self._atual.regras[regra_id]
+
+    def exigir(self, *regra_ids: str):
+        """
+        Acrescenta regras obrigatórias; as próximas versões sem elas não são publicadas.
+
+        Raises:
+            ValueError: Se o conjunto atual não contém alguma das regras
+        """
+        with self._lock:
+            self._verificar_obrigatorias(self._atual.regras, regra_ids)
+            self.obrigatorias = self.obrigatorias.union(regra_ids)
+
+    def _verificar_obrigatorias(self, regras: Dict[str, Any], regra_ids: Iterable[str]):
+        faltando = sorted(regra_id for regra_id in regra_ids if regra_id not in regras)
+        if faltando:
+            raise ValueError(f"Regras obrigatórias ausentes em {self.caminho}: {', '.join(faltando)}.")
+
+    def _arquivos(self) -> List[str]:
+        return sorted(
+            os.path.join(self.caminho, nome) for nome in os.listdir(self.caminho) if nome.endswith(".json")
+        )
+
+    def _ler_assinatura(self):
+        """Identifica a versão da origem pelos nomes, tamanhos e datas dos arquivos."""
+        arquivos = self._arquivos() if os.path.isdir(self.caminho) else [self.caminho]
+        assinatura = []
+        for arquivo in arquivos:
+            estado = os.stat(arquivo)
+            assinatura.append((arquivo, estado.st_size, estado.st_mtime_ns))
+        return tuple(assinatura)
+
+    def _ler_regras(self) -> Dict[str, Any]:
+        if not os.path.isdir(self.caminho):
+            with open(self.caminho, encoding="utf-8") as arquivo:
+                regras = json.load(arquivo)
+            if not isinstance(regras, dict):
+                raise ValueError(f"O bundle {self.caminho} deve ser um objeto {{id: regra}}.")
+            return regras
+        regras = {}
+        for arquivo in self._arquivos():
+            with open(arquivo, encoding="utf-8") as entrada:
+                regras[os.path.splitext(os.path.basename(arquivo))[0]] = json.load(entrada)
+        return regras
+
+    def recarregar(self) -> bool:
+        """
+        Carrega a origem e troca o conjunto atual se alguma regra mudou.
+
+        Returns:
+            True se uma nova versão foi publicada; False se nada mudou ou se a
+            nova versão é inválida (o erro fica em `ultimo_erro`)
+        """
+        return self._recarregar(propagar=False)
+
+    def _recarregar(self, propagar: bool) -> bool:
+        with self._lock:
+            assinatura = None
+            try:
+                assinatura = self._ler_assinatura()
+                definicoes = self._ler_regras()
+                self._verificar_obrigatorias(definicoes, self.obrigatorias)
+                hashes = {regra_id: hash_regra(regra) for regra_id, regra in definicoes.items()}
+                if hashes == self._atual.hashes and self._atual.versao:
+                    self._assinatura = assinatura
+                    return False
+
+                compiladas = reaproveitadas = 0
+                regras = {}
+                novas = {}
+                for regra_id, regra in definicoes.items():
+                    hash_conteudo = hashes[regra_id]
+                    compilada = self._cache.get(hash_conteudo) or novas.get(hash_conteudo)
+                    if compilada is None:
+                        compilada = novas[hash_conteudo] = compile_logic(regra)
+                        compiladas += 1
+                    else:
+                        reaproveitadas += 1
+                    regras[regra_id] = compilada
+            except (OSError, ValueError, RuntimeError) as erro:
+                self.falhas += 1
+                self.ultimo_erro = erro
+                # A mesma versão inválida não é carregada de novo a cada verificação
+                if assinatura is not None:
+                    self._assinatura = assinatura
+                print(f"Falha ao carregar as regras de {self.caminho}: {erro!r}")
+                if propagar:
+                    raise
+                return False
+
+            # Publicação atômica: uma única atribuição de referência
+            self._atual = ConjuntoDeRegras(self._atual.versao + 1, regras, hashes)
+            self._assinatura = assinatura
+            # O cache guarda apenas as regras da versão publicada
+            self._cache = {hashes[regra_id]: regra for regra_id, regra in regras.items()}
+            self.recargas += 1
+            self.compiladas += compiladas
+            self.reaproveitadas += reaproveitadas
+            self.ultimo_erro = None
+            return True
+
+    def _observar(self):
+        while not self._parar.wait(self.intervalo):
+            try:
+                mudou = self._ler_assinatura() != self._assinatura
+            except OSError:
+                # A origem pode estar sendo substituída; verifica de novo no próximo ciclo
+                continue
+            if mudou:
+                self.recarregar()
+
+    def fechar(self):
+        """Encerra a thread de observação."""
+        if self._observador is not None:
+            self._parar.set()
+            self._observador.join()
+            self._observador = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "versao": self._atual.versao,
+            "regras": len(self._atual),
+            "recargas": self.recargas,
+            "falhas": self.falhas,
+            "compiladas": self.compiladas,
+            "reaproveitadas": self.reaproveitadas,
+        }
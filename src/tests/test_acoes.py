@@ -0,0 +1,96 @@
+import os
+import sys
+
+import pytest
+
+# As ações importam seus módulos a partir de src/
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from acoes import Decisao, RegistroDeAcoes, funcoes_com_decisao, montar_decisao, normalizar_decisao
+from lib.json_logic import jsonLogic
+from lib.registry import FunctionRegistry
+
+
+class TestDecisaoEstruturada:
+    """Testes para a montagem e a normalização das decisões."""
+
+    def test_regra_monta_decisao_com_parametros(self):
+        regra = {"apply": ["decisao", "APROVADO", "limite", {"*": [{"var": "renda"}, 3]}, "prazo", 12]}
+
+        resultado = jsonLogic(regra, {"renda": 7000}, {"decisao": montar_decisao})
+
+        assert resultado == {"acao": "APROVADO", "params": {"limite": 21000, "prazo": 12}}
+
+    def test_pares_incompletos(self):
+        with pytest.raises(ValueError):
+            montar_decisao("APROVADO", "limite")
+
+    def test_funcoes_com_decisao_nao_altera_o_registro(self):
+        async def consultar(cpf):
+            return cpf
+
+        funcoes = FunctionRegistry()
+        funcoes.register("consultar", consultar, max_concurrency=2)
+
+        com_decisao = funcoes_com_decisao(funcoes)
+
+        assert "decisao" not in funcoes
+        assert isinstance(com_decisao, FunctionRegistry)
+        assert com_decisao["decisao"] is montar_decisao
+        assert com_decisao["consultar"] is funcoes["consultar"]
+        assert com_decisao.is_async("consultar")
+        assert com_decisao.stats() == funcoes.stats()
+        assert funcoes_com_decisao(com_decisao) is com_decisao
+
+    @pytest.mark.parametrize(
+        "resultado, esperado",
+        [
+            ("RECUSADO", Decisao("RECUSADO", {})),
+            ({"acao": "APROVADO", "params": {"limite": 10}}, Decisao("APROVADO", {"limite": 10})),
+            ({"acao": "APROVADO"}, Decisao("APROVADO", {})),
+            (None, Decisao(None, {})),
+        ],
+    )
+    def test_normalizar_decisao(self, resultado, esperado):
+        assert normalizar_decisao(resultado) == esperado
+
+
+class TestRegistroDeAcoes:
+    """Testes para o registro e o despacho das ações."""
+
+    def test_acoes_com_e_sem_parametros(self):
+        executadas = []
+        registro = RegistroDeAcoes({"RECUSADO": lambda dados: executadas.append(("recusar", dados["id"]))})
+
+        @registro.registrar("APROVADO")
+        def aprovar(dados, params):
+            executadas.append(("aprovar", dados["id"], params))
+
+        registro.executar("APROVADO", {"id": 1}, {"limite": 10})
+        registro.executar("APROVADO", {"id": 2})
+        registro.executar("RECUSADO", {"id": 3}, {"motivo": "idade"})
+        registro.executar("INEXISTENTE", {"id": 4})
+
+        assert executadas == [
+            ("aprovar", 1, {"limite": 10}),
+            ("aprovar", 2, {}),
+            ("recusar", 3),
+        ]
+
+    def test_classifica_no_registro(self):
+        async def notificar(dados, *extras):
+            pass
+
+        registro = RegistroDeAcoes({"NOTIFICAR": notificar, "RECUSADO": lambda dados: None})
+
+        assert registro.assincrona("NOTIFICAR")
+        assert not registro.assincrona("RECUSADO")
+
+        registro["NOTIFICAR"] = lambda dados: None
+        assert not registro.assincrona("NOTIFICAR")
+        del registro["NOTIFICAR"]
+        assert "NOTIFICAR" not in registro
+
+    def test_rejeita_acao_nao_chamavel(self):
+        with pytest.raises(TypeError):
+            RegistroDeAcoes({"APROVADO": "aprovar"})
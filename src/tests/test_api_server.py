@@ -0,0 +1,79 @@
+import os
+import sys
+
+import pytest
+
+# A API importa a lib a partir de src/
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import api_server
+from lib.rule_store import RuleStore
+
+
+@pytest.fixture
+def cliente(monkeypatch):
+    monkeypatch.setattr(api_server, "rule_store", RuleStore())
+    return api_server.app.test_client()
+
+
+class TestApiRegras:
+    """Testes para o registro de regras e a avaliação por referência."""
+
+    def test_registra_e_avalia_por_referencia(self, cliente):
+        resposta = cliente.post("/api/rules", json={"id": "idade", "rule": {">=": [{"var": "idade"}, 18]}})
+        assert resposta.status_code == 201
+        assert resposta.get_json()["ref"] == "idade@1"
+
+        resposta = cliente.post("/api/process-rule", json={"rule_id": "idade@1", "data": {"idade": 30}})
+
+        assert resposta.status_code == 200
+        assert resposta.get_json() == {"success": True, "result": True, "rule_id": "idade@1", "data": {"idade": 30}}
+
+    def test_nova_versao_e_versao_mais_recente(self, cliente):
+        cliente.post("/api/rules", json={"id": "idade", "rule": {">=": [{"var": "idade"}, 18]}})
+        assert cliente.post("/api/rules", json={"id": "idade", "rule": {">=": [{"var": "idade"}, 18]}}).status_code == 200
+        assert cliente.post("/api/rules", json={"id": "idade", "rule": {">=": [{"var": "idade"}, 21]}}).status_code == 201
+
+        mais_recente = cliente.post("/api/process-rule", json={"rule_id": "idade", "data": {"idade": 19}})
+        anterior = cliente.post("/api/process-rule", json={"rule_id": "idade@1", "data": {"idade": 19}})
+
+        assert mais_recente.get_json()["result"] is False
+        assert mais_recente.get_json()["rule_id"] == "idade@2"
+        assert anterior.get_json()["result"] is True
+
+        consulta = cliente.get("/api/rules/idade").get_json()
+        assert consulta["versions"] == [1, 2]
+        assert consulta["rule"] == {">=": [{"var": "idade"}, 21]}
+
+    def test_regra_nao_registrada(self, cliente):
+        resposta = cliente.post("/api/process-rule", json={"rule_id": "idade@1", "data": {}})
+
+        assert resposta.status_code == 404
+        assert cliente.get("/api/rules/idade").status_code == 404
+        assert cliente.get("/api/rules/idade@1").status_code == 404
+
+    @pytest.mark.parametrize("rule_id", ["r@abc", "r@0", "r@-1", "r@"])
+    def test_referencia_malformada(self, cliente, rule_id):
+        resposta = cliente.post("/api/process-rule", json={"rule_id": rule_id, "data": {}})
+
+        assert resposta.status_code == 400
+        assert "Versão inválida" in resposta.get_json()["error"]
+        assert cliente.get(f"/api/rules/{rule_id}").status_code == 400
+
+    @pytest.mark.parametrize("rule_id", [1, ["idade@1"], {"id": "idade"}])
+    def test_rule_id_que_nao_e_texto(self, cliente, rule_id):
+        resposta = cliente.post("/api/process-rule", json={"rule_id": rule_id, "data": {}})
+
+        assert resposta.status_code == 400
+        assert "rule_id" in resposta.get_json()["error"]
+
+    def test_regra_invalida(self, cliente):
+        resposta = cliente.post("/api/rules", json={"id": "idade", "rule": {"operacao_inexistente": [1]}})
+
+        assert resposta.status_code == 400
+        assert cliente.post("/api/rules", json={"rule": True}).status_code == 400
+
+    def test_regra_completa_continua_aceita(self, cliente):
+        resposta = cliente.post("/api/process-rule", json={"rule": {"+": [1, 2]}, "data": {}})
+
+        assert resposta.get_json()["result"] == 3
@@ -1,7 +1,14 @@
 import pytest
 import asyncio
 
-from src.lib.json_logic import jsonLogic, jsonLogicAsync, jsonLogicAuto, has_async_functions
+from src.lib.json_logic import (
+    jsonLogic,
+    jsonLogicAsync,
+    jsonLogicAuto,
+    has_async_functions,
+    current_deadline,
+    remaining_time,
+)
 
 
 class TestAsyncSupport:
@@ -294,6 +301,136 @@ class TestAsyncSupport:
         else:
             assert result == 8
 
+    @pytest.mark.asyncio
+    async def test_sync_subtrees_are_not_awaited(self, monkeypatch):
+        """Subárvores sem funções assíncronas são avaliadas sem corrotinas."""
+        from src.lib import json_logic
+
+        async_nodes = []
+        original = json_logic._evaluate_async
+
+        async def counting_evaluate_async(tests, *args):
+            async_nodes.append(next(iter(tests)))
+            return await original(tests, *args)
+
+        monkeypatch.setattr(json_logic, "_evaluate_async", counting_evaluate_async)
+
+        async def fetch(value):
+            await asyncio.sleep(0)
+            return value
+
+        functions = {"fetch": fetch, "double": lambda x: x * 2}
+        rule = {
+            "and": [
+                {">": [{"apply": ["double", {"var": "x"}]}, 1]},
+                {"==": [{"apply": ["fetch", {"var": "x"}]}, 3]},
+            ]
+        }
+
+        assert await jsonLogicAsync(rule, {"x": 3}, functions) is True
+        assert async_nodes == ["and", "==", "apply"]
+
+        async_nodes.clear()
+        assert await jsonLogicAsync({">": [{"apply": ["double", 2]}, 3]}, {}, functions) is True
+        assert async_nodes == []
+
+    @pytest.mark.asyncio
+    async def test_dynamic_function_name_is_treated_as_async(self):
+        """Um nome de função calculado pode apontar para uma função assíncrona."""
+        async def fetch(value):
+            await asyncio.sleep(0)
+            return value + 1
+
+        rule = {"apply": [{"var": "function"}, 1]}
+        assert await jsonLogicAsync(rule, {"function": "fetch"}, {"fetch": fetch}) == 2
+
+
+class TestDeadline:
+    """Testes de prazo (timeout/deadline) na avaliação assíncrona."""
+
+    @pytest.mark.asyncio
+    async def test_timeout_returns_fallback_and_cancels_call(self):
+        """Estouro do prazo cancela a chamada lenta e retorna o fallback."""
+        cancelled = asyncio.Event()
+
+        async def slow_lookup(value):
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return value
+
+        rule = {"apply": ["slow_lookup", 1]}
+        result = await jsonLogicAsync(rule, {}, {"slow_lookup": slow_lookup}, timeout=0.02, fallback="TIMEOUT")
+
+        assert result == "TIMEOUT"
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_timeout_without_fallback_raises(self):
+        """Sem fallback, o estouro do prazo levanta TimeoutError."""
+        async def slow_lookup():
+            await asyncio.sleep(1)
+
+        with pytest.raises(TimeoutError):
+            await jsonLogicAsync({"apply": ["slow_lookup"]}, {}, {"slow_lookup": slow_lookup}, timeout=0.02)
+
+    @pytest.mark.asyncio
+    async def test_within_deadline_returns_result(self):
+        """Dentro do prazo, o resultado é o da avaliação normal."""
+        async def double(value):
+            await asyncio.sleep(0)
+            return value * 2
+
+        rule = {"apply": ["double", {"var": "x"}]}
+        deadline = asyncio.get_running_loop().time() + 1
+
+        assert await jsonLogicAsync(rule, {"x": 4}, {"double": double}, deadline=deadline, fallback=0) == 8
+        assert current_deadline() is None
+
+    @pytest.mark.asyncio
+    async def test_remaining_time_visible_to_functions(self):
+        """Funções registradas enxergam o prazo restante da avaliação."""
+        seen = []
+
+        async def budget():
+            seen.append(remaining_time())
+            return True
+
+        await jsonLogicAsync({"apply": ["budget"]}, {}, {"budget": budget}, timeout=0.5)
+        await jsonLogicAsync({"apply": ["budget"]}, {}, {"budget": budget})
+
+        assert 0 < seen[0] <= 0.5
+        assert seen[1] is None
+
+    @pytest.mark.asyncio
+    async def test_nested_evaluation_never_extends_deadline(self):
+        """Uma avaliação aninhada herda o menor prazo."""
+        inner_deadlines = []
+
+        async def nested():
+            inner_deadlines.append(current_deadline())
+            return await jsonLogicAsync({"apply": ["probe"]}, {}, functions, timeout=10)
+
+        async def probe():
+            inner_deadlines.append(current_deadline())
+            return True
+
+        functions = {"nested": nested, "probe": probe}
+        await jsonLogicAsync({"apply": ["nested"]}, {}, functions, timeout=0.5)
+
+        assert inner_deadlines[0] == inner_deadlines[1]
+
+    @pytest.mark.asyncio
+    async def test_timeout_raised_by_function_is_not_swallowed(self):
+        """TimeoutError da própria função não vira fallback."""
+        async def failing():
+            raise TimeoutError("upstream")
+
+        with pytest.raises(TimeoutError, match="upstream"):
+            await jsonLogicAsync({"apply": ["failing"]}, {}, {"failing": failing}, timeout=1, fallback=False)
+
 
 if __name__ == "__main__":
     # Para executar os testes manualmente
@@ -0,0 +1,61 @@
+import json
+import os
+import sys
+
+# Os benchmarks importam o motor e a lib a partir de src/
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.cenarios import criar_cenarios, gerar_solicitacoes_credito
+from benchmarks.medicao import medir, medir_async, resumir
+from benchmarks.suite import criar_benchmarks, executar_suite
+
+
+class TestBenchmarks:
+    """Testes para a suíte unificada de benchmarks."""
+
+    def test_sequencias_reprodutiveis(self):
+        for cenario in criar_cenarios():
+            assert cenario.sequencia(50, 7) == cenario.sequencia(50, 7)
+        assert gerar_solicitacoes_credito(20, 7) == gerar_solicitacoes_credito(20, 7)
+        assert gerar_solicitacoes_credito(20, 7) != gerar_solicitacoes_credito(20, 8)
+
+    def test_resumir(self):
+        estatisticas = resumir([100.0, 300.0, 200.0])
+
+        assert estatisticas["mediana_ns"] == 200.0
+        assert estatisticas["media_ns"] == 200.0
+        assert (estatisticas["min_ns"], estatisticas["max_ns"]) == (100.0, 300.0)
+        assert estatisticas["desvio_padrao_ns"] == 100.0
+        assert estatisticas["ops_por_segundo"] == 5_000_000
+
+    def test_medir_executa_aquecimento_e_repeticoes(self):
+        chamadas = []
+
+        estatisticas = medir(lambda: chamadas.append(1), operacoes=1, repeticoes=4, aquecimento=2)
+
+        assert len(chamadas) == 6
+        assert len(estatisticas["amostras_ns"]) == 4
+
+    def test_medir_async(self):
+        chamadas = []
+
+        async def lote():
+            chamadas.append(1)
+
+        estatisticas = medir_async(lote, operacoes=1, repeticoes=3, aquecimento=1)
+
+        assert len(chamadas) == 4
+        assert len(estatisticas["amostras_ns"]) == 3
+
+    def test_suite_gera_json(self):
+        resultado = executar_suite(operacoes=5, repeticoes=2, aquecimento=0)
+
+        nomes = [benchmark.nome for benchmark in criar_benchmarks()]
+        assert list(resultado["resultados"]) == nomes
+        assert resultado["metadados"]["semente"] == 42
+        assert json.loads(json.dumps(resultado)) == resultado
+
+    def test_suite_com_filtro(self):
+        resultado = executar_suite(operacoes=5, repeticoes=2, aquecimento=0, filtro="IoT/compilado")
+
+        assert list(resultado["resultados"]) == ["IoT/compilado", "IoT/compilado+memo"]
@@ -0,0 +1,95 @@
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+# Os benchmarks importam a API e a lib a partir de src/
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.carga_http import GeradorDeCarga, ServidorLocal, executar_carga, gerar_corpos
+
+
+async def _servidor_lento(atraso: float, conexoes: list):
+    """Servidor HTTP/1.1 mínimo que responde após `atraso` segundos."""
+
+    async def atender(reader, writer):
+        conexoes.append(writer)
+        while True:
+            cabecalho = await reader.readuntil(b"\r\n\r\n") if not reader.at_eof() else b""
+            if not cabecalho:
+                break
+            tamanho = int(cabecalho.lower().split(b"content-length:")[1].split(b"\r\n")[0])
+            await reader.readexactly(tamanho)
+            await asyncio.sleep(atraso)
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}")
+            await writer.drain()
+        writer.close()
+
+    return await asyncio.start_server(atender, "127.0.0.1", 0)
+
+
+class TestCargaHttp:
+    """Testes para o gerador de carga HTTP."""
+
+    def test_carga_aberta_contra_servidor_local(self):
+        resultado = executar_carga(taxa=100, duracao=0.3, conexoes=4, corpos=gerar_corpos(10))
+        carga = resultado["resultados"]
+
+        assert carga["modo"] == "aberto"
+        assert carga["enviadas"] == carga["concluidas"] == 30
+        assert carga["erros"] == {}
+        assert carga["latencia"]["count"] == 30
+        assert 0 < carga["latencia"]["p50_ns"] <= carga["latencia"]["p99_ns"]
+
+    def test_carga_fechada_e_erros_http(self):
+        corpos = [json.dumps({"rule": {"operacao_invalida": [1]}, "data": {}}).encode()]
+
+        with ServidorLocal() as servidor:
+            gerador = GeradorDeCarga(servidor.url + "/api/process-rule", corpos, conexoes=2)
+            carga = asyncio.run(gerador.executar(taxa=0, duracao=0.2))
+
+        assert carga["modo"] == "fechado"
+        assert carga["concluidas"] > 0
+        assert carga["erros"] == {"http_500": carga["concluidas"]}
+        assert carga["taxa_erros"] == 1.0
+
+    def test_latencia_corrigida_inclui_espera_e_reusa_conexoes(self):
+        """Com uma conexão e um servidor mais lento que a taxa, a fila entra na latência."""
+
+        async def cenario():
+            conexoes = []
+            servidor = await _servidor_lento(0.05, conexoes)
+            porta = servidor.sockets[0].getsockname()[1]
+            gerador = GeradorDeCarga(f"http://127.0.0.1:{porta}/", [b"{}"], conexoes=1)
+            async with servidor:
+                carga = await gerador.executar(taxa=50, duracao=0.2)
+            return carga, len(conexoes)
+
+        carga, conexoes_abertas = asyncio.run(cenario())
+
+        assert carga["concluidas"] == 10
+        assert conexoes_abertas == 1
+        assert carga["latencia_servico"]["max_ns"] < 100_000_000
+        # A última requisição esperou as 9 anteriores (~0,45 s) antes de ser enviada
+        assert carga["latencia"]["max_ns"] > 300_000_000
+
+    def test_timeout_entra_nos_percentis(self):
+        async def cenario():
+            servidor = await _servidor_lento(1.0, [])
+            porta = servidor.sockets[0].getsockname()[1]
+            gerador = GeradorDeCarga(f"http://127.0.0.1:{porta}/", [b"{}"], conexoes=1, timeout=0.05)
+            async with servidor:
+                return await gerador.executar(taxa=20, duracao=0.1)
+
+        carga = asyncio.run(cenario())
+
+        assert carga["erros"] == {"TimeoutError": 2}
+        # As requisições sem resposta contam com o tempo até o timeout
+        assert carga["latencia"]["count"] == 2
+        assert carga["latencia_servico"]["min_ns"] >= 50_000_000
+
+    def test_url_invalida(self):
+        with pytest.raises(ValueError):
+            GeradorDeCarga("https://exemplo.com/api", [b"{}"])
@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+
+from src.lib.compiler import AsyncApply, AsyncOperation, Var, compile_logic, walk
+from src.lib.json_logic import jsonLogic, jsonLogicAsync
+from src.lib.registry import FunctionRegistry
+
+
+DADOS = {
+    "usuario": {"nome": "joão", "idade": 25, "tags": ["a", "b"], "ativo": True},
+    "itens": [1, 2, 3, 4],
+    "limite": 2,
+    "vazio": None,
+}
+
+FUNCOES = {
+    "dobro": lambda x: x * 2,
+    "somar": lambda *args: sum(args),
+}
+
+REGRAS = [
+    {"==": [1, 1]},
+    {"<": [1, 2, 3]},
+    {"<=": [3, {"var": "limite"}]},
+    {"!": [{"var": "usuario.ativo"}]},
+    {"and": [{"var": "usuario.ativo"}, {">=": [{"var": "usuario.idade"}, 18]}]},
+    {"or": [False, {"==": [{"var": "usuario.nome"}, "joão"]}]},
+    {"if": [{"<": [{"var": "usuario.idade"}, 18]}, "MENOR", "MAIOR"]},
+    {"?:": [{"var": "vazio"}, 1, 2]},
+    {"+": [1, 2, {"var": "limite"}]},
+    {"-": [{"var": "limite"}]},
+    {"*": [2, 3, 4]},
+    {"/": [10, 4]},
+    {"%": [10, 3]},
+    {"min": [5, {"var": "limite"}, 9]},
+    {"cat": ["a", 1, {"var": "usuario.nome"}]},
+    {"in": ["a", {"var": "usuario.tags"}]},
+    {"count": [1, 0, True, None]},
+    {"merge": [{"var": "itens"}, [5, 6], 7]},
+    {"var": "usuario.tags.1"},
+    {"var": ["usuario.inexistente", "padrao"]},
+    {"var": [{"cat": ["usuario", ".", "nome"]}]},
+    {"var": "itens.9"},
+    {"map": [{"var": "itens"}, {"var": "limite"}]},
+    {"filter": [{"var": "itens"}, True]},
+    {"some": [{"var": "itens"}, {"var": "usuario.ativo"}]},
+    {"reduce": [{"var": "itens"}, 1, 0]},
+    {"apply": ["dobro", {"var": "usuario.idade"}]},
+    {"apply": ["somar", 1, 2, {"apply": ["dobro", 3]}]},
+    {},
+    "literal",
+    [1, {"var": "limite"}],
+]
+
+
+class TestCompiler:
+    """Testes para a compilação de regras em nós com __slots__."""
+
+    @pytest.mark.parametrize("regra", REGRAS)
+    def test_resultado_igual_ao_jsonlogic(self, regra):
+        esperado = jsonLogic(regra, DADOS, FUNCOES)
+        assert compile_logic(regra).evaluate(DADOS, FUNCOES) == esperado
+
+    def test_dados_e_funcoes_opcionais(self):
+        assert compile_logic({"var": "x"}).evaluate() is None
+        assert compile_logic({"+": [1, 1]})() == 2.0
+
+    def test_operacao_nao_reconhecida(self):
+        with pytest.raises(RuntimeError, match="Operação não reconhecida"):
+            compile_logic({"inexistente": [1]})
+
+    def test_funcao_nao_registrada(self):
+        regra = compile_logic({"apply": ["nao_existe", 1]})
+        with pytest.raises(NameError):
+            regra.evaluate({}, FUNCOES)
+
+    def test_var_com_caminho_fixo_e_pre_processado(self):
+        regra = compile_logic({"var": "usuario.tags.0"})
+        assert isinstance(regra.root, Var)
+        assert regra.root.keys == (("usuario", None), ("tags", None), ("0", 0))
+
+    def test_nos_nao_possuem_dict(self):
+        regra = compile_logic(
+            {"if": [{"apply": ["dobro", {"var": "a"}]}, {"map": [[1], 1]}, {"var": [{"var": "b"}]}]}
+        )
+        nos = list(walk(regra.root))
+
+        assert len(nos) == 9
+        assert all(not hasattr(no, "__dict__") for no in nos)
+        assert not hasattr(regra, "__dict__")
+
+
+async def _consultar(x):
+    await asyncio.sleep(0)
+    return x + 1
+
+
+REGRA_MISTA = {
+    "and": [
+        {">": [{"apply": ["dobro", {"var": "usuario.idade"}]}, 18]},
+        {"==": [{"apply": ["consultar", {"var": "limite"}]}, 3]},
+    ]
+}
+
+
+class TestCompilerAsync:
+    """Testes para a avaliação assíncrona particionada das regras compiladas."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("regra", REGRAS + [REGRA_MISTA])
+    async def test_resultado_igual_ao_jsonlogic_async(self, regra):
+        funcoes = {**FUNCOES, "consultar": _consultar}
+        assert await compile_logic(regra).evaluate_async(DADOS, funcoes) == await jsonLogicAsync(regra, DADOS, funcoes)
+
+    def test_particiona_apenas_o_caminho_ate_funcoes_assincronas(self):
+        regra = compile_logic(REGRA_MISTA)
+        raiz = regra.async_root({"consultar"})
+
+        assert isinstance(raiz, AsyncOperation)
+        sincrono, assincrono = raiz.args
+        assert sincrono is regra.root.args[0]
+        assert isinstance(assincrono, AsyncOperation)
+        assert isinstance(assincrono.args[0], AsyncApply)
+        assert not any(no.is_async for no in walk(sincrono))
+
+        # A partição é reaproveitada, e sem funções assíncronas a árvore é a original
+        assert regra.async_root({"consultar", "outra"}) is raiz
+        assert regra.async_root({"outra"}) is regra.root
+
+    def test_nome_de_funcao_calculado_e_assincrono(self):
+        regra = compile_logic({"!": [{"apply": [{"var": "funcao"}, 1]}]})
+        assert regra.dynamic_apply
+        assert regra.async_root({"consultar"}).is_async
+        assert regra.async_root(set()) is regra.root
+
+    @pytest.mark.asyncio
+    async def test_avaliacao_assincrona_com_registro(self):
+        funcoes = FunctionRegistry({**FUNCOES, "consultar": _consultar})
+        regra = compile_logic(REGRA_MISTA)
+
+        assert await regra.evaluate_async(DADOS, funcoes) is True
+        assert await compile_logic({"apply": [{"var": "f"}, 1]}).evaluate_async({"f": "consultar"}, funcoes) == 2
+        assert await compile_logic({"apply": ["dobro", 2]}).evaluate_async({}, funcoes) == 4
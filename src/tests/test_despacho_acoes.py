@@ -0,0 +1,167 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+# O despachante importa seus módulos a partir de src/
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from despacho_acoes import Acao, DespachanteDeAcoes, SinkAcoes, SinkMemoria
+from motor_regras import MotorDeRegrasAsync
+from outbox import Outbox
+
+
+class SinkLento(SinkMemoria):
+    async def gravar(self, tipo, lote):
+        await asyncio.sleep(0.05)
+        await super().gravar(tipo, lote)
+
+
+class SinkComFalha(SinkMemoria):
+    async def gravar(self, tipo, lote):
+        if tipo == "RECUSADO":
+            raise ConnectionError("fila indisponível")
+        await super().gravar(tipo, lote)
+
+
+class TestDespachanteDeAcoes:
+    """Testes para o despacho de ações em micro-lotes."""
+
+    @pytest.mark.asyncio
+    async def test_lotes_por_tamanho_e_por_tipo(self):
+        sink = SinkMemoria()
+        despachante = DespachanteDeAcoes(sink, tamanho_lote=3, janela=10)
+
+        for indice in range(7):
+            despachante.enviar("APROVADO", {"id": indice})
+        despachante.enviar("RECUSADO", {"id": 99})
+        await asyncio.sleep(0)
+
+        # Os dois lotes completos são entregues sem esperar a janela
+        assert [len(lote) for tipo, lote in sink.lotes] == [3, 3]
+
+        await despachante.drenar()
+        assert [(tipo, len(lote)) for tipo, lote in sink.lotes] == [
+            ("APROVADO", 3),
+            ("APROVADO", 3),
+            ("APROVADO", 1),
+            ("RECUSADO", 1),
+        ]
+        assert [acao.dados["id"] for acao in sink.acoes if acao.tipo == "APROVADO"] == list(range(7))
+        assert despachante.stats()["entregues"] == 8
+
+    @pytest.mark.asyncio
+    async def test_lote_entregue_ao_fim_da_janela(self):
+        sink = SinkMemoria()
+        despachante = DespachanteDeAcoes(sink, tamanho_lote=100, janela=0.02)
+
+        despachante.enviar("APROVADO", {"id": 1})
+        despachante.enviar("APROVADO", {"id": 2})
+        assert sink.lotes == []
+
+        await asyncio.sleep(0.1)
+        assert sink.lotes == [("APROVADO", [Acao("APROVADO", {"id": 1}), Acao("APROVADO", {"id": 2})])]
+
+    @pytest.mark.asyncio
+    async def test_falha_do_destino_nao_afeta_outros_tipos(self):
+        sink = SinkComFalha()
+        despachante = DespachanteDeAcoes(sink, janela=0)
+
+        despachante.enviar("RECUSADO", {"id": 1})
+        despachante.enviar("APROVADO", {"id": 2})
+        await despachante.drenar()
+
+        estatisticas = despachante.stats()
+        assert (estatisticas["falhas"], estatisticas["lotes"], estatisticas["entregues"]) == (1, 1, 1)
+        assert sink.acoes == [Acao("APROVADO", {"id": 2})]
+
+    @pytest.mark.asyncio
+    async def test_sink_de_acoes_sincronas_e_assincronas(self):
+        executadas = []
+
+        async def aprovar(dados):
+            await asyncio.sleep(0)
+            executadas.append(("aprovar", dados["id"]))
+
+        def recusar(dados):
+            executadas.append(("recusar", dados["id"]))
+
+        despachante = DespachanteDeAcoes(SinkAcoes({"APROVADO": aprovar, "RECUSADO": recusar}))
+        despachante.enviar("APROVADO", {"id": 1})
+        despachante.enviar("RECUSADO", {"id": 2})
+        despachante.enviar("INEXISTENTE", {"id": 3})
+        await despachante.drenar()
+
+        assert sorted(executadas) == [("aprovar", 1), ("recusar", 2)]
+
+    @pytest.mark.asyncio
+    async def test_falha_de_uma_acao_nao_interrompe_o_lote(self):
+        executadas = []
+
+        def aprovar(dados):
+            if dados["id"] == 2:
+                raise ConnectionError("banco indisponível")
+            executadas.append(dados["id"])
+
+        despachante = DespachanteDeAcoes(SinkAcoes({"APROVADO": aprovar}), tamanho_lote=4, janela=10)
+        for indice in range(1, 5):
+            despachante.enviar("APROVADO", {"id": indice})
+        despachante.enviar("INEXISTENTE", {"id": 5})
+        await despachante.drenar()
+
+        assert executadas == [1, 3, 4]
+        estatisticas = despachante.stats()
+        assert (estatisticas["entregues"], estatisticas["falhas"]) == (3, 2)
+
+    @pytest.mark.asyncio
+    async def test_sink_acoes_repassa_parametros(self):
+        executadas = []
+
+        async def aprovar(dados, params):
+            executadas.append((dados["id"], params))
+
+        despachante = DespachanteDeAcoes(SinkAcoes({"APROVADO": aprovar}))
+        despachante.enviar("APROVADO", {"id": 1}, {"limite": 5000})
+        despachante.enviar("APROVADO", {"id": 2})
+        await despachante.drenar()
+
+        assert executadas == [(1, {"limite": 5000}), (2, {})]
+
+    @pytest.mark.asyncio
+    async def test_motor_retorna_sem_esperar_a_acao(self):
+        sink = SinkLento()
+        despachante = DespachanteDeAcoes(sink, janela=0)
+        motor = MotorDeRegrasAsync(despachante=despachante)
+        solicitacao = {
+            "id": "REQ-1",
+            "pontuacao_credito": 800,
+            "renda_mensal": 7000,
+            "possui_divida_ativa": False,
+            "idade": 30,
+        }
+
+        resultado = await motor.decidir_async(solicitacao)
+        assert resultado.decisao == "APROVADO"
+        assert sink.lotes == []
+
+        await despachante.drenar()
+        assert sink.acoes == [Acao("APROVADO", solicitacao)]
+
+    def test_motor_recusa_despachante_com_outbox(self, tmp_path):
+        with Outbox(str(tmp_path / "outbox.jsonl"), drenar=False) as outbox:
+            with pytest.raises(ValueError):
+                MotorDeRegrasAsync(despachante=DespachanteDeAcoes(SinkMemoria()), outbox=outbox)
+
+    def test_decisao_sincrona_com_despachante_exige_event_loop(self):
+        motor = MotorDeRegrasAsync(despachante=DespachanteDeAcoes(SinkMemoria()))
+        solicitacao = {
+            "id": "REQ-1",
+            "pontuacao_credito": 800,
+            "renda_mensal": 7000,
+            "possui_divida_ativa": False,
+            "idade": 30,
+        }
+
+        with pytest.raises(RuntimeError, match="decidir_async"):
+            motor.decidir(solicitacao)
@@ -0,0 +1,86 @@
+import os
+import sys
+
+import pytest
+
+# Os benchmarks importam o motor e a lib a partir de src/
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.escalabilidade import serie_profundidade
+from benchmarks.gerador import FUNCOES_GERADAS, GeradorDeRegras
+from lib.compiler import compile_logic
+from lib.json_logic import jsonLogic
+
+
+def _profundidade(regra):
+    """Níveis de operações compostas abaixo do `if` de decisão."""
+    if not isinstance(regra, dict):
+        return -1
+    op, args = next(iter(regra.items()))
+    if op not in ("and", "or", "!", "if"):
+        return 0
+    return 1 + max(_profundidade(arg) for arg in args)
+
+
+class TestGeradorDeRegras:
+    """Testes para o gerador sintético de regras e registros."""
+
+    def test_reprodutivel_por_semente(self):
+        assert GeradorDeRegras(semente=3).regras(20) == GeradorDeRegras(semente=3).regras(20)
+        assert GeradorDeRegras(semente=3).registros(5) == GeradorDeRegras(semente=3).registros(5)
+        assert GeradorDeRegras(semente=3).regras(20) != GeradorDeRegras(semente=4).regras(20)
+
+    @pytest.mark.parametrize("profundidade", [0, 1, 5, 30])
+    def test_profundidade_exata(self, profundidade):
+        gerador = GeradorDeRegras(profundidade=profundidade)
+
+        for regra in gerador.regras(10):
+            condicao = regra["if"][0]
+            assert _profundidade(condicao) == profundidade
+
+    def test_regras_avaliam_nos_registros(self):
+        gerador = GeradorDeRegras(profundidade=6, profundidade_caminho=4, densidade_apply=0.5)
+        regras = gerador.regras(30)
+        registros = gerador.registros(5, campos_extras=3)
+
+        for regra in regras:
+            compilada = compile_logic(regra)
+            for registro in registros:
+                resultado = jsonLogic(regra, registro, FUNCOES_GERADAS)
+                assert resultado in ("APROVADO", "RECUSADO")
+                assert compilada.evaluate(registro, FUNCOES_GERADAS) == resultado
+
+    def test_caminhos_e_campos_extras(self):
+        gerador = GeradorDeRegras(profundidade_caminho=3, campos=8)
+        registro = gerador.registro(campos_extras=10)
+
+        assert all(caminho.count(".") == 2 for caminho in gerador.caminhos)
+        assert sum(chave.startswith("extra_") for chave in registro) == 10
+
+    def test_mix_de_operadores(self):
+        gerador = GeradorDeRegras(profundidade=3, ramificacao=4, mix_operadores={"or": 0, "!": 0, "if": 0, "in": 0, "!=": 0})
+        texto = repr(gerador.regras(20))
+
+        assert "'and'" in texto
+        assert "'or'" not in texto and "'in'" not in texto and "'!='" not in texto
+
+    def test_densidade_de_apply(self):
+        assert "apply" not in repr(GeradorDeRegras(densidade_apply=0).regras(50))
+        assert "apply" in repr(GeradorDeRegras(densidade_apply=1).regras(5))
+
+    def test_parametros_invalidos(self):
+        with pytest.raises(ValueError):
+            GeradorDeRegras(ramificacao=0)
+        with pytest.raises(ValueError):
+            GeradorDeRegras(mix_operadores={op: 0 for op in ("==", "!=", ">", ">=", "<", "<=", "in")})
+
+
+class TestEscalabilidade:
+    """Testes para o benchmark de escalabilidade."""
+
+    def test_serie_profundidade(self):
+        pontos = serie_profundidade([1, 3], regras=3, registros=2, repeticoes=2, aquecimento=0)
+
+        assert [ponto["profundidade"] for ponto in pontos] == [1, 3]
+        assert pontos[1]["nos_por_regra"] > pontos[0]["nos_por_regra"]
+        assert pontos[0]["compilado"]["ops_por_segundo"] > 0
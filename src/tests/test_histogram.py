@@ -0,0 +1,70 @@
+from src.lib.histogram import LatencyHistogram
+
+
+class TestLatencyHistogram:
+    """Testes para o histograma de latência log-linear."""
+
+    def test_histograma_vazio(self):
+        histograma = LatencyHistogram()
+
+        assert histograma.count == 0
+        assert histograma.percentile(0.99) == 0
+        assert histograma.summary()["count"] == 0
+
+    def test_valores_pequenos_sao_exatos(self):
+        histograma = LatencyHistogram()
+        for valor in range(1, 101):
+            histograma.record(valor)
+
+        assert histograma.percentile(0.5) == 50
+        assert histograma.percentile(0.99) == 99
+        assert histograma.summary()["min_ns"] == 1
+        assert histograma.summary()["max_ns"] == 100
+
+    def test_erro_relativo_limitado(self):
+        histograma = LatencyHistogram()
+        for valor in (1_000, 250_000, 3_000_000, 7_654_321_000):
+            histograma.record(valor)
+            registrado = histograma.summary()["max_ns"]
+            assert valor <= registrado <= valor * 1.016
+
+    def test_percentis_da_cauda(self):
+        histograma = LatencyHistogram()
+        for _ in range(990):
+            histograma.record(1_000)
+        for _ in range(9):
+            histograma.record(50_000)
+        histograma.record(2_000_000)
+
+        resumo = histograma.summary()
+        assert resumo["count"] == 1000
+        assert 1_000 <= resumo["p50_ns"] < 1_020
+        assert 1_000 <= resumo["p99_ns"] < 1_020
+        assert 50_000 <= resumo["p999_ns"] < 50_800
+        assert 2_000_000 <= resumo["max_ns"] < 2_032_000
+
+    def test_reset_retorna_valores_anteriores(self):
+        histograma = LatencyHistogram()
+        histograma.record(10)
+        histograma.record(20)
+
+        anterior = histograma.reset()
+
+        assert anterior.count == 2
+        assert anterior.summary()["mean_ns"] == 15
+        assert histograma.count == 0
+
+    def test_valores_acima_do_limite_vao_para_o_ultimo_bucket(self):
+        histograma = LatencyHistogram(max_value_bits=20)
+        histograma.record(1 << 30)
+
+        assert histograma.count == 1
+        assert histograma.summary()["max_ns"] < 1 << 20
+
+    def test_valores_negativos_contam_como_zero(self):
+        histograma = LatencyHistogram()
+        histograma.record(-1_000)
+        histograma.record(100)
+
+        assert histograma.summary()["mean_ns"] == 50
+        assert histograma.summary()["min_ns"] == 0
@@ -0,0 +1,117 @@
+import json
+
+import pytest
+
+from src.lib import compiler, json_logic
+from src.lib.compiler import compile_logic
+from src.lib.instrumentation import (
+    Profiler,
+    disable_profiling,
+    enable_profiling,
+    get_profiler,
+)
+from src.lib.json_logic import jsonLogic, jsonLogicAsync
+
+
+@pytest.fixture
+def profiler():
+    profiler = enable_profiling()
+    yield profiler
+    disable_profiling()
+
+
+def dobro(x):
+    return x * 2
+
+
+def falha(x):
+    raise ValueError("falhou")
+
+
+FUNCOES = {"dobro": dobro, "falha": falha}
+REGRA = {"and": [{">": [{"apply": ["dobro", {"var": "x"}]}, 5]}, {"==": [{"var": "y"}, "a"]}]}
+
+
+class TestInstrumentation:
+    """Testes para a instrumentação por operação e por função registrada."""
+
+    def test_desabilitada_por_padrao(self):
+        assert get_profiler() is None
+        assert json_logic._execute_operation.__module__ == json_logic.__name__
+
+    def test_registra_operacoes_e_funcoes(self, profiler):
+        assert jsonLogic(REGRA, {"x": 3, "y": "a"}, FUNCOES) is True
+
+        snapshot = profiler.snapshot()
+        operacoes = snapshot["operations"]
+        assert operacoes["and"]["calls"] == 1
+        assert operacoes["var"]["calls"] == 2
+        assert operacoes["apply"]["calls"] == 1
+        assert snapshot["functions"]["dobro"]["calls"] == 1
+
+        # O tempo próprio desconta o tempo dos filhos
+        assert operacoes["and"]["self_ns"] <= operacoes["and"]["total_ns"]
+        assert operacoes["and"]["total_ns"] >= operacoes[">"]["total_ns"]
+
+    def test_registra_regras_compiladas(self, profiler):
+        regra = compile_logic(REGRA)
+        regra.evaluate({"x": 1, "y": "b"}, FUNCOES)
+
+        snapshot = profiler.snapshot()
+        assert snapshot["operations"]["and"]["calls"] == 1
+        assert snapshot["operations"]["=="]["calls"] == 1
+        assert snapshot["operations"]["var"]["calls"] == 2
+        assert snapshot["functions"]["dobro"]["calls"] == 1
+
+    def test_registra_excecoes(self, profiler):
+        with pytest.raises(ValueError):
+            jsonLogic({"!": [{"apply": ["falha", 1]}]}, {}, FUNCOES)
+
+        snapshot = profiler.snapshot()
+        assert snapshot["functions"]["falha"]["errors"] == 1
+        assert snapshot["operations"]["!"]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_registra_avaliacao_assincrona(self, profiler):
+        async def triplo(x):
+            return x * 3
+
+        resultado = await jsonLogicAsync({"apply": ["triplo", {"var": "x"}]}, {"x": 2}, {"triplo": triplo})
+
+        assert resultado == 6
+        assert profiler.snapshot()["functions"]["triplo"]["calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_registra_regra_compilada_assincrona(self, profiler):
+        async def triplo(x):
+            return x * 3
+
+        regra = compile_logic({"and": [{">": [{"var": "x"}, 1]}, {"apply": ["triplo", {"var": "x"}]}]})
+        resultado = await regra.evaluate_async({"x": 2}, {"triplo": triplo})
+
+        snapshot = profiler.snapshot()
+        assert resultado is True
+        assert snapshot["operations"]["and"]["calls"] == 1
+        assert snapshot["operations"]["apply"]["calls"] == 1
+        assert snapshot["operations"]["var"]["calls"] == 2
+        assert snapshot["functions"]["triplo"]["calls"] == 1
+
+    def test_snapshot_serializavel_e_reset(self, profiler):
+        jsonLogic(REGRA, {"x": 3, "y": "a"}, FUNCOES)
+
+        assert "operations" in json.loads(profiler.to_json())
+        profiler.reset()
+        assert profiler.snapshot() == {"operations": {}, "functions": {}}
+
+    def test_desabilitar_restaura_avaliadores(self):
+        original_execute = json_logic._execute_operation
+        original_evaluate = compiler.BinaryOperation.evaluate
+
+        profiler = enable_profiling(Profiler())
+        assert get_profiler() is profiler
+        assert json_logic._execute_operation is not original_execute
+
+        disable_profiling()
+        assert get_profiler() is None
+        assert json_logic._execute_operation is original_execute
+        assert compiler.BinaryOperation.evaluate is original_evaluate
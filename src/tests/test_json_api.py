@@ -0,0 +1,27 @@
+import json
+import os
+import sys
+
+# Os benchmarks importam a API e a lib a partir de src/
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.json_api import executar_json_api, formatar_relatorio, gerar_solicitacao, provedores
+
+
+class TestJsonApi:
+    """Testes para o benchmark de JSON no caminho da API."""
+
+    def test_gerar_solicitacao_no_tamanho_pedido(self):
+        solicitacao = gerar_solicitacao(20_000, semente=1)
+
+        assert 20_000 <= len(json.dumps(solicitacao)) < 21_000
+        assert solicitacao == gerar_solicitacao(20_000, semente=1)
+
+    def test_executar_json_api(self):
+        resultado = executar_json_api([1_000, 5_000], requisicoes=2, repeticoes=1, aquecimento=0)
+        resultados = resultado["resultados"]
+
+        assert set(resultados) == {f"{nome}/{tamanho}" for nome in provedores() for tamanho in (1_000, 5_000)}
+        assert all(medida["requisicoes_por_segundo"] > 0 for medida in resultados.values())
+        assert resultados["json/5000"]["bytes_corpo"] > resultados["json/1000"]["bytes_corpo"]
+        assert "json/1000" in formatar_relatorio(resultado)
@@ -0,0 +1,86 @@
+import dataclasses
+import datetime
+import decimal
+import json
+import math
+import os
+import sys
+import uuid
+
+import pytest
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+# O provedor é importado a partir de src/
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from json_provider import FastJSONProvider
+
+
+@dataclasses.dataclass
+class Limite:
+    valor: int
+
+
+def _provedores():
+    app = Flask(__name__)
+    return FastJSONProvider(app), DefaultJSONProvider(app)
+
+
+class TestFastJSONProvider:
+    """Testes para o provedor JSON com codificação rápida opcional."""
+
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            {"b": 1, "a": [1.5, None, True, "ação"], "c": {"z": 1, "y": 2}},
+            {"data": datetime.datetime(2024, 5, 1, 12, 30), "dia": datetime.date(2024, 5, 1)},
+            {"id": uuid.UUID(int=7), "valor": decimal.Decimal("10.50"), "limite": Limite(3)},
+            {"grande": 2**70},
+            {1: "chave numérica"},
+            {"infinito": float("inf"), "valores": [None, {"minimo": float("-inf")}]},
+        ],
+    )
+    def test_mesmo_resultado_do_provedor_padrao(self, obj):
+        rapido, padrao = _provedores()
+
+        assert json.loads(rapido.dumps(obj)) == json.loads(padrao.dumps(obj))
+        assert rapido.loads(rapido.dumps(obj)) == padrao.loads(padrao.dumps(obj))
+
+    def test_nan_como_no_provedor_padrao(self):
+        rapido, padrao = _provedores()
+        obj = {"taxa": float("nan"), "limite": None}
+
+        assert rapido.dumps(obj) == padrao.dumps(obj)
+        assert math.isnan(rapido.loads(b'{"taxa": NaN}')["taxa"])
+        assert rapido.loads(b'{"a": Infinity}') == padrao.loads(b'{"a": Infinity}')
+
+    def test_chaves_ordenadas(self):
+        rapido, _ = _provedores()
+
+        assert rapido.dumps({"b": 1, "a": 2}).replace(" ", "") == '{"a":2,"b":1}'
+
+    def test_resposta(self):
+        app = Flask(__name__)
+        app.json = FastJSONProvider(app)
+
+        with app.app_context():
+            resposta = app.json.response({"resultado": [1, 2]})
+
+        assert resposta.mimetype == "application/json"
+        assert resposta.get_data().endswith(b"\n")
+        assert resposta.get_json() == {"resultado": [1, 2]}
+
+    def test_json_invalido_na_requisicao(self):
+        app = Flask(__name__)
+        app.json = FastJSONProvider(app)
+
+        @app.post("/eco")
+        def eco():
+            from flask import request
+
+            return app.json.response(request.get_json())
+
+        cliente = app.test_client()
+        assert cliente.post("/eco", data=b'{"a": 1}', content_type="application/json").get_json() == {"a": 1}
+        assert cliente.post("/eco", data=b'{"a": ', content_type="application/json").status_code == 400
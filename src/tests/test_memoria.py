@@ -0,0 +1,51 @@
+import json
+import os
+import sys
+
+# Os benchmarks importam o motor e a lib a partir de src/
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.memoria import REGRAS_COLECOES, executar_memoria, main, registrar_historico
+
+
+class TestMemoria:
+    """Testes para o benchmark de memória."""
+
+    def test_executar_memoria(self):
+        resultado = executar_memoria(avaliacoes=5, tamanho_colecoes=200, regras_geradas=20)
+        resultados = resultado["resultados"]
+
+        assert set(resultados["avaliacao"]) == {
+            f"{cenario}/{avaliador}"
+            for cenario in ("E-commerce", "Financeiro", "IoT")
+            for avaliador in ("jsonLogic", "compilado")
+        }
+        assert all(medida["pico_max_bytes"] >= medida["pico_medio_bytes"] > 0 for medida in resultados["avaliacao"].values())
+
+        gerado = resultados["carregamento"]["gerado"]
+        assert gerado["regras"] == 20
+        assert gerado["bytes_por_no_compilado"] > 0
+
+        assert set(resultados["colecoes"]) == {f"{operacao}/{avaliador}" for operacao in REGRAS_COLECOES for avaliador in ("jsonLogic", "compilado")}
+        assert resultados["colecoes"]["map/compilado"]["pico_bytes"] > 0
+        assert resultado["metadados"]["tamanho_colecoes"] == 200
+
+    def test_historico_em_json_lines(self, tmp_path):
+        historico = tmp_path / "historico" / "memoria.jsonl"
+
+        registrar_historico({"resultados": {"execucao": 1}}, str(historico))
+        registrar_historico({"resultados": {"execucao": 2}}, str(historico))
+
+        linhas = historico.read_text().splitlines()
+        assert [json.loads(linha)["resultados"]["execucao"] for linha in linhas] == [1, 2]
+
+    def test_main_registra_historico_apenas_quando_pedido(self, tmp_path, capsys):
+        historico = tmp_path / "memoria.jsonl"
+        argumentos = ["--avaliacoes", "2", "--tamanho", "50", "--regras", "5", "--historico", str(historico)]
+
+        main(argumentos)
+        assert not historico.exists()
+        assert "COLEÇÕES" in capsys.readouterr().out
+
+        main(argumentos + ["--registrar"])
+        assert len(historico.read_text().splitlines()) == 1
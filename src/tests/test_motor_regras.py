@@ -0,0 +1,270 @@
+import asyncio
+import copy
+import os
+import sys
+import time
+
+import pytest
+
+# O motor importa seus módulos a partir de src/
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from motor_regras import MotorDeRegrasAsync, MotorDeRegrasCustom, ResultadoDecisao
+
+
+def _solicitacao(**campos):
+    dados = {
+        "id": "REQ-TESTE",
+        "pontuacao_credito": 800,
+        "renda_mensal": 7000,
+        "valor_solicitado": 10000,
+        "possui_divida_ativa": False,
+        "idade": 30,
+    }
+    dados.update(campos)
+    return dados
+
+
+class TestMotorDeRegrasCustom:
+    """Testes para o motor de regras e seus modos de execução."""
+
+    def test_executar_grava_status_na_solicitacao(self):
+        """O modo legado continua gravando o status nos dados de entrada."""
+        motor = MotorDeRegrasCustom()
+        dados = _solicitacao()
+
+        resultado = motor.executar(dados)
+
+        assert resultado is dados
+        assert dados["status_final"] == "Aprovado"
+
+    def test_executar_grava_erro_de_validacao(self):
+        motor = MotorDeRegrasCustom()
+        dados = _solicitacao(pontuacao_credito=None)
+
+        motor.executar(dados)
+
+        assert dados["status_final"] == "Erro de Validação"
+        assert dados["detalhe_erro"] == "ERRO_SCORE_INVALIDO"
+
+    def test_decidir_nao_altera_a_entrada(self):
+        """decidir retorna o resultado sem copiar nem alterar os dados."""
+        motor = MotorDeRegrasCustom()
+        dados = _solicitacao(idade=17)
+        original = copy.deepcopy(dados)
+
+        resultado = motor.decidir(dados)
+
+        assert isinstance(resultado, ResultadoDecisao)
+        assert dados == original
+        assert resultado.dados is dados
+        assert resultado.decisao == "RECUSADO"
+        assert resultado.status == "Recusado"
+        assert resultado.erro is None
+        assert resultado.regras_disparadas == ("processamento",)
+
+    def test_decidir_com_erro_de_validacao(self):
+        motor = MotorDeRegrasCustom()
+        dados = _solicitacao(pontuacao_credito=None)
+
+        resultado = motor.decidir(dados)
+
+        assert "status_final" not in dados
+        assert resultado.decisao is None
+        assert resultado.status == "Erro de Validação"
+        assert resultado.erro == "ERRO_SCORE_INVALIDO"
+        assert resultado.regras_disparadas == ("validacao.0",)
+
+    def test_resultado_usa_slots(self):
+        resultado = ResultadoDecisao({"id": 1}, decisao="APROVADO")
+
+        assert not hasattr(resultado, "__dict__")
+
+    def test_latencias_por_regra_e_fase(self):
+        motor = MotorDeRegrasCustom()
+        motor.decidir(_solicitacao())
+        motor.decidir(_solicitacao())
+        motor.decidir(_solicitacao(pontuacao_credito=None))
+
+        latencias = motor.obter_latencias()
+
+        assert latencias["validacao.0"]["validacao"]["count"] == 3
+        assert latencias["validacao.0"]["acao"]["count"] == 1
+        assert latencias["processamento"]["processamento"]["count"] == 2
+        assert latencias["processamento"]["acao"]["count"] == 2
+        resumo = latencias["processamento"]["processamento"]
+        assert 0 < resumo["p50_ns"] <= resumo["p99_ns"] <= resumo["p999_ns"]
+
+    def test_obter_latencias_com_reset(self):
+        motor = MotorDeRegrasCustom()
+        motor.decidir(_solicitacao())
+
+        antes = motor.obter_latencias(resetar=True)
+        depois = motor.obter_latencias()
+
+        assert antes["processamento"]["processamento"]["count"] == 1
+        assert depois["processamento"]["processamento"]["count"] == 0
+
+    def test_explicar_registra_os_nos_avaliados(self):
+        motor = MotorDeRegrasCustom()
+
+        resultado = motor.decidir(_solicitacao(possui_divida_ativa=True), explicar=True)
+
+        assert resultado.decisao == "ANALISE_MANUAL"
+        assert set(resultado.trace) == {"validacao.0", "processamento"}
+        raiz = resultado.trace["processamento"][-1]
+        assert (raiz.depth, raiz.label, raiz.value) == (0, "if", "ANALISE_MANUAL")
+
+    def test_amostragem_de_trace(self):
+        motor = MotorDeRegrasCustom(amostragem_trace=3)
+
+        resultados = [motor.decidir(_solicitacao()) for _ in range(6)]
+
+        rastreados = [resultado.trace is not None for resultado in resultados]
+        assert rastreados == [True, False, False, True, False, False]
+
+    def test_sem_trace_por_padrao(self):
+        motor = MotorDeRegrasCustom()
+
+        assert motor.decidir(_solicitacao()).trace is None
+
+    def test_decisao_estruturada_em_uma_avaliacao(self):
+        """Os parâmetros da ação são calculados na mesma avaliação da regra."""
+        executadas = []
+        regra = {
+            "if": [
+                {"<": [{"var": "idade"}, 18]},
+                "RECUSADO",
+                {"apply": ["decisao", "APROVADO", "limite", {"*": [{"var": "renda_mensal"}, 3]}]},
+            ]
+        }
+        motor = MotorDeRegrasCustom(
+            regra_processamento=regra,
+            acoes={"APROVADO": lambda dados, params: executadas.append(params)},
+        )
+
+        resultado = motor.decidir(_solicitacao())
+
+        assert resultado.decisao == "APROVADO"
+        assert resultado.params == {"limite": 21000}
+        assert resultado.status == "Aprovado"
+        assert executadas == [{"limite": 21000}]
+        assert motor.decidir(_solicitacao(idade=17)).params == {}
+
+    def test_rejeita_acao_assincrona(self):
+        async def aprovar(dados, params):
+            pass
+
+        motor = MotorDeRegrasCustom(acoes={"APROVADO": aprovar})
+
+        with pytest.raises(TypeError, match="assíncrona"):
+            motor.decidir(_solicitacao())
+
+
+def _regra_verificacao(nome, atraso, falha):
+    """Regra de validação que chama uma verificação assíncrona."""
+    return {"if": [{"apply": ["verificar", nome, atraso, falha]}, f"ERRO_{nome}", None]}
+
+
+def _motor_com_verificacoes(*verificacoes):
+    """Motor assíncrono cujas regras de validação chamam `verificar`."""
+    chamadas = {"concluidas": [], "canceladas": []}
+
+    async def verificar(nome, atraso, falha):
+        try:
+            await asyncio.sleep(atraso)
+        except asyncio.CancelledError:
+            chamadas["canceladas"].append(nome)
+            raise
+        chamadas["concluidas"].append(nome)
+        return falha
+
+    motor = MotorDeRegrasAsync(
+        regras_validacao=[_regra_verificacao(*verificacao) for verificacao in verificacoes],
+        funcoes={"verificar": verificar},
+    )
+    return motor, chamadas
+
+
+class TestMotorDeRegrasAsync:
+    """Testes para o motor assíncrono com validação concorrente."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "campos",
+        [{}, {"pontuacao_credito": None}, {"idade": 17}, {"possui_divida_ativa": True}],
+    )
+    async def test_mesmo_resultado_do_motor_sincrono(self, campos):
+        esperado = MotorDeRegrasCustom().decidir(_solicitacao(**campos))
+        resultado = await MotorDeRegrasAsync().decidir_async(_solicitacao(**campos))
+
+        assert (resultado.decisao, resultado.status, resultado.erro, resultado.regras_disparadas) == (
+            esperado.decisao,
+            esperado.status,
+            esperado.erro,
+            esperado.regras_disparadas,
+        )
+
+    @pytest.mark.asyncio
+    async def test_validacoes_executam_concorrentemente(self):
+        motor, chamadas = _motor_com_verificacoes(("A", 0.1, False), ("B", 0.1, False), ("C", 0.1, False))
+
+        inicio = time.perf_counter()
+        resultado = await motor.executar_async(_solicitacao())
+
+        assert time.perf_counter() - inicio < 0.25
+        assert resultado["status_final"] == "Aprovado"
+        assert sorted(chamadas["concluidas"]) == ["A", "B", "C"]
+        assert set(motor.obter_latencias()) == {"validacao.0", "validacao.1", "validacao.2", "processamento"}
+
+    @pytest.mark.asyncio
+    async def test_primeiro_erro_na_ordem_da_lista(self):
+        # B falha primeiro, mas A (anterior) também falha e prevalece; C é cancelada
+        motor, chamadas = _motor_com_verificacoes(("A", 0.05, True), ("B", 0.01, True), ("C", 1, False))
+
+        inicio = time.perf_counter()
+        resultado = await motor.decidir_async(_solicitacao())
+
+        assert time.perf_counter() - inicio < 0.5
+        assert resultado.erro == "ERRO_A"
+        assert resultado.regras_disparadas == ("validacao.0",)
+        assert chamadas["canceladas"] == ["C"]
+
+    @pytest.mark.asyncio
+    async def test_falha_posterior_aguarda_regras_anteriores(self):
+        motor, chamadas = _motor_com_verificacoes(("A", 0.05, False), ("B", 0.01, True), ("C", 1, False))
+
+        resultado = await motor.decidir_async(_solicitacao())
+
+        assert resultado.erro == "ERRO_B"
+        assert chamadas == {"concluidas": ["B", "A"], "canceladas": ["C"]}
+
+    @pytest.mark.asyncio
+    async def test_aguarda_acao_assincrona(self):
+        executadas = []
+
+        async def aprovar(dados, params):
+            await asyncio.sleep(0)
+            executadas.append(dados["id"])
+
+        motor = MotorDeRegrasAsync(acoes={"APROVADO": aprovar})
+        resultado = await motor.decidir_async(_solicitacao())
+
+        assert resultado.decisao == "APROVADO"
+        assert executadas == ["REQ-TESTE"]
+
+    @pytest.mark.asyncio
+    async def test_explicar_registra_regras_sincronas(self):
+        resultado = await MotorDeRegrasAsync().decidir_async(_solicitacao(possui_divida_ativa=True), explicar=True)
+
+        assert resultado.decisao == "ANALISE_MANUAL"
+        assert set(resultado.trace) == {"validacao.0", "processamento"}
+
+    @pytest.mark.asyncio
+    async def test_explicar_registra_regras_assincronas(self):
+        motor, _ = _motor_com_verificacoes(("A", 0, False), ("B", 0, False))
+
+        resultado = await motor.decidir_async(_solicitacao(), explicar=True)
+
+        assert set(resultado.trace) == {"validacao.0", "validacao.1", "processamento"}
+        assert ("apply", False) in [(entrada.label, entrada.value) for entrada in resultado.trace["validacao.1"]]
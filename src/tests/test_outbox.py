@@ -0,0 +1,237 @@
+import asyncio
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+# O outbox importa seus módulos a partir de src/
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from acoes import RegistroDeAcoes
+from motor_regras import MotorDeRegrasAsync, MotorDeRegrasCustom
+from outbox import Outbox, executor_de_acoes, ler_log
+
+
+class Executor:
+    """Registra as ações executadas; falha nas decisões informadas."""
+
+    def __init__(self, falhar=()):
+        self.executadas = []
+        self.falhar = set(falhar)
+
+    def __call__(self, decisao, dados, params=None):
+        if decisao in self.falhar:
+            raise ConnectionError("banco indisponível")
+        self.executadas.append((decisao, dados["id"]))
+
+
+class TestOutbox:
+    """Testes para o outbox transacional de ações."""
+
+    def test_registra_executa_e_confirma(self, tmp_path):
+        caminho = str(tmp_path / "outbox.jsonl")
+        executor = Executor()
+
+        with Outbox(caminho, executor) as outbox:
+            assert outbox.registrar("APROVADO", {"id": 1}) == 1
+            assert outbox.registrar("RECUSADO", {"id": 2}) == 2
+            assert outbox.aguardar_drenagem(timeout=5)
+            assert outbox.stats()["confirmadas"] == 2
+
+        assert executor.executadas == [("APROVADO", 1), ("RECUSADO", 2)]
+        assert ler_log(caminho) == ({}, 2)
+
+    def test_registro_esta_em_disco_ao_retornar(self, tmp_path):
+        caminho = str(tmp_path / "outbox.jsonl")
+        outbox = Outbox(caminho, Executor(), drenar=False)
+
+        outbox.registrar("APROVADO", {"id": 1})
+        pendentes, ultimo_seq = ler_log(caminho)
+
+        assert ultimo_seq == 1
+        assert pendentes[1]["decisao"] == "APROVADO"
+        outbox.fechar()
+
+    def test_reexecuta_acoes_sem_confirmacao_apos_reinicio(self, tmp_path):
+        caminho = str(tmp_path / "outbox.jsonl")
+
+        # Simula uma queda: as ações são registradas, mas nunca executadas
+        outbox = Outbox(caminho, Executor(), drenar=False)
+        for indice in range(3):
+            outbox.registrar("APROVADO", {"id": indice})
+        outbox.fechar()
+        # Uma gravação interrompida deixa uma linha incompleta no fim do log
+        with open(caminho, "a", encoding="utf-8") as arquivo:
+            arquivo.write('{"seq": 4, "decis')
+
+        executor = Executor()
+        with Outbox(caminho, executor) as outbox:
+            assert outbox.aguardar_drenagem(timeout=5)
+            assert outbox.stats()["reexecutadas"] == 3
+            # A numeração continua depois das entradas recuperadas
+            assert outbox.registrar("RECUSADO", {"id": 9}) == 4
+            assert outbox.aguardar_drenagem(timeout=5)
+
+        assert executor.executadas == [("APROVADO", 0), ("APROVADO", 1), ("APROVADO", 2), ("RECUSADO", 9)]
+        assert ler_log(caminho)[0] == {}
+
+    def test_acao_com_falha_fica_pendente(self, tmp_path):
+        caminho = str(tmp_path / "outbox.jsonl")
+
+        with Outbox(caminho, Executor(falhar={"RECUSADO"})) as outbox:
+            outbox.registrar("RECUSADO", {"id": 1})
+            outbox.registrar("APROVADO", {"id": 2})
+            assert outbox.aguardar_drenagem(timeout=5)
+            assert outbox.stats()["falhas"] == 1
+
+        pendentes, _ = ler_log(caminho)
+        assert [registro["dados"]["id"] for registro in pendentes.values()] == [1]
+
+    def test_acao_assincrona_e_concluida_antes_da_confirmacao(self, tmp_path):
+        caminho = str(tmp_path / "outbox.jsonl")
+        executadas = []
+
+        async def aprovar(dados, params):
+            await asyncio.sleep(0)
+            executadas.append((dados["id"], params["limite"]))
+
+        async def recusar(dados):
+            raise ConnectionError("banco indisponível")
+
+        acoes = RegistroDeAcoes({"APROVADO": aprovar, "RECUSADO": recusar})
+        with Outbox(caminho, acoes.executar) as outbox:
+            outbox.registrar("APROVADO", {"id": 1}, {"limite": 5000})
+            outbox.registrar("RECUSADO", {"id": 2})
+            assert outbox.aguardar_drenagem(timeout=5)
+            estatisticas = outbox.stats()
+
+        assert executadas == [(1, 5000)]
+        assert estatisticas["confirmadas"] == 1
+        assert estatisticas["falhas"] == 1
+        pendentes, _ = ler_log(caminho)
+        assert list(pendentes) == [2]
+
+    def test_group_commit_agrupa_gravacoes_concorrentes(self, tmp_path):
+        caminho = str(tmp_path / "outbox.jsonl")
+
+        with Outbox(caminho, Executor(), janela_commit=0.01) as outbox:
+            threads = [
+                threading.Thread(target=outbox.registrar, args=("APROVADO", {"id": indice}))
+                for indice in range(40)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert outbox.aguardar_drenagem(timeout=5)
+            estatisticas = outbox.stats()
+
+        assert estatisticas["registradas"] == 40
+        assert estatisticas["fsyncs"] < 40
+
+    def test_params_da_decisao_sobrevivem_ao_reinicio(self, tmp_path):
+        caminho = str(tmp_path / "outbox.jsonl")
+        outbox = Outbox(caminho, Executor(), drenar=False)
+        outbox.registrar("APROVADO", {"id": 1}, {"limite": 5000})
+        outbox.registrar("RECUSADO", {"id": 2})
+        outbox.fechar()
+
+        executadas = []
+        with Outbox(caminho, lambda decisao, dados, params: executadas.append((decisao, params))) as outbox:
+            assert outbox.aguardar_drenagem(timeout=5)
+
+        assert executadas == [("APROVADO", {"limite": 5000}), ("RECUSADO", None)]
+
+    def test_motor_registra_a_acao_no_outbox(self, tmp_path):
+        caminho = str(tmp_path / "outbox.jsonl")
+        executor = Executor()
+
+        with Outbox(caminho, executor) as outbox:
+            motor = MotorDeRegrasCustom(outbox=outbox)
+            dados = motor.executar(
+                {
+                    "id": "REQ-1",
+                    "pontuacao_credito": 800,
+                    "renda_mensal": 7000,
+                    "possui_divida_ativa": False,
+                    "idade": 30,
+                }
+            )
+            assert outbox.aguardar_drenagem(timeout=5)
+
+        assert dados["status_final"] == "Aprovado"
+        assert executor.executadas == [("APROVADO", "REQ-1")]
+        with open(caminho, encoding="utf-8") as arquivo:
+            registros = [json.loads(linha) for linha in arquivo]
+        assert registros[0]["decisao"] == "APROVADO"
+        assert registros[1] == {"seq": 1, "confirmada": True}
+
+    def test_motor_vincula_o_proprio_registro_de_acoes(self, tmp_path):
+        caminho = str(tmp_path / "outbox.jsonl")
+        executadas = []
+        acoes = RegistroDeAcoes({"ESPECIAL": lambda dados: executadas.append(dados["id"])})
+
+        with Outbox(caminho) as outbox:
+            motor = MotorDeRegrasCustom(regra_processamento="ESPECIAL", acoes=acoes, outbox=outbox)
+            motor.executar({"id": "REQ-1", "pontuacao_credito": 800, "renda_mensal": 7000, "idade": 30})
+            assert outbox.aguardar_drenagem(timeout=5)
+            assert outbox.stats()["confirmadas"] == 1
+
+        assert executadas == ["REQ-1"]
+
+    def test_motor_recusa_outbox_com_outro_executor(self, tmp_path):
+        acoes = RegistroDeAcoes({"ESPECIAL": lambda dados: None})
+
+        with Outbox(str(tmp_path / "outbox.jsonl"), Executor()) as outbox:
+            with pytest.raises(ValueError):
+                MotorDeRegrasCustom(acoes=acoes, outbox=outbox)
+            # O executor do próprio registro é aceito
+            outbox.executar = executor_de_acoes(acoes)
+            MotorDeRegrasCustom(acoes=acoes, outbox=outbox)
+
+    def test_decisao_sem_acao_nao_e_confirmada(self, tmp_path):
+        caminho = str(tmp_path / "outbox.jsonl")
+        acoes = RegistroDeAcoes({"APROVADO": lambda dados: None})
+
+        with Outbox(caminho, executor_de_acoes(acoes)) as outbox:
+            outbox.registrar("DESCONHECIDA", {"id": 1})
+            outbox.registrar("APROVADO", {"id": 2})
+            assert outbox.aguardar_drenagem(timeout=5)
+            estatisticas = outbox.stats()
+
+        assert estatisticas["falhas"] == 1
+        assert estatisticas["confirmadas"] == 1
+        pendentes, _ = ler_log(caminho)
+        assert list(pendentes) == [1]
+
+    @pytest.mark.asyncio
+    async def test_registro_assincrono_nao_bloqueia_o_event_loop(self, tmp_path):
+        caminho = str(tmp_path / "outbox.jsonl")
+        executor = Executor()
+
+        with Outbox(caminho, executor, janela_commit=0.01) as outbox:
+            motor = MotorDeRegrasAsync(outbox=outbox)
+            resultados = await asyncio.gather(
+                *(
+                    motor.decidir_async(
+                        {
+                            "id": indice,
+                            "pontuacao_credito": 800,
+                            "renda_mensal": 7000,
+                            "possui_divida_ativa": False,
+                            "idade": 30,
+                        }
+                    )
+                    for indice in range(20)
+                )
+            )
+            # Com o event loop livre, as decisões concorrentes entram no mesmo grupo
+            assert outbox.stats()["fsyncs"] < 5
+            _, ultimo_seq = ler_log(caminho)
+            assert outbox.aguardar_drenagem(timeout=5)
+
+        assert {resultado.decisao for resultado in resultados} == {"APROVADO"}
+        assert ultimo_seq == 20
+        assert sorted(dados_id for _, dados_id in executor.executadas) == list(range(20))
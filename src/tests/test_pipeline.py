@@ -0,0 +1,199 @@
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+# O pipeline importa seus módulos a partir de src/
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from acoes import Decisao
+from lib.compiler import compile_logic
+from pipeline import (
+    EstagioAcao,
+    EstagioDecisao,
+    EstagioEnriquecimento,
+    EstagioPontuacao,
+    EstagioValidacao,
+    Pipeline,
+    campos_lidos,
+    pipeline_padrao,
+)
+
+
+def _solicitacao(**campos):
+    dados = {
+        "id": "REQ-TESTE",
+        "cpf": "123",
+        "pontuacao_credito": 800,
+        "renda_mensal": 7000,
+        "possui_divida_ativa": False,
+        "idade": 30,
+    }
+    dados.update(campos)
+    return dados
+
+
+class Consultas:
+    """Funções de enriquecimento assíncronas que registram as chamadas."""
+
+    def __init__(self, atraso=0.0):
+        self.atraso = atraso
+        self.chamadas = []
+
+    async def score_bureau(self, cpf):
+        self.chamadas.append(("score_bureau", cpf))
+        await asyncio.sleep(self.atraso)
+        return 300
+
+    async def renda_presumida(self, cpf):
+        self.chamadas.append(("renda_presumida", cpf))
+        await asyncio.sleep(self.atraso)
+        return 5000
+
+
+def _pipeline(consultas, executadas):
+    return Pipeline(
+        [
+            EstagioEnriquecimento("bureau", "score_bureau", le=("cpf",), escreve="score_bureau"),
+            EstagioEnriquecimento("renda", "renda_presumida", le=("cpf",), escreve="renda_presumida"),
+            EstagioValidacao("idade", {"if": [{"<": [{"var": "idade"}, 18]}, "MENOR_DE_IDADE", None]}),
+            EstagioPontuacao(
+                "risco",
+                {"+": [{"var": "score_bureau"}, {"var": "pontuacao_credito"}]},
+                escreve="risco",
+            ),
+            EstagioDecisao(
+                "decisao",
+                {
+                    "if": [
+                        {">": [{"var": "risco"}, 1000]},
+                        {"apply": ["decisao", "APROVADO", "limite", {"var": "renda_presumida"}]},
+                        "RECUSADO",
+                    ]
+                },
+            ),
+            EstagioAcao(acoes={"APROVADO": lambda dados, params: executadas.append((dados["id"], params))}),
+        ],
+        funcoes={"score_bureau": consultas.score_bureau, "renda_presumida": consultas.renda_presumida},
+    )
+
+
+class TestPipeline:
+    """Testes para o pipeline de estágios."""
+
+    def test_campos_lidos_da_regra(self):
+        assert campos_lidos(compile_logic({"+": [{"var": "a.b"}, {"var": ["c", 0]}]})) == {"a", "c"}
+        assert campos_lidos(compile_logic({"var": {"cat": ["a", "b"]}})) is None
+        assert campos_lidos(compile_logic({"var": ""})) is None
+
+    def test_niveis_por_dependencia(self):
+        pipeline = _pipeline(Consultas(), [])
+
+        niveis = [[estagio.nome for estagio in nivel] for nivel in pipeline.niveis]
+
+        assert niveis == [["bureau", "renda", "idade"], ["risco"], ["decisao"], ["acao"]]
+
+    @pytest.mark.asyncio
+    async def test_executa_estagios_e_acao(self):
+        consultas, executadas = Consultas(), []
+        dados = _solicitacao()
+
+        resultado = await _pipeline(consultas, executadas).executar_async(dados)
+
+        assert resultado.erro is None
+        assert resultado.decisao == Decisao("APROVADO", {"limite": 5000})
+        assert resultado.contexto["risco"] == 1100
+        assert executadas == [("REQ-TESTE", {"limite": 5000})]
+        assert "risco" not in dados
+
+    @pytest.mark.asyncio
+    async def test_estagios_independentes_em_paralelo(self):
+        consultas = Consultas(atraso=0.05)
+
+        inicio = time.perf_counter()
+        await _pipeline(consultas, []).executar_async(_solicitacao())
+        duracao = time.perf_counter() - inicio
+
+        assert duracao < 0.09
+
+    @pytest.mark.asyncio
+    async def test_validacao_interrompe_antes_da_acao(self):
+        executadas = []
+
+        resultado = await _pipeline(Consultas(), executadas).executar_async(_solicitacao(idade=17))
+
+        assert resultado.erro == "MENOR_DE_IDADE"
+        assert resultado.estagio_erro == "idade"
+        assert resultado.decisao is None
+        assert executadas == []
+
+    @pytest.mark.asyncio
+    async def test_primeira_validacao_na_ordem_da_lista(self):
+        pipeline = Pipeline(
+            [
+                EstagioPontuacao("dobro", {"*": [{"var": "valor"}, 2]}, escreve="dobro"),
+                EstagioValidacao("dobro_alto", {"if": [{">": [{"var": "dobro"}, 10]}, "DOBRO_ALTO", None]}),
+                EstagioValidacao("valor_alto", {"if": [{">": [{"var": "valor"}, 4]}, "VALOR_ALTO", None]}),
+            ]
+        )
+        # "valor_alto" executa no primeiro nível, mas "dobro_alto" vem antes na lista
+        assert pipeline.niveis[0][-1].nome == "valor_alto"
+
+        resultado = await pipeline.executar_async({"valor": 6})
+
+        assert resultado.estagio_erro == "dobro_alto"
+        assert pipeline.executar({"valor": 6}).estagio_erro == "dobro_alto"
+
+    @pytest.mark.asyncio
+    async def test_descarta_estagios_do_mesmo_nivel_posteriores_a_falha(self):
+        pipeline = Pipeline(
+            [
+                EstagioValidacao("cpf", {"if": [{"==": [{"var": "cpf"}, None]}, "CPF_OBRIGATORIO", None]}),
+                EstagioEnriquecimento("score", lambda cpf: int(cpf[:3]), le=("cpf",), escreve="score"),
+                EstagioPontuacao("nome", {"cat": ["Sr. ", {"var": "nome"}]}, escreve="tratamento"),
+            ]
+        )
+        # Os três estágios são independentes e executam no mesmo nível
+        assert len(pipeline.niveis) == 1
+
+        esperado = pipeline.executar({"cpf": None, "nome": "Ana"})
+        resultado = await pipeline.executar_async({"cpf": None, "nome": "Ana"})
+
+        assert (resultado.erro, resultado.estagio_erro) == (esperado.erro, esperado.estagio_erro) == (
+            "CPF_OBRIGATORIO",
+            "cpf",
+        )
+        assert "tratamento" not in resultado.contexto
+        assert resultado.executados == esperado.executados == []
+        assert resultado.entradas == esperado.entradas
+
+    @pytest.mark.asyncio
+    async def test_pula_estagios_com_entradas_inalteradas(self):
+        consultas, executadas = Consultas(), []
+        pipeline = _pipeline(consultas, executadas)
+
+        primeiro = await pipeline.executar_async(_solicitacao())
+        segundo = await pipeline.executar_async(_solicitacao(pontuacao_credito=600), anterior=primeiro)
+
+        assert segundo.pulados == ["bureau", "renda", "idade"]
+        assert segundo.executados == ["risco", "decisao", "acao"]
+        assert len(consultas.chamadas) == 2
+        assert segundo.decisao == Decisao("RECUSADO", {})
+
+    def test_execucao_sincrona(self):
+        executadas = []
+        pipeline = pipeline_padrao(acoes={"APROVADO": lambda dados: executadas.append(dados["id"])})
+
+        assert pipeline.executar(_solicitacao()).decisao == Decisao("APROVADO", {})
+        assert pipeline.executar(_solicitacao(pontuacao_credito=None)).erro == "ERRO_SCORE_INVALIDO"
+        assert executadas == ["REQ-TESTE"]
+
+    def test_execucao_sincrona_rejeita_funcao_assincrona(self):
+        with pytest.raises(TypeError):
+            _pipeline(Consultas(), []).executar(_solicitacao())
+
+    def test_nomes_duplicados(self):
+        with pytest.raises(ValueError):
+            Pipeline([EstagioPontuacao("a", 1, escreve="x"), EstagioPontuacao("a", 2, escreve="y")])
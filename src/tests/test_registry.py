@@ -0,0 +1,418 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.lib.json_logic import has_async_functions, jsonLogic, jsonLogicAsync, jsonLogicAuto
+from src.lib.registry import FunctionOverloadedError, FunctionRegistry
+
+
+class TestFunctionRegistry:
+    """Testes para o registro de funções com políticas de execução."""
+
+    def test_registro_e_um_dicionario_de_funcoes(self):
+        funcoes = FunctionRegistry({"dobro": lambda x: x * 2})
+
+        @funcoes.register("triplo")
+        def triplo(x):
+            return x * 3
+
+        assert triplo(2) == 6
+        assert jsonLogic({"+": [{"apply": ["dobro", 2]}, {"apply": ["triplo", 1]}]}, {}, funcoes) == 7
+
+    def test_classificacao_sincrona_e_assincrona_no_registro(self):
+        async def buscar(x):
+            return x
+
+        funcoes = FunctionRegistry({"dobro": lambda x: x * 2})
+        assert not funcoes.async_functions
+        assert not has_async_functions(funcoes)
+
+        funcoes.register("buscar", buscar, coalesce=True, max_concurrency=2)
+        funcoes["outra"] = buscar
+        assert funcoes.async_functions == {"buscar", "outra"}
+        assert funcoes.is_async("buscar") and not funcoes.is_async("dobro")
+        resultado = jsonLogicAuto({"apply": ["buscar", 1]}, {}, funcoes)
+        assert asyncio.iscoroutine(resultado)
+        resultado.close()
+
+        funcoes["outra"] = lambda x: x
+        del funcoes["buscar"]
+        assert not funcoes.async_functions
+        assert "buscar" not in funcoes.stats()
+        assert jsonLogicAuto({"apply": ["dobro", 2]}, {}, funcoes) == 4
+
+    @pytest.mark.asyncio
+    async def test_limite_de_concorrencia(self):
+        funcoes = FunctionRegistry()
+        em_andamento = 0
+        pico = 0
+
+        async def buscar(x):
+            nonlocal em_andamento, pico
+            em_andamento += 1
+            pico = max(pico, em_andamento)
+            await asyncio.sleep(0.01)
+            em_andamento -= 1
+            return x
+
+        funcoes.register("buscar", buscar, max_concurrency=3)
+        regra = {"apply": ["buscar", {"var": "x"}]}
+
+        resultados = await asyncio.gather(*(jsonLogicAsync(regra, {"x": i}, funcoes) for i in range(20)))
+
+        assert resultados == list(range(20))
+        assert pico == 3
+        estatisticas = funcoes.stats()["buscar"]["concurrency"]
+        assert estatisticas["calls"] == 20
+        assert estatisticas["active"] == estatisticas["queued"] == 0
+        assert estatisticas["max_queued"] == 17
+
+    @pytest.mark.asyncio
+    async def test_fila_cheia_rejeita_imediatamente(self):
+        funcoes = FunctionRegistry()
+        liberar = asyncio.Event()
+
+        async def lenta():
+            await liberar.wait()
+            return "ok"
+
+        funcoes.register("lenta", lenta, max_concurrency=2, max_queue=1)
+        tarefas = [asyncio.create_task(jsonLogicAsync({"apply": ["lenta"]}, {}, funcoes)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(FunctionOverloadedError, match="lenta"):
+            await jsonLogicAsync({"apply": ["lenta"]}, {}, funcoes)
+
+        liberar.set()
+        assert await asyncio.gather(*tarefas) == ["ok"] * 3
+        assert funcoes.stats()["lenta"]["concurrency"]["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelamento_na_fila_libera_a_vaga(self):
+        funcoes = FunctionRegistry()
+        liberar = asyncio.Event()
+
+        async def lenta():
+            await liberar.wait()
+
+        funcoes.register("lenta", lenta, max_concurrency=1)
+        primeira = asyncio.create_task(funcoes["lenta"]())
+        na_fila = asyncio.create_task(funcoes["lenta"]())
+        await asyncio.sleep(0)
+
+        na_fila.cancel()
+        await asyncio.sleep(0)
+        liberar.set()
+        await primeira
+
+        assert funcoes.stats()["lenta"]["concurrency"]["active"] == 0
+        assert funcoes.stats()["lenta"]["concurrency"]["queued"] == 0
+        await funcoes["lenta"]()
+
+    @pytest.mark.asyncio
+    async def test_cancelamento_apos_liberacao(self):
+        from src.lib.registry import ConcurrencyLimiter
+
+        limite = ConcurrencyLimiter("lenta", max_concurrency=1)
+        await limite.acquire()
+        na_fila = asyncio.create_task(limite.acquire())
+        await asyncio.sleep(0)
+
+        # release() descarta o waiter cancelado antes de a tarefa tratar o cancelamento
+        na_fila.cancel()
+        limite.release()
+
+        with pytest.raises(asyncio.CancelledError):
+            await na_fila
+        assert limite.stats()["active"] == 0
+        assert limite.stats()["queued"] == 0
+
+    def test_limite_exige_funcao_assincrona(self):
+        funcoes = FunctionRegistry()
+
+        with pytest.raises(ValueError):
+            funcoes.register("sync", lambda: 1, max_concurrency=2)
+        with pytest.raises(ValueError):
+            funcoes.register("sem_limite", lambda: 1, max_queue=2)
+        with pytest.raises(ValueError):
+            funcoes.register("sync", lambda: 1, coalesce=True)
+
+    @pytest.mark.asyncio
+    async def test_coalescencia_de_chamadas_identicas(self):
+        funcoes = FunctionRegistry()
+        chamadas = []
+
+        async def buscar_usuario(user_id):
+            chamadas.append(user_id)
+            await asyncio.sleep(0.01)
+            return {"id": user_id}
+
+        funcoes.register("fetch_user", buscar_usuario, coalesce=True)
+        regra = {"apply": ["fetch_user", {"var": "id"}]}
+
+        resultados = await asyncio.gather(*(jsonLogicAsync(regra, {"id": 100 + i % 2}, funcoes) for i in range(50)))
+
+        assert sorted(chamadas) == [100, 101]
+        assert resultados[0] == {"id": 100} and resultados[1] == {"id": 101}
+        assert funcoes.stats()["fetch_user"]["coalescing"] == {"calls": 50, "coalesced": 48, "in_flight": 0}
+
+        # Depois que a chamada termina, uma nova chamada vai ao serviço novamente
+        await jsonLogicAsync(regra, {"id": 100}, funcoes)
+        assert len(chamadas) == 3
+
+    @pytest.mark.asyncio
+    async def test_coalescencia_com_argumentos_sem_hash(self):
+        funcoes = FunctionRegistry()
+        chamadas = []
+
+        async def consultar(filtro):
+            chamadas.append(filtro)
+            await asyncio.sleep(0.01)
+            return len(filtro["ids"])
+
+        funcoes.register("consultar", consultar, coalesce=True)
+
+        resultados = await asyncio.gather(
+            funcoes["consultar"]({"ids": [1, 2]}),
+            funcoes["consultar"]({"ids": [1, 2]}),
+            funcoes["consultar"]({"ids": [1, 2, 3]}),
+        )
+
+        assert resultados == [2, 2, 3]
+        assert len(chamadas) == 2
+
+    @pytest.mark.asyncio
+    async def test_coalescencia_propaga_excecao_e_cancelamento_isolado(self):
+        funcoes = FunctionRegistry()
+        liberar = asyncio.Event()
+
+        async def falha(x):
+            await liberar.wait()
+            raise ValueError("indisponível")
+
+        funcoes.register("falha", falha, coalesce=True)
+        cancelada = asyncio.create_task(funcoes["falha"](1))
+        chamadores = [asyncio.create_task(funcoes["falha"](1)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        cancelada.cancel()
+        await asyncio.sleep(0)
+        liberar.set()
+
+        for chamador in chamadores:
+            with pytest.raises(ValueError, match="indisponível"):
+                await chamador
+        assert cancelada.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_coalescencia_com_limite_de_concorrencia(self):
+        """Chamadas coalescidas não ocupam vagas do limite de concorrência."""
+        funcoes = FunctionRegistry()
+
+        async def buscar(x):
+            await asyncio.sleep(0.01)
+            return x
+
+        funcoes.register("buscar", buscar, coalesce=True, max_concurrency=1, max_queue=0)
+
+        assert await asyncio.gather(*(funcoes["buscar"](7) for _ in range(10))) == [7] * 10
+        estatisticas = funcoes.stats()["buscar"]
+        assert estatisticas["concurrency"]["rejected"] == 0
+        assert estatisticas["coalescing"]["coalesced"] == 9
+
+    def test_chave_distingue_tipos(self):
+        from src.lib.registry import _make_key
+
+        assert _make_key((1,)) != _make_key((True,))
+        assert _make_key(({"a": [1]},)) == _make_key(({"a": [1]},))
+        assert _make_key(({"a": [1]},)) != _make_key(({"a": (1,)},))
+        # Os tipos também distinguem os valores aninhados
+        assert len({_make_key(([1],)), _make_key(([1.0],)), _make_key(([True],))}) == 3
+        assert _make_key(((1,),)) != _make_key(((True,),))
+        assert _make_key(({1: "a"},)) != _make_key(({True: "a"},))
+
+    def test_memoizacao_de_funcao_pura(self):
+        funcoes = FunctionRegistry()
+        chamadas = []
+
+        def calcular_frete(peso, cep):
+            chamadas.append((peso, cep))
+            return peso * 2.5
+
+        funcoes.register("frete", calcular_frete, pure=True)
+        regra = {"apply": ["frete", {"var": "peso"}, {"var": "cep"}]}
+
+        resultados = [jsonLogic(regra, {"peso": peso, "cep": "01000"}, funcoes) for peso in (1, 2, 1, 1, 2)]
+
+        assert resultados == [2.5, 5.0, 2.5, 2.5, 5.0]
+        assert chamadas == [(1, "01000"), (2, "01000")]
+        estatisticas = funcoes.stats()["frete"]["cache"]
+        assert (estatisticas["hits"], estatisticas["misses"], estatisticas["size"]) == (3, 2, 2)
+        assert estatisticas["hit_rate"] == 0.6
+
+    def test_substituir_funcao_descarta_as_politicas(self):
+        funcoes = FunctionRegistry()
+        funcoes.register("frete", lambda peso: peso * 2.5, pure=True)
+        assert jsonLogic({"apply": ["frete", 2]}, {}, funcoes) == 5.0
+
+        funcoes["frete"] = lambda peso: peso * 3
+
+        assert "frete" not in funcoes.stats()
+        assert jsonLogic({"apply": ["frete", 2]}, {}, funcoes) == 6
+        # Registrar de novo com políticas volta a incluí-las
+        funcoes.register("frete", lambda peso: peso, pure=True)
+        assert set(funcoes.stats()["frete"]) == {"cache"}
+
+    def test_memoizacao_lru_com_argumentos_sem_hash(self):
+        funcoes = FunctionRegistry()
+        chamadas = []
+
+        def soma(valores):
+            chamadas.append(valores)
+            return sum(valores)
+
+        funcoes.register("soma", soma, pure=True, cache_size=2)
+
+        for valores in ([1], [2], [1], [3], [2]):
+            funcoes["soma"](valores)
+
+        # [2] foi o menos usado quando [3] entrou, e precisou ser recalculado
+        assert chamadas == [[1], [2], [3], [2]]
+        assert funcoes.stats()["soma"]["cache"]["evictions"] == 2
+
+    def test_memoizacao_com_ttl(self, monkeypatch):
+        from src.lib import registry
+
+        agora = [100.0]
+        monkeypatch.setattr(registry.time, "monotonic", lambda: agora[0])
+        funcoes = FunctionRegistry()
+        chamadas = []
+        funcoes.register("f", lambda x: chamadas.append(x) or x, pure=True, ttl=10)
+
+        funcoes["f"](1)
+        agora[0] += 5
+        funcoes["f"](1)
+        agora[0] += 6
+        funcoes["f"](1)
+
+        assert chamadas == [1, 1]
+        assert funcoes.stats()["f"]["cache"]["expirations"] == 1
+
+    def test_excecoes_nao_sao_memoizadas(self):
+        funcoes = FunctionRegistry()
+        tentativas = []
+
+        def instavel(x):
+            tentativas.append(x)
+            if len(tentativas) == 1:
+                raise ConnectionError("falhou")
+            return x
+
+        funcoes.register("instavel", instavel, pure=True)
+
+        with pytest.raises(ConnectionError):
+            funcoes["instavel"](1)
+        assert funcoes["instavel"](1) == 1
+        assert funcoes["instavel"](1) == 1
+        assert len(tentativas) == 2
+
+    @pytest.mark.asyncio
+    async def test_memoizacao_de_funcao_assincrona(self):
+        funcoes = FunctionRegistry()
+        chamadas = []
+
+        async def score_externo(cpf):
+            chamadas.append(cpf)
+            await asyncio.sleep(0)
+            return 700
+
+        funcoes.register("score", score_externo, pure=True, coalesce=True)
+        regra = {">": [{"apply": ["score", {"var": "cpf"}]}, 600]}
+
+        assert await jsonLogicAsync(regra, {"cpf": "123"}, funcoes) is True
+        assert await jsonLogicAsync(regra, {"cpf": "123"}, funcoes) is True
+
+        assert chamadas == ["123"]
+        estatisticas = funcoes.stats()["score"]
+        assert estatisticas["cache"]["hits"] == 1
+        # O acerto no cache não chega à coalescência
+        assert estatisticas["coalescing"]["calls"] == 1
+
+        funcoes.clear_caches()
+        await jsonLogicAsync(regra, {"cpf": "123"}, funcoes)
+        assert len(chamadas) == 2
+
+    @pytest.mark.asyncio
+    async def test_funcao_bloqueante_nao_trava_o_event_loop(self):
+        funcoes = FunctionRegistry(max_blocking_workers=2)
+
+        def consulta_legada(x):
+            time.sleep(0.1)
+            return x * 2
+
+        funcoes.register("consulta", consulta_legada, blocking=True)
+        assert funcoes.is_async("consulta")
+
+        ticks = 0
+
+        async def relogio():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        tarefa = asyncio.create_task(relogio())
+        resultado = await jsonLogicAsync({"apply": ["consulta", 21]}, {}, funcoes)
+        tarefa.cancel()
+
+        assert resultado == 42
+        assert ticks >= 5
+        funcoes.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_saturacao_do_pool_de_threads(self):
+        funcoes = FunctionRegistry(max_blocking_workers=1)
+        liberar = threading.Event()
+        chamadas = []
+
+        def bloqueante(x):
+            chamadas.append(x)
+            liberar.wait(1)
+            return x
+
+        funcoes.register("bloqueante", bloqueante, blocking=True)
+        primeira = asyncio.create_task(funcoes["bloqueante"](1))
+        segunda = asyncio.create_task(funcoes["bloqueante"](2))
+        await asyncio.sleep(0.05)
+
+        estatisticas = funcoes.stats()["bloqueante"]["blocking"]
+        assert estatisticas["running"] == 1
+        assert estatisticas["queued"] == 1
+        assert estatisticas["saturated"] == 1
+        assert estatisticas["saturation"] == 1.0
+
+        # Uma chamada cancelada ainda na fila não chega a ser executada
+        segunda.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await segunda
+        liberar.set()
+        assert await primeira == 1
+
+        estatisticas = funcoes.stats()["bloqueante"]["blocking"]
+        assert chamadas == [1]
+        assert (estatisticas["running"], estatisticas["queued"], estatisticas["calls"]) == (0, 0, 2)
+        funcoes.shutdown()
+
+    def test_bloqueante_exige_funcao_sincrona(self):
+        async def assincrona():
+            return 1
+
+        funcoes = FunctionRegistry()
+        with pytest.raises(ValueError):
+            funcoes.register("assincrona", assincrona, blocking=True)
+
+        # Com blocking, a função síncrona aceita as políticas de funções assíncronas
+        funcoes.register("bloqueante", lambda x: x, blocking=True, max_concurrency=2, coalesce=True)
+        assert set(funcoes.stats()["bloqueante"]) == {"blocking", "concurrency", "coalescing"}
@@ -0,0 +1,92 @@
+import json
+import os
+import sys
+
+import pytest
+
+# Os benchmarks importam o motor e a lib a partir de src/
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.medicao import resumir
+from benchmarks.regressao import (
+    SITUACAO_AUSENTE,
+    SITUACAO_MELHORIA,
+    SITUACAO_NOVO,
+    SITUACAO_OK,
+    SITUACAO_REGRESSAO,
+    comparar,
+    main,
+    mann_whitney_u,
+)
+
+REFERENCIA = [100.0, 101.0, 99.0, 100.5, 98.5, 100.2, 99.8, 101.5, 99.1, 100.9]
+
+
+def _resultado(**benchmarks):
+    return {
+        "metadados": {"operacoes": 1, "repeticoes": 10, "aquecimento": 0, "semente": 42},
+        "resultados": {nome: resumir(amostras) for nome, amostras in benchmarks.items()},
+    }
+
+
+def _escalar(amostras, fator):
+    return [valor * fator for valor in amostras]
+
+
+class TestRegressao:
+    """Testes para a verificação de regressão de desempenho."""
+
+    def test_mann_whitney_detecta_deslocamento(self):
+        _, p_valor = mann_whitney_u(_escalar(REFERENCIA, 1.5), REFERENCIA)
+        assert p_valor < 0.001
+
+        _, p_valor = mann_whitney_u(REFERENCIA, _escalar(REFERENCIA, 1.5))
+        assert p_valor > 0.99
+
+    def test_mann_whitney_amostras_iguais(self):
+        u, p_valor = mann_whitney_u([5.0] * 4, [5.0] * 4)
+
+        assert u == 8
+        assert p_valor == 1.0
+
+    def test_mann_whitney_amostras_vazias(self):
+        with pytest.raises(ValueError):
+            mann_whitney_u([], REFERENCIA)
+
+    def test_comparar_classifica_benchmarks(self):
+        referencia = _resultado(lento=REFERENCIA, rapido=REFERENCIA, estavel=REFERENCIA, removido=REFERENCIA)
+        atual = _resultado(
+            lento=_escalar(REFERENCIA, 1.3),
+            rapido=_escalar(REFERENCIA, 0.7),
+            estavel=_escalar(REFERENCIA, 1.01),
+            adicionado=REFERENCIA,
+        )
+
+        situacoes = {comparacao.nome: comparacao.situacao for comparacao in comparar(referencia, atual)}
+
+        assert situacoes == {
+            "lento": SITUACAO_REGRESSAO,
+            "rapido": SITUACAO_MELHORIA,
+            "estavel": SITUACAO_OK,
+            "removido": SITUACAO_AUSENTE,
+            "adicionado": SITUACAO_NOVO,
+        }
+
+    def test_piora_dentro_da_tolerancia_nao_falha(self):
+        """Uma piora significativa, porém menor que a tolerância, é aceita."""
+        comparacoes = comparar(_resultado(a=REFERENCIA), _resultado(a=_escalar(REFERENCIA, 1.05)), tolerancia=0.10)
+
+        assert comparacoes[0].situacao == SITUACAO_OK
+        assert comparacoes[0].variacao == pytest.approx(0.05)
+
+    def test_main_retorna_codigo_de_saida(self, tmp_path, capsys):
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps(_resultado(a=REFERENCIA)))
+        regredido = tmp_path / "regredido.json"
+        regredido.write_text(json.dumps(_resultado(a=_escalar(REFERENCIA, 2))))
+        igual = tmp_path / "igual.json"
+        igual.write_text(json.dumps(_resultado(a=REFERENCIA)))
+
+        assert main(["--baseline", str(baseline), "--atual", str(regredido)]) == 1
+        assert main(["--baseline", str(baseline), "--atual", str(igual)]) == 0
+        assert "regressao" in capsys.readouterr().out
@@ -0,0 +1,187 @@
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# O repositório importa seus módulos a partir de src/
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from motor_regras import MotorDeRegrasAsync, MotorDeRegrasCustom
+from regras import REGRA_PROCESSAMENTO, REGRAS_VALIDACAO
+from repositorio_regras import RepositorioDeRegras, hash_regra
+
+
+def _gravar(caminho, regra):
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(regra, arquivo)
+    # Garante uma assinatura diferente mesmo em sistemas de arquivos com datas de baixa resolução
+    estado = os.stat(caminho)
+    os.utime(caminho, ns=(estado.st_atime_ns, estado.st_mtime_ns + 1_000_000))
+
+
+def _solicitacao(**campos):
+    dados = {
+        "id": "REQ-TESTE",
+        "pontuacao_credito": 800,
+        "renda_mensal": 7000,
+        "possui_divida_ativa": False,
+        "idade": 30,
+    }
+    dados.update(campos)
+    return dados
+
+
+class TestRepositorioDeRegras:
+    """Testes para o repositório de regras com recarga a quente."""
+
+    def test_hash_independe_da_formatacao(self):
+        assert hash_regra({"a": 1, "b": [1, 2]}) == hash_regra(json.loads('{ "b": [1,2],  "a": 1 }'))
+        assert hash_regra({"a": 1}) != hash_regra({"a": 2})
+
+    def test_recarga_reaproveita_regras_inalteradas(self, tmp_path):
+        _gravar(tmp_path / "maior.json", {">": [{"var": "x"}, 1]})
+        _gravar(tmp_path / "menor.json", {"<": [{"var": "x"}, 1]})
+        repositorio = RepositorioDeRegras(str(tmp_path), intervalo=None)
+        versao_1 = repositorio.atual
+
+        _gravar(tmp_path / "menor.json", {"<": [{"var": "x"}, 10]})
+        assert repositorio.recarregar()
+        versao_2 = repositorio.atual
+
+        assert versao_2.versao == 2
+        assert versao_2["maior"] is versao_1["maior"]
+        assert versao_2["menor"] is not versao_1["menor"]
+        assert versao_2["menor"].evaluate({"x": 5}) is True
+        # A versão anterior continua válida para quem ainda a usa
+        assert versao_1["menor"].evaluate({"x": 5}) is False
+        assert repositorio.stats()["compiladas"] == 3
+        assert repositorio.stats()["reaproveitadas"] == 1
+
+    def test_sem_mudanca_de_conteudo_nao_publica_versao(self, tmp_path):
+        _gravar(tmp_path / "regra.json", {"==": [1, 1]})
+        repositorio = RepositorioDeRegras(str(tmp_path), intervalo=None)
+
+        _gravar(tmp_path / "regra.json", {"==": [1, 1]})
+
+        assert not repositorio.recarregar()
+        assert repositorio.atual.versao == 1
+
+    def test_versao_invalida_mantem_a_atual(self, tmp_path):
+        bundle = tmp_path / "regras.json"
+        _gravar(bundle, {"regra": {"==": [1, 1]}})
+        repositorio = RepositorioDeRegras(str(bundle), intervalo=None)
+
+        _gravar(bundle, {"regra": {"operacao_inexistente": [1]}})
+
+        assert not repositorio.recarregar()
+        assert repositorio.atual.versao == 1
+        assert repositorio.regra("regra").evaluate() is True
+        assert isinstance(repositorio.ultimo_erro, RuntimeError)
+
+    def test_carga_inicial_invalida(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            RepositorioDeRegras(str(tmp_path / "inexistente.json"), intervalo=None)
+
+    def test_observa_a_origem_em_segundo_plano(self, tmp_path):
+        bundle = tmp_path / "regras.json"
+        _gravar(bundle, {"regra": "v1"})
+
+        with RepositorioDeRegras(str(bundle), intervalo=0.01) as repositorio:
+            _gravar(bundle, {"regra": "v2"})
+            limite = time.monotonic() + 5
+            while repositorio.atual.versao < 2 and time.monotonic() < limite:
+                time.sleep(0.01)
+
+            assert repositorio.regra("regra").evaluate() == "v2"
+
+    def test_leitores_nao_veem_versao_parcial(self, tmp_path):
+        bundle = tmp_path / "regras.json"
+        _gravar(bundle, {"a": 0, "b": 0})
+        repositorio = RepositorioDeRegras(str(bundle), intervalo=None)
+        inconsistentes = []
+        parar = threading.Event()
+
+        def ler():
+            while not parar.is_set():
+                conjunto = repositorio.atual
+                if conjunto["a"].evaluate() != conjunto["b"].evaluate():
+                    inconsistentes.append(conjunto.versao)
+
+        leitor = threading.Thread(target=ler)
+        leitor.start()
+        for valor in range(1, 20):
+            _gravar(bundle, {"a": valor, "b": valor})
+            repositorio.recarregar()
+        parar.set()
+        leitor.join()
+
+        assert inconsistentes == []
+        assert repositorio.atual["a"].evaluate() == 19
+
+    def test_motor_usa_as_regras_do_repositorio(self, tmp_path):
+        bundle = tmp_path / "regras.json"
+        regras = {f"validacao.{indice}": regra for indice, regra in enumerate(REGRAS_VALIDACAO)}
+        regras["processamento"] = REGRA_PROCESSAMENTO
+        _gravar(bundle, regras)
+        repositorio = RepositorioDeRegras(str(bundle), intervalo=None)
+        motor = MotorDeRegrasCustom(repositorio=repositorio)
+
+        assert motor.decidir(_solicitacao()).decisao == "APROVADO"
+        assert motor.decidir(_solicitacao(pontuacao_credito=None)).erro == "ERRO_SCORE_INVALIDO"
+
+        regras["processamento"] = "ANALISE_MANUAL"
+        regras["validacao.1"] = {"if": [{"<": [{"var": "idade"}, 21]}, "ERRO_IDADE", None]}
+        _gravar(bundle, regras)
+        repositorio.recarregar()
+
+        assert motor.decidir(_solicitacao()).decisao == "ANALISE_MANUAL"
+        assert motor.decidir(_solicitacao(idade=19)).erro == "ERRO_IDADE"
+
+    def test_versao_sem_regra_obrigatoria_mantem_a_atual(self, tmp_path):
+        (tmp_path / "validacao.0.json").write_text(json.dumps(REGRAS_VALIDACAO[0]), encoding="utf-8")
+        _gravar(tmp_path / "processamento.json", REGRA_PROCESSAMENTO)
+        repositorio = RepositorioDeRegras(str(tmp_path), intervalo=None)
+        motor = MotorDeRegrasCustom(repositorio=repositorio)
+
+        os.remove(tmp_path / "processamento.json")
+
+        assert not repositorio.recarregar()
+        assert repositorio.atual.versao == 1
+        assert isinstance(repositorio.ultimo_erro, ValueError)
+        assert motor.decidir(_solicitacao()).decisao == "APROVADO"
+
+    def test_motor_exige_a_regra_de_processamento(self, tmp_path):
+        bundle = tmp_path / "regras.json"
+        _gravar(bundle, {"validacao.0": REGRAS_VALIDACAO[0]})
+
+        with pytest.raises(ValueError, match="processamento"):
+            MotorDeRegrasCustom(repositorio=RepositorioDeRegras(str(bundle), intervalo=None))
+        with pytest.raises(ValueError, match="processamento"):
+            RepositorioDeRegras(str(bundle), intervalo=None, obrigatorias=("processamento",))
+
+    @pytest.mark.parametrize("assincrono", [False, True])
+    def test_recarga_durante_a_decisao_nao_mistura_versoes(self, tmp_path, assincrono):
+        bundle = tmp_path / "regras.json"
+        regras = {"validacao.0": {"if": [{"apply": ["recarregar"]}, "ERRO", None]}, "processamento": "APROVADO"}
+        _gravar(bundle, regras)
+        repositorio = RepositorioDeRegras(str(bundle), intervalo=None)
+
+        def recarregar():
+            # Uma nova versão é publicada entre a validação e o processamento
+            _gravar(bundle, {**regras, "processamento": "RECUSADO"})
+            repositorio.recarregar()
+            return None
+
+        if assincrono:
+            motor = MotorDeRegrasAsync(repositorio=repositorio, funcoes={"recarregar": recarregar})
+            resultado = asyncio.run(motor.decidir_async(_solicitacao()))
+        else:
+            motor = MotorDeRegrasCustom(repositorio=repositorio, funcoes={"recarregar": recarregar})
+            resultado = motor.decidir(_solicitacao())
+
+        assert resultado.decisao == "APROVADO"
+        assert repositorio.atual.versao == 2
@@ -0,0 +1,83 @@
+import threading
+
+import pytest
+
+from src.lib.rule_store import RuleStore, parse_ref, rule_hash
+
+
+class TestRuleStore:
+    """Testes para o registro versionado de regras compiladas."""
+
+    @pytest.mark.parametrize(
+        "ref, esperado",
+        [
+            ("idade", ("idade", None)),
+            ("idade@latest", ("idade", None)),
+            ("idade@3", ("idade", 3)),
+            ("regras@v2@1", ("regras@v2", 1)),
+        ],
+    )
+    def test_parse_ref(self, ref, esperado):
+        assert parse_ref(ref) == esperado
+
+    @pytest.mark.parametrize("ref", ["idade@", "idade@0", "idade@abc"])
+    def test_parse_ref_invalida(self, ref):
+        with pytest.raises(ValueError):
+            parse_ref(ref)
+
+    def test_versoes_por_conteudo(self):
+        store = RuleStore()
+
+        v1, criada_1 = store.put("idade", {">=": [{"var": "idade"}, 18]})
+        repetida, criada_2 = store.put("idade", {">=": [{"var": "idade"}, 18]})
+        v2, criada_3 = store.put("idade", {">=": [{"var": "idade"}, 21]})
+
+        assert (v1.ref, criada_1) == ("idade@1", True)
+        assert repetida is v1 and not criada_2
+        assert (v2.ref, criada_3) == ("idade@2", True)
+        assert store.get("idade@1").compiled.evaluate({"idade": 19}) is True
+        assert store.get("idade").compiled.evaluate({"idade": 19}) is False
+        assert [stored.version for stored in store.versions("idade")] == [1, 2]
+
+    def test_conteudo_igual_compartilha_a_regra_compilada(self):
+        store = RuleStore()
+
+        a, _ = store.put("a", {"==": [{"var": "x"}, 1]})
+        b, _ = store.put("b", {"==": [{"var": "x"}, 1]})
+
+        assert a.compiled is b.compiled
+        assert a.hash == rule_hash({"==": [{"var": "x"}, 1]})
+        assert store.stats() == {"rules": 2, "versions": 2, "compiled": 1}
+
+    def test_regra_ou_versao_inexistente(self):
+        store = RuleStore()
+        store.put("idade", True)
+
+        with pytest.raises(KeyError):
+            store.get("renda")
+        with pytest.raises(KeyError):
+            store.get("idade@2")
+
+    @pytest.mark.parametrize("rule_id", ["", None, "idade@1"])
+    def test_identificador_invalido(self, rule_id):
+        with pytest.raises(ValueError):
+            RuleStore().put(rule_id, True)
+
+    def test_regra_invalida_nao_cria_versao(self):
+        store = RuleStore()
+
+        with pytest.raises(RuntimeError):
+            store.put("idade", {"operacao_inexistente": [1]})
+
+        assert "idade" not in store
+
+    def test_registros_concorrentes_tem_versoes_unicas(self):
+        store = RuleStore()
+
+        threads = [threading.Thread(target=store.put, args=("regra", {"==": [indice, indice]})) for indice in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert [stored.version for stored in store.versions("regra")] == list(range(1, 21))
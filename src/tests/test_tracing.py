@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from src.lib.compiler import compile_logic
+from src.lib.tracing import Sampler, TraceBuffer, TraceEntry, explain, explain_async
+from src.regras import REGRA_PROCESSAMENTO
+
+
+class TestTraceBuffer:
+    """Testes para o buffer circular de trace."""
+
+    def test_mantem_as_entradas_mais_recentes(self):
+        buffer = TraceBuffer(capacity=3)
+        regra = compile_logic({"+": [1, 2, 3, 4]})
+
+        explain(regra, buffer=buffer)
+
+        # 4 literais + a operação, mas só cabem 3 entradas
+        assert len(buffer) == 3
+        assert buffer.dropped == 2
+        assert [entrada.value for entrada in buffer.entries()] == [3, 4, 10.0]
+
+    def test_clear_libera_valores(self):
+        buffer = TraceBuffer(capacity=4)
+        explain(compile_logic({"var": "x"}), {"x": [1, 2]}, buffer=buffer)
+
+        buffer.clear()
+
+        assert len(buffer) == 0
+        assert buffer.entries() == []
+        assert buffer._values == [None] * 4
+
+    def test_capacidade_invalida(self):
+        with pytest.raises(ValueError):
+            TraceBuffer(capacity=0)
+
+
+class TestExplain:
+    """Testes para o modo de explicação de regras compiladas."""
+
+    def test_mostra_o_ramo_avaliado(self):
+        regra = compile_logic(REGRA_PROCESSAMENTO)
+        dados = {"idade": 30, "possui_divida_ativa": True, "pontuacao_credito": 700, "renda_mensal": 3000}
+        buffer = TraceBuffer()
+
+        resultado = explain(regra, dados, buffer=buffer)
+
+        entradas = buffer.entries()
+        assert resultado == "ANALISE_MANUAL"
+        assert entradas[-1] == TraceEntry(0, "if", "ANALISE_MANUAL")
+        assert TraceEntry(2, "var idade", 30) in entradas
+        assert TraceEntry(1, "<", False) in entradas
+        assert TraceEntry(2, "var possui_divida_ativa", True) in entradas
+
+    def test_resultado_igual_ao_evaluate(self):
+        regra = compile_logic(
+            {"cat": [{"apply": ["nome", {"var": "id"}]}, "-", {"var": [{"var": "campo"}]}]}
+        )
+        funcoes = {"nome": lambda x: f"cliente{x}"}
+        dados = {"id": 7, "campo": "uf", "uf": "SP"}
+
+        assert explain(regra, dados, funcoes) == regra.evaluate(dados, funcoes) == "cliente7-SP"
+
+    @pytest.mark.asyncio
+    async def test_explain_async_aguarda_funcoes_assincronas(self):
+        async def consultar_score(cpf):
+            await asyncio.sleep(0)
+            return 720
+
+        regra = compile_logic({">": [{"apply": ["consultar_score", {"var": "cpf"}]}, 700]})
+        funcoes = {"consultar_score": consultar_score}
+        buffer = TraceBuffer()
+
+        resultado = await explain_async(regra, {"cpf": "123"}, funcoes, buffer=buffer)
+
+        assert resultado is await regra.evaluate_async({"cpf": "123"}, funcoes) is True
+        assert buffer.entries()[-2:] == [TraceEntry(1, "literal", 700), TraceEntry(0, ">", True)]
+        assert TraceEntry(1, "apply", 720) in buffer.entries()
+
+
+class TestSampler:
+    """Testes para a amostragem de 1 a cada N."""
+
+    def test_amostra_um_a_cada_n(self):
+        amostrador = Sampler(4)
+
+        amostras = [amostrador.should_sample() for _ in range(12)]
+
+        assert amostras.count(True) == 3
+        assert amostras[0] is True
+
+    def test_taxa_invalida(self):
+        with pytest.raises(ValueError):
+            Sampler(0)